@@ -15,8 +15,9 @@ from app.config import settings
 def set_cache_enabled(enabled: bool) -> None:
     """Toggle caching at runtime."""
 
-    global cache
+    global cache, cache_enabled
     settings.CACHE_ENABLED = enabled
+    cache_enabled = enabled
     if enabled:
         cache = RedisCache(settings.REDIS_URL)
         logging.info("Cache enabled.")
@@ -88,3 +89,6 @@ class RedisCache:
 
 
 cache = RedisCache(settings.REDIS_URL) if settings.CACHE_ENABLED else NullCache()
+# Plain module flag mirrored by ``set_cache_enabled`` so hot readers avoid the
+# settings object's attribute machinery.
+cache_enabled: bool = settings.CACHE_ENABLED
@@ -3,6 +3,7 @@
 import logging
 import sys
 import json
+from functools import lru_cache
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -58,10 +59,14 @@ class RequestIDLoggerAdapter(logging.LoggerAdapter):
         return msg, kwargs
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> RequestIDLoggerAdapter:
     """
     Get a logger with automatic request ID correlation.
 
+    Adapters are cached per name, so repeated calls share one instance and the
+    handler is attached only once.
+
     Args:
         name: Usually __name__ from the calling module
 
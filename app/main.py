@@ -21,19 +21,24 @@ from .routers import (
     rule_bundles,
 )
 from .logging import get_logger, RequestLoggingMiddleware
+from .services.mcp_log_queue import mcp_log_writer
+from .services.search_batcher import asset_search_batcher
 from .middleware.request_id import RequestIDMiddleware
-from .models.db import engine, SessionLocal
+from .models.db import engine, SessionLocal, warm_pool
 from . import models, utils
 from app.models.shader_lib import ShaderLib as ShaderLibModel
 from app.examples.loader import load_examples as load_shaderlib_examples
 from fastapi import FastAPI, Request, status, APIRouter, Header, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
+import copy
+import functools
+import hashlib
 import os
 import logging
+from pathlib import Path
 from typing import List, Optional, Tuple
 from app.env import load_env
 from .schema_version import SCHEMA_VERSION, check_schema_header
@@ -51,7 +56,12 @@ if not os.getenv("TESTING"):
     # Create tables
     models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(docs_url=None, redoc_url=None)  # Disable default docs
+
+# Route responses are encoded with orjson; handlers that build their own
+# response object (HTML docs, error handlers) are unaffected.
+app = FastAPI(
+    docs_url=None, redoc_url=None, default_response_class=ORJSONResponse
+)  # Disable default docs
 
 # Add request ID middleware (must be added before CORS)
 app.add_middleware(RequestIDMiddleware)
@@ -77,11 +87,29 @@ app.add_middleware(
 add_error_handlers(app)
 add_api_error_handlers(app)
 
-# Create a directory for static files if it doesn't exist
-os.makedirs("app/static", exist_ok=True)
+# Static docs assets are served from memory with a strong ETag instead of a
+# ``StaticFiles`` mount: there are only two small files, so they are read
+# once at import and revalidated with ``If-None-Match``.
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+
+def _add_static_route(filename: str, media_type: str) -> None:
+    body = (STATIC_DIR / filename).read_bytes()
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+
+    async def serve_static(request: Request) -> Response:
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(body, media_type=media_type, headers=headers)
+
+    app.add_api_route(
+        f"/static/{filename}", serve_static, methods=["GET"], include_in_schema=False
+    )
 
-# Mount the static directory
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+
+_add_static_route("favicon.png", "image/png")
+_add_static_route("swagger-ui-dark.css", "text/css")
 
 ## Patch storage disabled: no preview/apply endpoints in this repository
 
@@ -115,11 +143,18 @@ def load_example_shaderlib() -> None:
 
 # Custom OpenAPI schema generation
 
+# Generate the schema for ErrorResponse once at import. Pydantic v2 places
+# nested definitions under "$defs"; those are split out here so they can be
+# hoisted into the OpenAPI components section.
+_ERROR_SCHEMA = ErrorResponse.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_ERROR_DEFS = _ERROR_SCHEMA.pop("$defs", {})
 
-def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
 
+@functools.lru_cache(maxsize=1)
+def custom_openapi() -> dict:
+    """Build the OpenAPI document once; ``lru_cache`` serves repeat calls."""
     openapi_schema = get_openapi(
         title="SDFK Backend API",  # Title from your root endpoint or customize
         version="0.1.1",  # Customize version
@@ -134,21 +169,16 @@ def custom_openapi():
     if "schemas" not in openapi_schema["components"]:
         openapi_schema["components"]["schemas"] = {}
 
-    # Generate the schema for ErrorResponse using Pydantic v2. This schema
-    # includes any nested definitions under the "$defs" key. Those need to be
-    # hoisted into the OpenAPI components section so that ``$ref`` paths resolve
-    # correctly when rendered by Swagger UI or other tools.
+    # Hoist the precomputed ErrorResponse definitions into the components
+    # section so that ``$ref`` paths resolve. Copies keep the module-level
+    # constants pristine if the cache is cleared and the schema rebuilt.
+    for name, schema in _ERROR_DEFS.items():
+        openapi_schema["components"]["schemas"][name] = copy.deepcopy(schema)
 
-    error_schema = ErrorResponse.model_json_schema(
-        ref_template="#/components/schemas/{model}"
+    openapi_schema["components"]["schemas"]["ErrorResponse"] = copy.deepcopy(
+        _ERROR_SCHEMA
     )
 
-    defs = error_schema.pop("$defs", {})
-    for name, schema in defs.items():
-        openapi_schema["components"]["schemas"][name] = schema
-
-    openapi_schema["components"]["schemas"]["ErrorResponse"] = error_schema
-
     # Remove FastAPI's default validation error schemas which we don't use
     for unused in ("HTTPValidationError", "ValidationError"):
         openapi_schema["components"]["schemas"].pop(unused, None)
@@ -175,7 +205,7 @@ def custom_openapi():
                         }
 
     app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    return openapi_schema
 
 
 app.openapi = custom_openapi
@@ -382,6 +412,47 @@ for router, prefix, tags in ROUTER_METADATA:
     app.include_router(router, **kwargs)
 
 
+@app.on_event("startup")
+def warm_db_pool() -> None:
+    """Open the pooled database connections before the first request."""
+
+    try:
+        opened = warm_pool(engine)
+    except Exception as exc:
+        logger.warning("Could not warm the database pool: %s", exc)
+        return
+    if opened:
+        logger.info("Warmed %d database connections", opened)
+
+
+@app.on_event("startup")
+async def start_mcp_log_writer() -> None:
+    """Start the background task that batches MCP command log writes."""
+
+    mcp_log_writer.start()
+
+
+@app.on_event("shutdown")
+async def stop_mcp_log_writer() -> None:
+    """Flush queued MCP command logs before the loop goes away."""
+
+    await mcp_log_writer.stop()
+
+
+@app.on_event("startup")
+async def start_asset_search_batcher() -> None:
+    """Start the background task that micro-batches asset searches."""
+
+    asset_search_batcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_asset_search_batcher() -> None:
+    """Answer queued asset searches before the loop goes away."""
+
+    await asset_search_batcher.stop()
+
+
 @app.on_event("shutdown")
 async def close_cache_client() -> None:
     """Close the cache client if caching is enabled."""
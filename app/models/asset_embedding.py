@@ -17,7 +17,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.orm import Mapped, mapped_column
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, Vector
 
 from app.env import load_env
 from . import Base
@@ -34,12 +34,19 @@ class AssetEmbedding(Base):
     asset_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("synesthetic_assets.synesthetic_asset_id"),
-        index=True,
         nullable=False,
     )
     _dim_env = os.getenv("EMBEDDING_DIM")
     _dimension = int(_dim_env) if _dim_env else None
-    embedding: Mapped[List[float]] = mapped_column(Vector(_dimension), nullable=False)
+    # EMBEDDING_PRECISION=fp16 stores pgvector ``halfvec`` values, halving
+    # disk, index memory and scan bandwidth (PostgreSQL only). Existing
+    # tables are converted with:
+    #   ALTER TABLE asset_embeddings
+    #     ALTER COLUMN embedding TYPE halfvec(<dim>) USING embedding::halfvec(<dim>);
+    _half_precision = os.getenv("EMBEDDING_PRECISION") == "fp16"
+    embedding: Mapped[List[float]] = mapped_column(
+        (HALFVEC if _half_precision else Vector)(_dimension), nullable=False
+    )
     tags: Mapped[List[str]] = mapped_column(MutableList.as_mutable(JSON), default=list)
     structure: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     model_version: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -48,10 +55,23 @@ class AssetEmbedding(Base):
     )
 
 
+# Covers lookups by ``asset_id`` and "latest embeddings per asset" ordering.
+Index(
+    "ix_asset_embeddings_asset_created",
+    AssetEmbedding.asset_id,
+    AssetEmbedding.created_at,
+)
+
 if AssetEmbedding._dimension:
     Index(
         "ix_asset_embeddings_embedding_ivfflat",
         AssetEmbedding.embedding,
         postgresql_using="ivfflat",
-        postgresql_ops={"embedding": "vector_cosine_ops"},
+        postgresql_ops={
+            "embedding": (
+                "halfvec_cosine_ops"
+                if AssetEmbedding._half_precision
+                else "vector_cosine_ops"
+            )
+        },
     )
@@ -0,0 +1,21 @@
+"""Mixin providing batched ``INSERT`` for seeding and ingestion workflows."""
+
+from typing import Any, Iterable, Mapping
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+
+class BulkInsertMixin:
+    """Add a ``bulk_insert`` classmethod that bypasses the unit of work."""
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Insert ``rows`` with a single executemany-style statement.
+
+        Column defaults still apply, but ORM session events do not fire and no
+        instances are added to ``session``. The caller commits.
+        """
+        rows = list(rows)
+        if rows:
+            session.execute(insert(cls), rows)
@@ -1,11 +1,14 @@
 """Database engine setup with tiered fallback logic."""
 
 import os
+from contextlib import ExitStack
 from pathlib import Path
+import orjson
 import sqlalchemy as sa
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.env import load_env
 from app.logging import get_logger
@@ -15,12 +18,43 @@ logger = get_logger(__name__)
 load_env()
 
 
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with ``orjson`` instead of stdlib ``json``."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 def _create_engine(url: str):
-    """Create a SQLAlchemy engine with appropriate ``connect_args``."""
+    """Create a SQLAlchemy engine with appropriate ``connect_args``.
+
+    JSON columns are encoded and decoded with ``orjson`` for every model, so
+    row hydration of ``control_parameters``, MCP log payloads and similar
+    columns avoids the stdlib ``json`` cost. ``insertmanyvalues_page_size``
+    lets ``BulkInsertMixin.bulk_insert`` send up to 10k rows per statement.
+
+    On psycopg2, ``executemany_mode="values_plus_batch"`` keeps batched
+    ``INSERT ... VALUES`` for inserts and also sends executemany ``UPDATE`` and
+    ``DELETE`` statements through ``execute_batch`` in pages, rather than one
+    round trip per parameter set.
+    """
     connect_args = {}
+    engine_kwargs = {}
     if url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
-    return create_engine(url, connect_args=connect_args)
+    else:
+        # Drop connections the server or a proxy closed while idle instead of
+        # surfacing them as errors on the next request.
+        engine_kwargs["pool_pre_ping"] = True
+        engine_kwargs["pool_recycle"] = 3600
+    if sa.engine.make_url(url).get_driver_name() == "psycopg2":
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
+    return create_engine(
+        url,
+        connect_args=connect_args,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        insertmanyvalues_page_size=10_000,
+        **engine_kwargs,
+    )
 
 
 # 1. Use DATABASE_URL if provided
@@ -72,7 +106,29 @@ if engine.dialect.name == "postgresql":
         conn.commit()
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def warm_pool(target=None) -> int:
+    """Open every pooled connection once so early requests skip the connect.
+
+    The connections are held together, so the pool really grows to its full
+    size, then returned. Returns the number of connections opened.
+    """
+    target = target if target is not None else engine
+    if not isinstance(target.pool, QueuePool):
+        return 0
+    size = target.pool.size()
+    with ExitStack() as stack:
+        for _ in range(size):
+            stack.enter_context(target.connect()).execute(sa.select(1))
+    return size
+
+
+# Handlers format their response from the objects they just committed;
+# keeping those loaded avoids a re-SELECT per object after ``commit()``.
+# Server-generated values are still fetched on access, because SQLAlchemy
+# expires them at flush regardless of this setting.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base = declarative_base()
 
 
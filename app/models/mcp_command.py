@@ -5,7 +5,7 @@ SQLAlchemy model for recording MCP command invocations, providing an audit trail
 for debugging, analytics, and AI-agent transparency.
 """
 
-from sqlalchemy import Column, String, JSON, DateTime
+from sqlalchemy import Column, String, JSON, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -27,10 +27,8 @@ class MCPCommandLog(Base, SerializerMixin):
     timestamp = Column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True
     )
-    request_id = Column(String, nullable=False, index=True)
-    asset_id = Column(
-        String, nullable=True, index=True
-    )  # Optional - for asset-specific operations
+    request_id = Column(String, nullable=False)
+    asset_id = Column(String, nullable=True)  # Optional - for asset-specific operations
     command_type = Column(
         String, nullable=False, index=True
     )  # e.g. "create_asset", "update_param"
@@ -39,7 +37,7 @@ class MCPCommandLog(Base, SerializerMixin):
         JSON, nullable=True
     )  # Response result as JSON (null for pending/error)
     status = Column(
-        String, nullable=False, default="pending", index=True
+        String, nullable=False, default="pending"
     )  # "pending", "success", "error"
 
     id_field = "id"
@@ -50,3 +48,11 @@ class MCPCommandLog(Base, SerializerMixin):
         if data.get("timestamp"):
             data["timestamp"] = data["timestamp"].isoformat()
         return data
+
+
+# Composite indexes serve the "commands for X ordered by time" lookups in
+# ``app.services.mcp_logger`` with an ordered range scan and no sort step.
+# They also cover the single-column lookups on their leading column.
+Index("ix_mcp_cmd_req_ts", MCPCommandLog.request_id, MCPCommandLog.timestamp)
+Index("ix_mcp_cmd_asset_ts", MCPCommandLog.asset_id, MCPCommandLog.timestamp)
+Index("ix_mcp_cmd_status_ts", MCPCommandLog.status, MCPCommandLog.timestamp)
@@ -1,14 +1,26 @@
-"""Model for storing binary proto assets directly in the database."""
+"""Model for storing binary proto assets directly in the database.
+
+``proto_blob`` is deferred so queries that only need ``name`` or
+``description`` never pull the payload; use :meth:`ProtoAsset.load_blob`
+or ``undefer(ProtoAsset.proto_blob)`` when the bytes are required.
+"""
 
 from sqlalchemy import Column, Integer, String, LargeBinary, Text
+from sqlalchemy.orm import Session, deferred
 from . import Base
 from .timestamp_mixin import TimestampMixin
+from .bulk_insert_mixin import BulkInsertMixin
 
 
-class ProtoAsset(Base, TimestampMixin):
+class ProtoAsset(Base, TimestampMixin, BulkInsertMixin):
     __tablename__ = "proto_assets"
 
     proto_asset_id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    proto_blob = Column(LargeBinary, nullable=False)
+    proto_blob = deferred(Column(LargeBinary, nullable=False))
+
+    def load_blob(self, session: Session) -> bytes:
+        """Fetch ``proto_blob`` from the database and return it."""
+        session.refresh(self, attribute_names=["proto_blob"])
+        return self.proto_blob
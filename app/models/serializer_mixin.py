@@ -8,8 +8,19 @@ class SerializerMixin:
 
     id_field: str | None = None
 
+    @classmethod
+    def _column_keys(cls) -> tuple[str, ...]:
+        """Return the mapped column keys, inspecting the mapper only once."""
+        # Read from the class's own ``__dict__`` so subclasses never reuse a
+        # parent's cached keys.
+        keys = cls.__dict__.get("_column_keys_cache")
+        if keys is None:
+            keys = tuple(c.key for c in inspect(cls).column_attrs)
+            cls._column_keys_cache = keys
+        return keys
+
     def to_dict(self) -> dict:
-        data = {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
+        data = {key: getattr(self, key) for key in self._column_keys()}
         if self.id_field:
             data["id"] = getattr(self, self.id_field)
         return data
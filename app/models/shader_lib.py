@@ -4,9 +4,10 @@ from sqlalchemy import Column, Integer, String, JSON
 from . import Base
 from .timestamp_mixin import TimestampMixin
 from .serializer_mixin import SerializerMixin
+from .bulk_insert_mixin import BulkInsertMixin
 
 
-class ShaderLib(Base, TimestampMixin, SerializerMixin):
+class ShaderLib(Base, TimestampMixin, SerializerMixin, BulkInsertMixin):
     __tablename__ = "shader_libs"
 
     shaderlib_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -1,7 +1,26 @@
-"""Composite asset linking tones, shaders, controls, and other resources."""
+"""Composite asset linking tones, shaders, controls, and other resources.
+
+``SynestheticAsset.to_dict`` reads every component relationship. Queries
+whose results are serialized in bulk (e.g. prompt examples) must load them
+with ``component_load_options()`` to avoid one lazy SELECT per component.
+
+The serialized asset is also materialized in ``payload_json``: every ORM
+flush that touches an asset or one of its components recomputes the blob,
+so ``to_orjson_bytes`` can return it without walking the relationships.
+Core-level writes bypass this and leave the blob stale; set it to ``NULL``
+in that case to fall back to live serialization.
+
+The refresh runs per flush, not per commit: each flush costs one lookup of the
+assets referencing changed components, one load of those assets with their
+components, and one batched ``UPDATE``. Components inserted in a flush do not
+trigger it, so a nested create that flushes each new component and then the
+asset serializes the asset once. Code that flushes the same asset repeatedly
+within one transaction pays for every flush and should batch its changes.
+"""
 
 from typing import Any, Dict, List, Optional
 
+import orjson
 from sqlalchemy import (
     Integer,
     String,
@@ -9,14 +28,37 @@ from sqlalchemy import (
     JSON,
     ForeignKey,
     Boolean,
+    Index,
+    LargeBinary,
+    bindparam,
+    event,
+    inspect,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    attributes,
+    deferred,
+    mapped_column,
+    raiseload,
+    relationship,
+    selectinload,
+    undefer,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.ext.mutable import MutableList
 from . import Base
+from .bulk_insert_mixin import BulkInsertMixin
+from .control import Control
+from .haptic import Haptic
+from .modulation import Modulation
+from .shader import Shader
 from .timestamp_mixin import TimestampMixin
+from .tone import Tone
 
 
-class SynestheticAsset(Base, TimestampMixin):
+class SynestheticAsset(Base, TimestampMixin, BulkInsertMixin):
     __tablename__ = "synesthetic_assets"
 
     synesthetic_asset_id: Mapped[int] = mapped_column(
@@ -25,27 +67,39 @@ class SynestheticAsset(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     meta_info: Mapped[Dict[str, Any]] = mapped_column(JSON)
-    is_canonical: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
-    quality_tags: Mapped[List[str]] = mapped_column(
-        MutableList.as_mutable(JSON), default=list
+    is_canonical: Mapped[bool] = mapped_column(Boolean, default=False)
+    quality_tags: Mapped[List[str]] = mapped_column(JSON, default=list)
+    # Component FKs are indexed for the payload refresh, which looks up the
+    # assets referencing each changed component. Existing databases need
+    #   CREATE INDEX CONCURRENTLY ix_synesthetic_assets_<fk> ON synesthetic_assets (<fk>);
+    # for each of tone_id, control_id, shader_id, haptic_id and modulation_id.
+    tone_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("tones.tone_id"), index=True
     )
-    tone_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("tones.tone_id"))
     control_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("controls.control_id")
+        Integer, ForeignKey("controls.control_id"), index=True
     )
     shader_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("shaders.shader_id")
+        Integer, ForeignKey("shaders.shader_id"), index=True
     )
     haptic_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("haptics.haptic_id")
+        Integer, ForeignKey("haptics.haptic_id"), index=True
     )
     modulation_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("modulations.modulation_id")
+        Integer, ForeignKey("modulations.modulation_id"), index=True
     )
     rule_bundle_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("rule_bundles.id"), nullable=True
     )
 
+    # Materialized ``to_orjson_bytes`` output; see the module docstring.
+    # Existing tables gain the column with:
+    #   ALTER TABLE synesthetic_assets ADD COLUMN payload_json BYTEA;  -- BLOB on SQLite
+    # Rows left NULL fall back to live serialization until their next write.
+    payload_json: Mapped[Optional[bytes]] = deferred(
+        mapped_column(LargeBinary, nullable=True)
+    )
+
     tone = relationship("Tone")
     control = relationship("Control")
     shader = relationship("Shader")
@@ -59,14 +113,23 @@ class SynestheticAsset(Base, TimestampMixin):
         single_parent=True,
     )
 
-    def to_dict(self):
+    def to_dict(self, stringify_dates: bool = False):
+        """Return the asset with its components nested.
+
+        Timestamps stay ``datetime`` objects for orjson to encode natively;
+        pass ``stringify_dates=True`` for consumers that need ISO strings.
+        """
+        created_at, updated_at = self.created_at, self.updated_at
+        if stringify_dates:
+            created_at = created_at.isoformat() if created_at else None
+            updated_at = updated_at.isoformat() if updated_at else None
         result = {
             "synesthetic_asset_id": self.synesthetic_asset_id,
             "name": self.name,
             "description": self.description,
             "meta_info": self.meta_info,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
             "is_canonical": self.is_canonical,
             "quality_tags": self.quality_tags,
         }
@@ -87,3 +150,156 @@ class SynestheticAsset(Base, TimestampMixin):
             result["modulation"] = self.modulation.to_dict()
 
         return result
+
+    def to_orjson_bytes(self) -> bytes:
+        """Serialize :meth:`to_dict` to JSON bytes for a raw ``Response``.
+
+        Timestamps are left as ``datetime`` objects by ``to_dict`` and encoded
+        natively by orjson, bypassing FastAPI's ``jsonable_encoder`` walk.
+        The materialized ``payload_json`` is returned instead when it was
+        loaded with the row and nothing it covers has unflushed changes.
+        """
+        state = inspect(self)
+        payload = state.dict.get("payload_json")
+        if payload is not None and not state.modified:
+            components = (
+                state.dict.get(name) for name in _COMPONENT_RELATIONSHIPS.values()
+            )
+            if not any(c is not None and inspect(c).modified for c in components):
+                return payload
+        return self._dump_payload()
+
+    def _dump_payload(self) -> bytes:
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_NAIVE_UTC)
+
+
+# Canonical-asset listings filter on ``is_canonical`` and order by recency;
+# the composite index serves them with an ordered range scan and also covers
+# plain ``is_canonical`` lookups. Postgres carries ``quality_tags`` in the
+# leaf pages so tag filtering needs no heap fetch.
+Index(
+    "ix_synesthetic_asset_canonical_updated",
+    SynestheticAsset.is_canonical,
+    SynestheticAsset.updated_at.desc(),
+    postgresql_include=["quality_tags"],
+)
+
+# The asset list pages by primary key and reads the component ids of each row.
+# On Postgres the included columns let that scan skip the heap (and the TOASTed
+# ``meta_info``/``payload_json``) whenever the JSON columns are not selected.
+# There is no migration history; existing databases need
+#   CREATE INDEX CONCURRENTLY ix_synesthetic_assets_list
+#   ON synesthetic_assets (synesthetic_asset_id)
+#   INCLUDE (name, shader_id, control_id, tone_id, haptic_id, modulation_id);
+Index(
+    "ix_synesthetic_assets_list",
+    SynestheticAsset.synesthetic_asset_id,
+    postgresql_include=[
+        "name",
+        "shader_id",
+        "control_id",
+        "tone_id",
+        "haptic_id",
+        "modulation_id",
+    ],
+)
+
+
+def component_load_options() -> tuple:
+    """Loader options preloading every component read by ``to_dict``.
+
+    Components are fetched in batched SELECTs and any other lazy load raises,
+    so N+1 regressions fail loudly. Built on demand because the related
+    mappers are not configured until every model module is imported.
+    """
+    return (
+        selectinload(SynestheticAsset.tone),
+        selectinload(SynestheticAsset.control),
+        selectinload(SynestheticAsset.shader),
+        selectinload(SynestheticAsset.haptic),
+        selectinload(SynestheticAsset.modulation),
+        undefer(SynestheticAsset.payload_json),
+        raiseload("*"),
+    )
+
+
+# Component model -> relationship name on the asset. Each component's
+# ``id_field`` doubles as the foreign key column name on the asset.
+_COMPONENT_RELATIONSHIPS = {
+    Tone: "tone",
+    Control: "control",
+    Shader: "shader",
+    Haptic: "haptic",
+    Modulation: "modulation",
+}
+_PENDING_PAYLOADS = "synesthetic_asset_payloads"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_payloads(session: Session, flush_context) -> None:
+    asset_ids: set[int] = set()
+    components: list[tuple[str, int]] = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, SynestheticAsset):
+            if obj not in session.deleted:
+                asset_ids.add(obj.synesthetic_asset_id)
+        elif type(obj) in _COMPONENT_RELATIONSHIPS and obj not in session.new:
+            # A component inserted in this flush can only be referenced by
+            # assets that are themselves new or dirty, hence already listed.
+            components.append((obj.id_field, getattr(obj, obj.id_field)))
+    if asset_ids or components:
+        pending = session.info.setdefault(_PENDING_PAYLOADS, (set(), []))
+        pending[0].update(asset_ids)
+        pending[1].extend(components)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _refresh_payloads(session: Session, flush_context) -> None:
+    pending = session.info.pop(_PENDING_PAYLOADS, None)
+    if pending is None:
+        return
+    asset_ids, components = pending
+    table = SynestheticAsset.__table__
+    conn = session.connection()
+    if components:
+        by_fk: dict[str, set[int]] = {}
+        for fk_name, component_id in components:
+            by_fk.setdefault(fk_name, set()).add(component_id)
+        # One indexed lookup for every changed component, whatever its kind.
+        asset_ids.update(
+            conn.execute(
+                select(table.c.synesthetic_asset_id).where(
+                    or_(*(table.c[fk].in_(ids) for fk, ids in by_fk.items()))
+                )
+            ).scalars()
+        )
+    if not asset_ids:
+        return
+
+    # Serialize from a separate session on the same connection so the
+    # caller's identity map is left untouched.
+    with Session(bind=conn) as snapshot:
+        assets = snapshot.scalars(
+            select(SynestheticAsset)
+            .options(*component_load_options())
+            .where(SynestheticAsset.synesthetic_asset_id.in_(asset_ids))
+        )
+        rows = [
+            {"asset_id": asset.synesthetic_asset_id, "payload": asset._dump_payload()}
+            for asset in assets
+        ]
+    if not rows:
+        return
+    # Assigning updated_at to itself suppresses its onupdate hook.
+    stmt = (
+        update(table)
+        .where(table.c.synesthetic_asset_id == bindparam("asset_id"))
+        .values(payload_json=bindparam("payload"), updated_at=table.c.updated_at)
+    )
+    conn.execute(stmt, rows)
+    for row in rows:
+        live = session.identity_map.get(
+            session.identity_key(SynestheticAsset, row["asset_id"])
+        )
+        if live is not None:
+            attributes.set_committed_value(live, "payload_json", row["payload"])
@@ -3,22 +3,20 @@
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import Integer, String, Text, JSON
-from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column
 
 from . import Base
+from .bulk_insert_mixin import BulkInsertMixin
 from .serializer_mixin import SerializerMixin
 
 
-class Tone(Base, SerializerMixin):
+class Tone(Base, SerializerMixin, BulkInsertMixin):
     __tablename__ = "tones"
 
     tone_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
-    synth: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        MutableDict.as_mutable(JSON), nullable=True
-    )
+    synth: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     input_parameters: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
         JSON, nullable=True
     )
@@ -27,8 +25,6 @@ class Tone(Base, SerializerMixin):
         JSON, nullable=True
     )
     parts: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSON, nullable=True)
-    meta_info: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        MutableDict.as_mutable(JSON), nullable=True
-    )
+    meta_info: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
 
     id_field = "tone_id"
@@ -1,43 +1,238 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import atexit
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, BinaryIO, Type
 
+import orjson
+
+from ..logging import get_logger
 from .base import PatchStorageBackend
 
+logger = get_logger(__name__)
+
+
+# Weak, so registering for the exit hook does not keep an instance alive.
+_open_storages: weakref.WeakSet[JsonLinesPatchStorage] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_storages() -> None:
+    for storage in list(_open_storages):
+        try:
+            storage.close()
+        except OSError:
+            logger.error("Failed to flush patch storage at exit", exc_info=True)
+
 
 class JsonLinesPatchStorage(PatchStorageBackend):
-    """Append patches to JSONL files under a date-based directory."""
+    """Append patches to JSONL files under a date-based directory.
+
+    Every ``put`` also appends ``patch_id -> (file, offset, length)`` to an
+    ``index.jsonl`` sidecar so ``get`` can read a single record directly
+    instead of scanning every stored file.
 
-    def __init__(self, base_dir: str | Path = "bronze/patches") -> None:
+    With ``buffer_limit`` > 0, records are queued in memory and written in
+    one ``write`` per file once the limit is reached, on ``flush`` or on
+    ``close``. Buffered records remain visible to ``get``.
+
+    Append handles for the most recently written files (including the
+    sidecar) stay open in a small LRU, so steady-state writes skip the
+    ``open``/``close`` syscalls. Call ``close`` to release them; instances
+    still alive at interpreter exit are closed by an ``atexit`` hook, so
+    buffered records are not lost when ``close`` is never reached.
+    """
+
+    INDEX_FILE = "index.jsonl"
+    MAX_OPEN_FILES = 16
+
+    def __init__(
+        self, base_dir: str | Path = "bronze/patches", buffer_limit: int = 0
+    ) -> None:
         self.base_dir = Path(base_dir)
+        self.buffer_limit = buffer_limit
+        self._index: dict[str, tuple[str, int, int]] | None = None
+        self._buffer: dict[Path, list[tuple[str, bytes]]] = {}
+        self._buffered = 0
+        self._lock = threading.Lock()
+        # Today's directory and per-component (file, uri) targets, so the
+        # mkdir/resolve syscalls only run when the UTC date rolls over.
+        self._current_date: date | None = None
+        self._targets: dict[str, tuple[Path, str]] = {}
+        self._handles: OrderedDict[Path, BinaryIO] = OrderedDict()
+        _open_storages.add(self)
 
     def put(self, patch_id: str, component_type: str, patch: dict[str, Any]) -> str:
-        date_dir = self.base_dir / f"dt={datetime.utcnow().date()}"
-        date_dir.mkdir(parents=True, exist_ok=True)
-        file_path = date_dir / f"component={component_type}.jsonl"
+        file_path, uri = self._target(component_type)
         record = {
             "patch_id": patch_id,
             "component_type": component_type,
             "patch": patch,
         }
-        with file_path.open("a", encoding="utf-8") as f:
-            json.dump(record, f)
-            f.write("\n")
-        return file_path.resolve().as_uri()
+        line = orjson.dumps(record)
+        if self.buffer_limit > 0:
+            with self._lock:
+                self._buffer.setdefault(file_path, []).append((patch_id, line))
+                self._buffered += 1
+                if self._buffered >= self.buffer_limit:
+                    self._flush_locked(sync=False)
+        else:
+            with self._lock:
+                self._write_batch(file_path, [(patch_id, line)])
+        return uri
 
     def get(self, patch_id: str) -> dict[str, Any]:
+        if self._buffered:
+            self.flush()
         if not self.base_dir.exists():
             raise KeyError(patch_id)
+        entry = self._load_index().get(patch_id)
+        if entry is not None:
+            record = self._read_at(*entry)
+            if record is not None and record.get("patch_id") == patch_id:
+                return record["patch"]
+        # Records written before the sidecar existed (or by another process)
+        # are only reachable by scanning. Lines that do not even contain the
+        # JSON-encoded id are skipped without parsing; the bare quoted value
+        # also matches records written by stdlib ``json`` (``": "``).
+        needle = orjson.dumps(patch_id)
         for file in self.base_dir.rglob("component=*.jsonl"):
-            with file.open("r", encoding="utf-8") as f:
+            with file.open("rb") as f:
                 for line in f:
+                    if needle not in line:
+                        continue
                     try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
                         continue
                     if record.get("patch_id") == patch_id:
                         return record["patch"]
         raise KeyError(patch_id)
+
+    def flush(self) -> None:
+        """Write all buffered records and ``fsync`` each touched file once."""
+
+        with self._lock:
+            self._flush_locked(sync=True)
+
+    def close(self) -> None:
+        """Flush any buffered records and close cached file handles."""
+
+        with self._lock:
+            self._flush_locked(sync=True)
+            while self._handles:
+                self._handles.popitem()[1].close()
+
+    def __enter__(self) -> "JsonLinesPatchStorage":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _target(self, component_type: str) -> tuple[Path, str]:
+        today = datetime.now(timezone.utc).date()
+        if today != self._current_date:
+            (self.base_dir / f"dt={today}").mkdir(parents=True, exist_ok=True)
+            self._current_date = today
+            self._targets = {}
+        target = self._targets.get(component_type)
+        if target is None:
+            file_path = (
+                self.base_dir / f"dt={today}" / f"component={component_type}.jsonl"
+            )
+            target = (file_path, file_path.resolve().as_uri())
+            self._targets[component_type] = target
+        return target
+
+    def _flush_locked(self, sync: bool) -> None:
+        buffer, self._buffer, self._buffered = self._buffer, {}, 0
+        for file_path, records in buffer.items():
+            self._write_batch(file_path, records, sync=sync)
+
+    def _handle(self, file_path: Path) -> BinaryIO:
+        handle = self._handles.get(file_path)
+        if handle is None:
+            # Unbuffered: every batch is already joined into one blob, so a
+            # BufferedWriter would only add a copy before the same write(2).
+            handle = file_path.open("ab", buffering=0)
+            self._handles[file_path] = handle
+            if len(self._handles) > self.MAX_OPEN_FILES:
+                self._handles.popitem(last=False)[1].close()
+        else:
+            self._handles.move_to_end(file_path)
+        return handle
+
+    def _write_batch(
+        self, file_path: Path, records: list[tuple[str, bytes]], sync: bool = False
+    ) -> None:
+        file = file_path.relative_to(self.base_dir).as_posix()
+        f = self._handle(file_path)
+        # Seek rather than trust the cached position: another writer may have
+        # appended since our last write.
+        offset = f.seek(0, os.SEEK_END)
+        entries = []
+        for patch_id, line in records:
+            entries.append((patch_id, file, offset, len(line)))
+            offset += len(line) + 1
+        self._write_all(f, b"\n".join(line for _, line in records) + b"\n")
+        if sync:
+            os.fsync(f.fileno())
+        self._append_index(entries)
+
+    @staticmethod
+    def _write_all(f: BinaryIO, data: bytes) -> None:
+        """Write ``data`` with a single ``write(2)``, retrying short writes."""
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view) :]
+
+    def _append_index(self, entries: list[tuple[str, str, int, int]]) -> None:
+        lines = [
+            orjson.dumps(
+                {"patch_id": patch_id, "file": file, "offset": offset, "length": length}
+            )
+            + b"\n"
+            for patch_id, file, offset, length in entries
+        ]
+        self._write_all(self._handle(self.base_dir / self.INDEX_FILE), b"".join(lines))
+        if self._index is not None:
+            for patch_id, file, offset, length in entries:
+                self._index[patch_id] = (file, offset, length)
+
+    def _load_index(self) -> dict[str, tuple[str, int, int]]:
+        if self._index is None:
+            index: dict[str, tuple[str, int, int]] = {}
+            index_path = self.base_dir / self.INDEX_FILE
+            if index_path.exists():
+                with index_path.open("rb") as f:
+                    for line in f:
+                        try:
+                            entry = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
+                        index[entry["patch_id"]] = (
+                            entry["file"],
+                            entry["offset"],
+                            entry["length"],
+                        )
+            self._index = index
+        return self._index
+
+    def _read_at(self, file: str, offset: int, length: int) -> dict[str, Any] | None:
+        try:
+            with (self.base_dir / file).open("rb") as f:
+                f.seek(offset)
+                return orjson.loads(f.read(length))
+        except (OSError, orjson.JSONDecodeError):
+            return None
@@ -1,30 +1,63 @@
 from __future__ import annotations
 
+import bisect
 import time
-from collections import OrderedDict
 from typing import Any
 
 from .base import PatchStorageBackend
 
 
 class InMemoryRingBufferStorage(PatchStorageBackend):
-    """Time-limited in-memory storage for recent patches."""
+    """Time-limited in-memory storage for recent patches.
+
+    Patches live in a flat dict; a sorted list of ``(expiry, patch_id)`` drives
+    expiry and overflow eviction, so the nearest-expiring patch always goes
+    first. With a fixed TTL new entries land at the end of the list, and
+    expired ones are dropped from the front with a single slice delete.
+    Entries left behind by re-``put`` patches are skipped when they surface.
+    """
 
     def __init__(self, ttl_seconds: float = 3600, max_items: int = 1000) -> None:
         self.ttl_seconds = ttl_seconds
         self.max_items = max_items
-        self._data: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._data: dict[str, tuple[dict[str, Any], float]] = {}
+        self._expiry_sorted: list[tuple[float, str]] = []
+
+    def _is_live(self, expiry: float, patch_id: str) -> bool:
+        entry = self._data.get(patch_id)
+        return entry is not None and entry[1] == expiry
 
     def _cleanup(self) -> None:
-        now = time.time()
-        while self._data and next(iter(self._data.values()))[1] < now:
-            self._data.popitem(last=False)
+        expiries = self._expiry_sorted
+        idx = bisect.bisect_left(expiries, (time.monotonic(), ""))
+        if not idx:
+            return
+        for expiry, patch_id in expiries[:idx]:
+            if self._is_live(expiry, patch_id):
+                del self._data[patch_id]
+        del expiries[:idx]
+
+    def _evict_one(self) -> None:
+        expiries = self._expiry_sorted
+        for idx, (expiry, patch_id) in enumerate(expiries):
+            if self._is_live(expiry, patch_id):
+                del self._data[patch_id]
+                del expiries[: idx + 1]
+                return
+        expiries.clear()
 
     def put(self, patch_id: str, component_type: str, patch: dict[str, Any]) -> str:
         self._cleanup()
-        if len(self._data) >= self.max_items:
-            self._data.popitem(last=False)
-        self._data[patch_id] = (patch, time.time() + self.ttl_seconds)
+        if patch_id not in self._data and len(self._data) >= self.max_items:
+            self._evict_one()
+        expiry = time.monotonic() + self.ttl_seconds
+        self._data[patch_id] = (patch, expiry)
+        bisect.insort(self._expiry_sorted, (expiry, patch_id))
+        if len(self._expiry_sorted) > 2 * self.max_items:
+            # Drop stale entries from overwritten patches.
+            self._expiry_sorted = sorted(
+                (exp, pid) for pid, (_, exp) in self._data.items()
+            )
         return f"memory://{patch_id}"
 
     def get(self, patch_id: str) -> dict[str, Any]:
@@ -33,7 +66,7 @@ class InMemoryRingBufferStorage(PatchStorageBackend):
         if patch_tuple is None:
             raise KeyError(patch_id)
         patch, expiry = patch_tuple
-        if expiry < time.time():
+        if expiry < time.monotonic():
             self._data.pop(patch_id, None)
             raise KeyError(patch_id)
         return patch
@@ -1,13 +1,30 @@
 """Prompt template helpers for language model integration."""
 
-from .asset_generation import build_asset_prompt
-from .asset_patch import build_asset_patch_prompt
-from .shader_prompt import build_shader_prompt
-from .tone_prompt import build_tone_prompt
+from .asset_generation import build_asset_prompt, build_asset_prompt_bytes
+from .asset_patch import build_asset_patch_prompt, build_asset_patch_prompt_from_bytes
+from .shader_prompt import (
+    count_shader_prompt_tokens,
+    build_shader_messages,
+    build_shader_prompt,
+    build_shader_prompt_bytes,
+    build_shader_prompt_cached,
+    register_shader_prompt_cache,
+)
+from .tone_prompt import (
+    build_tone_prompt,
+    build_tone_prompt_bytes,
+    build_tone_prompt_tokens,
+)
 from .haptic_prompt import build_haptic_prompt
 from .control_prompt import build_control_prompt
 from .modulation_prompt import build_modulation_prompt
-from .synesthetic_asset_prompt import build_synesthetic_asset_prompt
+from .synesthetic_asset_prompt import (
+    build_synesthetic_asset_messages,
+    build_synesthetic_asset_prompt,
+    build_synesthetic_asset_prompt_bytes,
+    build_synesthetic_asset_prompt_cached,
+    register_synesthetic_asset_prompt_cache,
+)
 from .component_patch import (
     build_control_patch_prompt,
     build_haptic_patch_prompt,
@@ -18,13 +35,26 @@ from .component_patch import (
 
 __all__ = [
     "build_asset_prompt",
+    "build_asset_prompt_bytes",
     "build_asset_patch_prompt",
+    "build_asset_patch_prompt_from_bytes",
     "build_shader_prompt",
+    "build_shader_prompt_bytes",
+    "build_shader_messages",
+    "build_shader_prompt_cached",
+    "register_shader_prompt_cache",
+    "count_shader_prompt_tokens",
     "build_tone_prompt",
+    "build_tone_prompt_bytes",
+    "build_tone_prompt_tokens",
     "build_haptic_prompt",
     "build_control_prompt",
     "build_modulation_prompt",
     "build_synesthetic_asset_prompt",
+    "build_synesthetic_asset_prompt_bytes",
+    "build_synesthetic_asset_messages",
+    "build_synesthetic_asset_prompt_cached",
+    "register_synesthetic_asset_prompt_cache",
     "build_tone_patch_prompt",
     "build_haptic_patch_prompt",
     "build_control_patch_prompt",
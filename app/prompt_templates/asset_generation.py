@@ -1,5 +1,4 @@
 from typing import List, Optional, Tuple
-import json
 from app.models import SynestheticAsset
 
 ASSET_GENERATION_SYSTEM_PROMPT = (
@@ -9,13 +8,13 @@ ASSET_GENERATION_SYSTEM_PROMPT = (
     "Use canonical Tone.js structure for the tone object. Do not include any "
     "explanations, markdown, or code fences."
 )
+_SYSTEM_BYTES = ASSET_GENERATION_SYSTEM_PROMPT.encode("utf-8")
 
 
 def asset_to_prompt_block(asset: SynestheticAsset) -> str:
     """Serialize ``asset`` to a JSON string for prompt examples."""
 
-    data = asset.to_dict()
-    return json.dumps(data, ensure_ascii=False)
+    return asset.to_orjson_bytes().decode("utf-8")
 
 
 def build_asset_prompt(
@@ -26,13 +25,13 @@ def build_asset_prompt(
 ) -> Tuple[str, str]:
     """Construct a system and user prompt with retrieved examples prepended."""
 
-    examples = []
-    for asset in retrieved or []:
-        examples.append(asset_to_prompt_block(asset))
+    # Join the encoded examples as bytes and decode once, instead of decoding
+    # and joining one string per asset.
+    examples = b"\n".join(asset.to_orjson_bytes() for asset in retrieved or [])
 
     user_parts = []
     if examples:
-        user_parts.append("\n".join(examples))
+        user_parts.append(examples.decode("utf-8"))
     user_parts.append(prompt)
     if tags:
         user_parts.append("Tags: " + ", ".join(tags))
@@ -40,3 +39,20 @@ def build_asset_prompt(
         user_parts.append(f"Complexity: {complexity}")
     user_prompt = "\n".join(user_parts)
     return ASSET_GENERATION_SYSTEM_PROMPT, user_prompt
+
+
+def build_asset_prompt_bytes(
+    prompt: str,
+    retrieved: List[SynestheticAsset] | None = None,
+    tags: Optional[List[str]] = None,
+    complexity: Optional[str] = None,
+) -> Tuple[bytes, bytes]:
+    """UTF-8 encoded variant of :func:`build_asset_prompt` for HTTP transport."""
+
+    user_parts = [asset.to_orjson_bytes() for asset in retrieved or []]
+    user_parts.append(prompt.encode("utf-8"))
+    if tags:
+        user_parts.append(("Tags: " + ", ".join(tags)).encode("utf-8"))
+    if complexity:
+        user_parts.append(f"Complexity: {complexity}".encode("utf-8"))
+    return _SYSTEM_BYTES, b"\n".join(user_parts)
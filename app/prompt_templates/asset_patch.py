@@ -1,8 +1,9 @@
 """Prompt builder for Gemini JSON patch generation."""
 
-import json
 from typing import Dict
 
+import orjson
+
 CANONICAL_PATCH_PROMPT = (
     "You are a JSON editing assistant. Given the current asset and the user request, "
     "respond ONLY with a JSON object of the form:\n"
@@ -24,5 +25,18 @@ CANONICAL_PATCH_PROMPT = (
 
 def build_asset_patch_prompt(asset: Dict, user_prompt: str) -> str:
     """Fill the canonical patch prompt template with the asset and user text."""
-    asset_json = json.dumps(asset, indent=2)
-    return CANONICAL_PATCH_PROMPT.format(asset_json=asset_json, user_prompt=user_prompt)
+    asset_json = orjson.dumps(
+        asset, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    )
+    return build_asset_patch_prompt_from_bytes(asset_json, user_prompt)
+
+
+def build_asset_patch_prompt_from_bytes(asset_json: bytes, user_prompt: str) -> str:
+    """Fill the patch prompt with an asset already serialized to JSON bytes.
+
+    Edit loops that patch the same asset repeatedly can serialize it once and
+    reuse the bytes for every prompt.
+    """
+    return CANONICAL_PATCH_PROMPT.format(
+        asset_json=asset_json.decode("utf-8"), user_prompt=user_prompt
+    )
@@ -0,0 +1,52 @@
+"""Import-time whitespace compaction for large static prompts."""
+
+import json
+import re
+from typing import Any, Iterator, Tuple
+
+_DECODER = json.JSONDecoder()
+_TRAILING_SPACE = re.compile(r"[ \t]+\n")
+_INNER_SPACE_RUN = re.compile(r"(?<=\S) {2,}")
+_BLANK_LINE_RUN = re.compile(r"\n{3,}")
+
+
+def iter_json_blocks(text: str) -> Iterator[Tuple[int, int, Any]]:
+    """Yield ``(start, end, value)`` for each embedded JSON object in ``text``.
+
+    Brace-delimited regions that are not valid JSON (GLSL snippets, schema
+    sketches with placeholders) are skipped.
+    """
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            value, end = _DECODER.raw_decode(text, pos)
+        except ValueError:
+            pos = text.find("{", pos + 1)
+            continue
+        yield pos, end, value
+        pos = text.find("{", end)
+
+
+def _compact_prose(text: str) -> str:
+    text = _TRAILING_SPACE.sub("\n", text)
+    text = _INNER_SPACE_RUN.sub(" ", text)
+    return _BLANK_LINE_RUN.sub("\n\n", text)
+
+
+def compact_prompt(text: str) -> str:
+    """Return ``text`` with redundant whitespace removed.
+
+    Embedded JSON examples are re-serialized without insignificant whitespace
+    (string values, including GLSL source, are untouched). Elsewhere,
+    trailing spaces and intra-line space runs are dropped and blank-line runs
+    collapse to one; leading indentation is kept so outlines and schema
+    sketches stay readable.
+    """
+    parts = []
+    last = 0
+    for start, end, value in iter_json_blocks(text):
+        parts.append(_compact_prose(text[last:start]))
+        parts.append(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+        last = end
+    parts.append(_compact_prose(text[last:]))
+    return "".join(parts)
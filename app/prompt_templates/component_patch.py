@@ -2,25 +2,30 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import textwrap
 from typing import Any, Dict
 
+import orjson
+
 from .tone_prompt import CANONICAL_TONEJS_SYSTEM_PROMPT
 from .haptic_prompt import CANONICAL_HAPTIC_PROMPT
 from .control_prompt import CANONICAL_CONTROL_PROMPT
 from .modulation_prompt import CANONICAL_MODULATION_PROMPT
-from .shader_prompt import CANONICAL_SHADER_PROMPT
+from .shader_prompt import canonical_shader_prompt
+
+
+_BRACE_TABLE = str.maketrans({"{": "{{", "}": "}}"})
 
 
 def _escape(text: str) -> str:
     """Escape braces for ``str.format`` usage."""
-    return text.replace("{", "{{").replace("}", "}}")
+    return text.translate(_BRACE_TABLE)
 
 
-def _build_patch_prompt(rules: str, asset: Dict[str, Any], user_prompt: str) -> str:
-    """Return a generic patch prompt using ``rules`` as DSL guidance."""
-    template = textwrap.dedent(
+def _make_template(rules: str) -> str:
+    """Return the ``str.format`` template embedding ``rules`` as DSL guidance."""
+    return textwrap.dedent(
         f"""
         You are a JSON editing assistant updating a component definition.
         Use JSON Patch operations so the final object follows the canonical DSL rules below.
@@ -42,7 +47,39 @@ def _build_patch_prompt(rules: str, asset: Dict[str, Any], user_prompt: str) ->
         {{user_prompt}}
         """
     )
-    asset_json = json.dumps(asset, indent=2)
+
+
+# Templates for the canonical rule sets are built once at import so a patch
+# prompt build is a single ``str.format`` call.
+_TEMPLATES_BY_RULES: Dict[str, str] = {
+    rules: _make_template(rules)
+    for rules in (
+        CANONICAL_TONEJS_SYSTEM_PROMPT,
+        CANONICAL_HAPTIC_PROMPT,
+        CANONICAL_CONTROL_PROMPT,
+        CANONICAL_MODULATION_PROMPT,
+    )
+}
+
+
+# The shader rules are loaded lazily, so their template is built on first use.
+@functools.cache
+def _shader_template() -> str:
+    return _make_template(canonical_shader_prompt())
+
+
+def _build_patch_prompt(rules: str, asset: Dict[str, Any], user_prompt: str) -> str:
+    """Return a generic patch prompt using ``rules`` as DSL guidance."""
+    template = _TEMPLATES_BY_RULES.get(rules)
+    if template is None:
+        template = _make_template(rules)
+    return _render(template, asset, user_prompt)
+
+
+def _render(template: str, asset: Dict[str, Any], user_prompt: str) -> str:
+    asset_json = orjson.dumps(
+        asset, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode("utf-8")
     return template.format(asset_json=asset_json, user_prompt=user_prompt)
 
 
@@ -68,7 +105,7 @@ def build_modulation_patch_prompt(asset: Dict[str, Any], user_prompt: str) -> st
 
 def build_shader_patch_prompt(asset: Dict[str, Any], user_prompt: str) -> str:
     """Return the shader patch prompt."""
-    return _build_patch_prompt(CANONICAL_SHADER_PROMPT, asset, user_prompt)
+    return _render(_shader_template(), asset, user_prompt)
 
 
 __all__ = [
@@ -0,0 +1,63 @@
+"""Helpers for serving static prompt prefixes from provider-side caches."""
+
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Tuple
+
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+# (key, model) -> (handle name, monotonic deadline after which it is re-created)
+_cached_content_names: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_cached_content_lock = threading.Lock()
+
+# Handles are replaced this long before the provider expires them, so a
+# request never goes out with a name that lapses in flight.
+_EXPIRY_MARGIN = timedelta(minutes=1)
+
+
+def cacheable_messages(system_text: str, user_text: str) -> List[Dict[str, Any]]:
+    """Return a system/user message pair with ``system_text`` cache-tagged.
+
+    The system block carries an Anthropic-style ``cache_control`` breakpoint;
+    providers with automatic prefix caching (OpenAI) hit as long as
+    ``system_text`` is byte-identical between calls, so callers must pass the
+    canonical constant unmodified and keep per-request text in ``user_text``.
+    """
+    return [
+        {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": system_text,
+                    "cache_control": dict(EPHEMERAL_CACHE_CONTROL),
+                }
+            ],
+        },
+        {"role": "user", "content": [{"type": "text", "text": user_text}]},
+    ]
+
+
+def register_cached_content(
+    key: str, model: str, system_text: str, ttl: timedelta = timedelta(hours=1)
+) -> str:
+    """Register ``system_text`` as Gemini cached content and return its name.
+
+    The handle is created with ``google.generativeai``'s
+    ``caching.CachedContent.create`` and remembered per ``(key, model)`` until
+    ``ttl`` is about to run out; later calls only send the name (as
+    ``cached_content=``) alongside the dynamic prompt.
+    """
+    from google.generativeai import caching
+
+    with _cached_content_lock:
+        entry = _cached_content_names.get((key, model))
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        cache = caching.CachedContent.create(
+            model, system_instruction=system_text, ttl=ttl
+        )
+        deadline = time.monotonic() + (ttl - _EXPIRY_MARGIN).total_seconds()
+        _cached_content_names[(key, model)] = (cache.name, deadline)
+        return cache.name
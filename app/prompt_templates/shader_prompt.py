@@ -2,253 +2,611 @@
 
 # flake8: noqa: E501
 
-CANONICAL_SHADER_PROMPT = """
-You are an expert shader designer working on a synesthetic creative system.
-
-Respond ONLY with formatted JSON matching this structure:
-{
-  "name": "<asset name>",
-  "description": "<short description>",
-  "meta_info": {"category": "visual", "tags": []},
-  "shader": {
-    "name": "<shader name>",
-    "vertex_shader": "<GLSL vertex shader>",
-    "fragment_shader": "<GLSL fragment shader>",
-    "shader_lib_id": 1,
-    "uniforms": [ ... ],
-    "input_parameters": [ ... ]
-  },
-  "tone": null,
-  "haptic": null,
-  "control": null,
-  "modulations": null
-}
+import functools
+import json
+import sys
+from datetime import timedelta
+from importlib import resources
+from string import Template
+from typing import Any, Callable, Dict, List
 
-Rules:
-1. Include standard uniforms: u_time, u_resolution, u_backgroundColor,
-   u_gridSize, u_gridColor.
-2. Provide an input_parameter for each controllable scalar uniform.
-3. The final SDF value MUST use `smoothstep(u_ss_min, u_ss_max, d) * u_ss_mult`.
-4. Keep the JSON concise; no markdown or explanations.
-
-The following SDF and utility functions may be used inside your fragment shader:
-- addNoise
-- blendMax
-- blendMin
-- blendXor
-- boxSDF
-- circleSDF
-- crossSDF
-- cubicSmoothStep
-- exponential
-- filteredCheckers
-- filteredCrosses
-- filteredGrid
-- filteredSquares
-- filteredXor
-- hexagonSDF
-- iterativeCircleSDF
-- linear
-- offsetCurve
-- parabolic
-- quinticSmoothStep
-- rectSDF
-- redHeavyGradient
-- redHeavyVariant
-- remapCurve
-- scaleCurve
-- sdArc
-- sdCircle
-- sdCross
-- sdCutDisk
-- sdEgg
-- sdEquilateralTriangle
-- sdHeart
-- sdHexagon
-- sdHexagram
-- sdHorseshoe
-- sdIsoscelesTriangle
-- sdMoon
-- sdOctogon
-- sdOrientedBox
-- sdParallelogram
-- sdPentagon
-- sdPie
-- sdRhombus
-- sdRoundedBox
-- sdRoundedCross
-- sdRoundedX
-- sdStar5
-- sdTrapezoid
-- sdTriangle
-- sdUnevenCapsule
-- sdVesica
-- segmentSDF
-- sinusoidal
-- smoothIntersection
-- smoothStepIntersection
-- smoothStepSubtraction
-- smoothStepUnion
-- smoothSubtraction
-- smoothUnion
-- smoothstepCubic
-- spectrumVariant1
-- spectrumVariant10
-- spectrumVariant11
-- spectrumVariant12
-- spectrumVariant2
-- spectrumVariant3
-- spectrumVariant4
-- spectrumVariant5
-- spectrumVariant6
-- spectrumVariant7
-- spectrumVariant8
-- spectrumVariant9
-- starSDF
-- triangleSDF
-- dot2(v), cross(a, b), ndot(a, b)
-
-Assume `u_resolution`, `u_time` are always available unless overridden.
-CANONICAL BACKGROUND UNIFORMS:
-All shaders must include these standard uniforms:
-- uniform vec3 u_backgroundColor; // Background color, default as hex string (e.g. "#1a1a1a")
-- uniform float u_gridSize;   // 0 = grid off, >0 = cell size
-- uniform vec3 u_gridColor;   // grid line tint (default vec3(0.9))
-
-BACKGROUND IMPLEMENTATION:
-1. Start shader with: vec3 color = u_backgroundColor;
-2. Add optional grid pattern:
-   if (u_gridSize > 0.0) {
-     vec2 grid = fract(uv * u_resolution.xy / u_gridSize);
-     float lineWidth = max(1.0, u_gridSize * 0.05) / u_gridSize;
-     if (grid.x < lineWidth || grid.y < lineWidth) {
-       color = mix(color, u_gridColor, 0.3);
-     }
-   }
-3. Blend your shader effects on top of the background
-4. Always include these uniforms in the uniforms array with defaults (use "#1a1a1a" for `u_backgroundColor` by default)
-
-
----
-
-🎨 STYLE & OUTPUT REQUIREMENTS
-
-**IMPORTANT**: The final output of EVERY signed distance function (SDF) calculation MUST be processed through a parameterized `smoothstep` function to control its appearance.
-
-Specifically, for each SDF result `d`, the final value used for coloring must be calculated as:
-`smoothstep(u_ss_min, u_ss_max, d) * u_ss_mult;`
-
-You must create and expose `u_ss_min`, `u_ss_max`, and `u_ss_mult` as uniforms and controllable input_parameters for each SDF. If there are multiple SDFs, they should each have their own independent set of these three parameters (e.g., `u_circle_ss_min`, `u_box_ss_min`, etc.).
-
----
-
-🔍 EXAMPLE PROMPT → RESPONSE PAIR (Few-Shot)
-
-User Prompt: “A circular SDF that pulsates over time and is color-modulated by distance”
-
-Response:
-{
-  "shader": {
-    "name": "CircleSDF",
-    "vertex_shader": "void main() { gl_Position = vec4(position, 1.0); }",
-    "fragment_shader": "uniform vec2 u_resolution; uniform float u_time; uniform vec3 u_backgroundColor; uniform float u_gridSize; uniform vec3 u_gridColor; uniform float u_px; uniform float u_py; uniform float u_r; uniform float u_ss_min; uniform float u_ss_max; uniform float u_ss_mult; float circleSDF(vec2 p, float r) { return length(p) - r; } void main() { vec2 st = gl_FragCoord.xy / u_resolution.xy; st = st * 2.0 - 1.0; st.x *= u_resolution.x / u_resolution.y; vec3 color = u_backgroundColor; if (u_gridSize > 0.0) { vec2 grid = fract(st * u_resolution.xy / u_gridSize); float lineWidth = max(1.0, u_gridSize * 0.05) / u_gridSize; if (grid.x < lineWidth || grid.y < lineWidth) { color = mix(color, u_gridColor, 0.3); } } vec2 p = st - vec2(u_px, u_py); float d = circleSDF(p, u_r); float smoothed_d = smoothstep(u_ss_min, u_ss_max, d) * u_ss_mult; vec3 circleColor = vec3(1.0 - smoothed_d); circleColor *= mix(vec3(0.3, 0.7, 1.0), vec3(1.0, 0.4, 0.6), sin(u_time + d * 10.0) * 0.5 + 0.5); color = mix(color, circleColor, circleColor.r); gl_FragColor = vec4(color, 1.0); }",
-    "shader_lib_id": 1,
-    "uniforms": [
-      { "name": "u_time", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_resolution", "type": "vec2", "stage": "fragment", "default": [800.0, 600.0] },
-      { "name": "u_backgroundColor", "type": "vec3", "stage": "fragment", "default": [0.1, 0.1, 0.1] },
-      { "name": "u_gridSize", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_gridColor", "type": "vec3", "stage": "fragment", "default": [0.9, 0.9, 0.9] },
-      { "name": "u_px", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_py", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_r", "type": "float", "stage": "fragment", "default": 0.5 },
-      { "name": "u_ss_min", "type": "float", "stage": "fragment", "default": -0.05 },
-      { "name": "u_ss_max", "type": "float", "stage": "fragment", "default": 0.05 },
-      { "name": "u_ss_mult", "type": "float", "stage": "fragment", "default": 1.0 }
-    ],
-    "input_parameters": [
-      { "name": "time", "parameter": "u_time", "path": "u_time", "type": "float", "default": 0.0, "min": 0.0, "max": 10.0, "step": 0.01, "smoothingTime": 0.1 },
-      { "name": "gridSize", "parameter": "u_gridSize", "path": "u_gridSize", "type": "float", "default": 0.0, "min": 0.0, "max": 50.0, "step": 0.1, "smoothingTime": 0.1 },
-      { "name": "positionX", "parameter": "u_px", "path": "u_px", "type": "float", "default": 0.0, "min": -1.0, "max": 1.0, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "positionY", "parameter": "u_py", "path": "u_py", "type": "float", "default": 0.0, "min": -1.0, "max": 1.0, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "radius", "parameter": "u_r", "path": "u_r", "type": "float", "default": 0.5, "min": 0.1, "max": 2.0, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "smoothMin", "parameter": "u_ss_min", "path": "u_ss_min", "type": "float", "default": -0.05, "min": -0.5, "max": 0.5, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "smoothMax", "parameter": "u_ss_max", "path": "u_ss_max", "type": "float", "default": 0.05, "min": -0.5, "max": 0.5, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "smoothMult", "parameter": "u_ss_mult", "path": "u_ss_mult", "type": "float", "default": 1.0, "min": 0.0, "max": 5.0, "step": 0.01, "smoothingTime": 0.1 }
-    ]
-  }
-}
+from .compaction import compact_prompt
+from .messages import cacheable_messages, register_cached_content
+
+# SDF and utility helpers available to generated fragment shaders; the prompt
+# lists them one per line.
+_SDF_FUNCTIONS: tuple[str, ...] = (
+    "addNoise",
+    "blendMax",
+    "blendMin",
+    "blendXor",
+    "boxSDF",
+    "circleSDF",
+    "crossSDF",
+    "cubicSmoothStep",
+    "exponential",
+    "filteredCheckers",
+    "filteredCrosses",
+    "filteredGrid",
+    "filteredSquares",
+    "filteredXor",
+    "hexagonSDF",
+    "iterativeCircleSDF",
+    "linear",
+    "offsetCurve",
+    "parabolic",
+    "quinticSmoothStep",
+    "rectSDF",
+    "redHeavyGradient",
+    "redHeavyVariant",
+    "remapCurve",
+    "scaleCurve",
+    "sdArc",
+    "sdCircle",
+    "sdCross",
+    "sdCutDisk",
+    "sdEgg",
+    "sdEquilateralTriangle",
+    "sdHeart",
+    "sdHexagon",
+    "sdHexagram",
+    "sdHorseshoe",
+    "sdIsoscelesTriangle",
+    "sdMoon",
+    "sdOctogon",
+    "sdOrientedBox",
+    "sdParallelogram",
+    "sdPentagon",
+    "sdPie",
+    "sdRhombus",
+    "sdRoundedBox",
+    "sdRoundedCross",
+    "sdRoundedX",
+    "sdStar5",
+    "sdTrapezoid",
+    "sdTriangle",
+    "sdUnevenCapsule",
+    "sdVesica",
+    "segmentSDF",
+    "sinusoidal",
+    "smoothIntersection",
+    "smoothStepIntersection",
+    "smoothStepSubtraction",
+    "smoothStepUnion",
+    "smoothSubtraction",
+    "smoothUnion",
+    "smoothstepCubic",
+    "spectrumVariant1",
+    "spectrumVariant10",
+    "spectrumVariant11",
+    "spectrumVariant12",
+    "spectrumVariant2",
+    "spectrumVariant3",
+    "spectrumVariant4",
+    "spectrumVariant5",
+    "spectrumVariant6",
+    "spectrumVariant7",
+    "spectrumVariant8",
+    "spectrumVariant9",
+    "starSDF",
+    "triangleSDF",
+)
+_SDF_LIST_BLOCK = "\n".join("- " + name for name in _SDF_FUNCTIONS)
 
----
-
-User prompt: "Stacked and iterated SDF circles with radius growth and modulation offsets"
-
-Response:
-{
-  "shader": {
-    "name": "CirclesMinIterativeSDF",
-    "vertex_shader": "void main() { gl_Position = vec4(position, 1.0); }",
-    "fragment_shader": "uniform vec2 u_resolution;uniform float u_time;uniform vec3 u_backgroundColor;uniform float u_gridSize;uniform vec3 u_gridColor;uniform float u_px;uniform float u_py;uniform float u_initial_r;uniform float u_poX;uniform float u_poY;uniform float u_ro;uniform float u_str;uniform float u_stro;uniform float u_m;uniform float u_mo;uniform float u_sub;uniform float u_subo;uniform int u_iterations;uniform float u_ss_min;uniform float u_ss_max;uniform float u_ss_mult;float applyCirclesMinLogic(vec2 p_val,float r_val,float str_val,float m_val,float sub_val){float base_sdf=length(p_val)-r_val;if(str_val==0.0)return base_sdf*m_val-sub_val;else return(abs(base_sdf)-str_val)*m_val-sub_val;}void main(){vec2 st=gl_FragCoord.xy/u_resolution.xy;st=st*2.0-1.0;st.x*=u_resolution.x/u_resolution.y;vec3 color=u_backgroundColor;if(u_gridSize>0.0){vec2 grid=fract(st*u_resolution.xy/u_gridSize);float lineWidth=max(1.0,u_gridSize*0.05)/u_gridSize;if(grid.x<lineWidth||grid.y<lineWidth){color=mix(color,u_gridColor,0.3);}}vec2 p=st-vec2(u_px,u_py);float r=u_initial_r;float str=u_str;float m=u_m;float sub=u_sub;float d=applyCirclesMinLogic(p,r,str,m,sub);for(int i=1;i<u_iterations;i++){p+=vec2(u_poX,u_poY);r+=u_ro;str+=u_stro*float(i);m+=u_mo*float(i);sub+=u_subo*float(i);d=min(applyCirclesMinLogic(p,r,str,m,sub),d);}float smoothed_d=smoothstep(u_ss_min,u_ss_max,d)*u_ss_mult;vec3 circleColor=vec3(1.0-smoothed_d);circleColor*=mix(vec3(0.3,0.7,1.0),vec3(1.0,0.4,0.6),sin(u_time+d*10.0)*0.5+0.5);color=mix(color,circleColor,circleColor.r);gl_FragColor=vec4(color,1.0);}",
-    "shader_lib_id": 1,
-    "uniforms": [
-      { "name": "u_time", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_resolution", "type": "vec2", "stage": "fragment", "default": [800.0, 600.0] },
-      { "name": "u_backgroundColor", "type": "vec3", "stage": "fragment", "default": [0.1, 0.1, 0.1] },
-      { "name": "u_gridSize", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_gridColor", "type": "vec3", "stage": "fragment", "default": [0.9, 0.9, 0.9] },
-      { "name": "u_px", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_py", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_initial_r", "type": "float", "stage": "fragment", "default": 0.5 },
-      { "name": "u_poX", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_poY", "type": "float", "stage": "fragment", "default": 0.05 },
-      { "name": "u_ro", "type": "float", "stage": "fragment", "default": 0.02 },
-      { "name": "u_str", "type": "float", "stage": "fragment", "default": 0.01 },
-      { "name": "u_stro", "type": "float", "stage": "fragment", "default": 0.005 },
-      { "name": "u_m", "type": "float", "stage": "fragment", "default": 1.0 },
-      { "name": "u_mo", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_sub", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_subo", "type": "float", "stage": "fragment", "default": 0.0 },
-      { "name": "u_iterations", "type": "int", "stage": "fragment", "default": 5 },
-      { "name": "u_ss_min", "type": "float", "stage": "fragment", "default": -0.05 },
-      { "name": "u_ss_max", "type": "float", "stage": "fragment", "default": 0.05 },
-      { "name": "u_ss_mult", "type": "float", "stage": "fragment", "default": 1.0 }
-    ],
-    "input_parameters": [
-      { "name": "time", "parameter": "u_time", "path": "u_time", "type": "float", "default": 0.0, "min": 0.0, "max": 10.0, "step": 0.01, "smoothingTime": 0.1 },
-      { "name": "gridSize", "parameter": "u_gridSize", "path": "u_gridSize", "type": "float", "default": 0.0, "min": 0.0, "max": 50.0, "step": 0.1, "smoothingTime": 0.1 },
-      { "name": "positionX", "parameter": "u_px", "path": "u_px", "type": "float", "default": 0.0, "min": -1.0, "max": 1.0, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "positionY", "parameter": "u_py", "path": "u_py", "type": "float", "default": 0.0, "min": -1.0, "max": 1.0, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "initialRadius", "parameter": "u_initial_r", "path": "u_initial_r", "type": "float", "default": 0.5, "min": 0.01, "max": 1.0, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "poX", "parameter": "u_poX", "path": "u_poX", "type": "float", "default": 0.0, "min": -0.1, "max": 0.1, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "poY", "parameter": "u_poY", "path": "u_poY", "type": "float", "default": 0.05, "min": -0.1, "max": 0.1, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "radiusOffset", "parameter": "u_ro", "path": "u_ro", "type": "float", "default": 0.02, "min": -0.05, "max": 0.05, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "initialStr", "parameter": "u_str", "path": "u_str", "type": "float", "default": 0.01, "min": 0.0, "max": 0.1, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "strOffset", "parameter": "u_stro", "path": "u_stro", "type": "float", "default": 0.005, "min": 0.0, "max": 0.05, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "initialM", "parameter": "u_m", "path": "u_m", "type": "float", "default": 1.0, "min": 0.1, "max": 5.0, "step": 0.01, "smoothingTime": 0.1 },
-      { "name": "mOffset", "parameter": "u_mo", "path": "u_mo", "type": "float", "default": 0.0, "min": -0.1, "max": 0.1, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "initialSub", "parameter": "u_sub", "path": "u_sub", "type": "float", "default": 0.0, "min": -0.1, "max": 0.1, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "subOffset", "parameter": "u_subo", "path": "u_subo", "type": "float", "default": 0.0, "min": -0.05, "max": 0.05, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "iterations", "parameter": "u_iterations", "path": "u_iterations", "type": "int", "default": 5, "min": 1, "max": 20, "step": 1, "smoothingTime": 0.1 },
-      { "name": "smoothMin", "parameter": "u_ss_min", "path": "u_ss_min", "type": "float", "default": -0.05, "min": -0.5, "max": 0.5, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "smoothMax", "parameter": "u_ss_max", "path": "u_ss_max", "type": "float", "default": 0.05, "min": -0.5, "max": 0.5, "step": 0.001, "smoothingTime": 0.1 },
-      { "name": "smoothMult", "parameter": "u_ss_mult", "path": "u_ss_mult", "type": "float", "default": 1.0, "min": 0.0, "max": 5.0, "step": 0.01, "smoothingTime": 0.1 }
-    ]
-  }
+# Few-shot responses spliced into the prompt as compact JSON. Serializing
+# them here keeps the bytes deterministic across deploys.
+_CIRCLE_EXAMPLE: Dict[str, Any] = {
+    "shader": {
+        "name": "CircleSDF",
+        "vertex_shader": "void main() { gl_Position = vec4(position, 1.0); }",
+        "fragment_shader": "uniform vec2 u_resolution; uniform float u_time; uniform vec3 u_backgroundColor; uniform float u_gridSize; uniform vec3 u_gridColor; uniform float u_px; uniform float u_py; uniform float u_r; uniform float u_ss_min; uniform float u_ss_max; uniform float u_ss_mult; float circleSDF(vec2 p, float r) { return length(p) - r; } void main() { vec2 st = gl_FragCoord.xy / u_resolution.xy; st = st * 2.0 - 1.0; st.x *= u_resolution.x / u_resolution.y; vec3 color = u_backgroundColor; if (u_gridSize > 0.0) { vec2 grid = fract(st * u_resolution.xy / u_gridSize); float lineWidth = max(1.0, u_gridSize * 0.05) / u_gridSize; if (grid.x < lineWidth || grid.y < lineWidth) { color = mix(color, u_gridColor, 0.3); } } vec2 p = st - vec2(u_px, u_py); float d = circleSDF(p, u_r); float smoothed_d = smoothstep(u_ss_min, u_ss_max, d) * u_ss_mult; vec3 circleColor = vec3(1.0 - smoothed_d); circleColor *= mix(vec3(0.3, 0.7, 1.0), vec3(1.0, 0.4, 0.6), sin(u_time + d * 10.0) * 0.5 + 0.5); color = mix(color, circleColor, circleColor.r); gl_FragColor = vec4(color, 1.0); }",
+        "shader_lib_id": 1,
+        "uniforms": [
+            {"name": "u_time", "type": "float", "stage": "fragment", "default": 0.0},
+            {
+                "name": "u_resolution",
+                "type": "vec2",
+                "stage": "fragment",
+                "default": [800.0, 600.0],
+            },
+            {
+                "name": "u_backgroundColor",
+                "type": "vec3",
+                "stage": "fragment",
+                "default": [0.1, 0.1, 0.1],
+            },
+            {
+                "name": "u_gridSize",
+                "type": "float",
+                "stage": "fragment",
+                "default": 0.0,
+            },
+            {
+                "name": "u_gridColor",
+                "type": "vec3",
+                "stage": "fragment",
+                "default": [0.9, 0.9, 0.9],
+            },
+            {"name": "u_px", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_py", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_r", "type": "float", "stage": "fragment", "default": 0.5},
+            {
+                "name": "u_ss_min",
+                "type": "float",
+                "stage": "fragment",
+                "default": -0.05,
+            },
+            {"name": "u_ss_max", "type": "float", "stage": "fragment", "default": 0.05},
+            {"name": "u_ss_mult", "type": "float", "stage": "fragment", "default": 1.0},
+        ],
+        "input_parameters": [
+            {
+                "name": "time",
+                "parameter": "u_time",
+                "path": "u_time",
+                "type": "float",
+                "default": 0.0,
+                "min": 0.0,
+                "max": 10.0,
+                "step": 0.01,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "gridSize",
+                "parameter": "u_gridSize",
+                "path": "u_gridSize",
+                "type": "float",
+                "default": 0.0,
+                "min": 0.0,
+                "max": 50.0,
+                "step": 0.1,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "positionX",
+                "parameter": "u_px",
+                "path": "u_px",
+                "type": "float",
+                "default": 0.0,
+                "min": -1.0,
+                "max": 1.0,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "positionY",
+                "parameter": "u_py",
+                "path": "u_py",
+                "type": "float",
+                "default": 0.0,
+                "min": -1.0,
+                "max": 1.0,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "radius",
+                "parameter": "u_r",
+                "path": "u_r",
+                "type": "float",
+                "default": 0.5,
+                "min": 0.1,
+                "max": 2.0,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "smoothMin",
+                "parameter": "u_ss_min",
+                "path": "u_ss_min",
+                "type": "float",
+                "default": -0.05,
+                "min": -0.5,
+                "max": 0.5,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "smoothMax",
+                "parameter": "u_ss_max",
+                "path": "u_ss_max",
+                "type": "float",
+                "default": 0.05,
+                "min": -0.5,
+                "max": 0.5,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "smoothMult",
+                "parameter": "u_ss_mult",
+                "path": "u_ss_mult",
+                "type": "float",
+                "default": 1.0,
+                "min": 0.0,
+                "max": 5.0,
+                "step": 0.01,
+                "smoothingTime": 0.1,
+            },
+        ],
+    }
 }
+_CIRCLES_ITER_EXAMPLE: Dict[str, Any] = {
+    "shader": {
+        "name": "CirclesMinIterativeSDF",
+        "vertex_shader": "void main() { gl_Position = vec4(position, 1.0); }",
+        "fragment_shader": "uniform vec2 u_resolution;uniform float u_time;uniform vec3 u_backgroundColor;uniform float u_gridSize;uniform vec3 u_gridColor;uniform float u_px;uniform float u_py;uniform float u_initial_r;uniform float u_poX;uniform float u_poY;uniform float u_ro;uniform float u_str;uniform float u_stro;uniform float u_m;uniform float u_mo;uniform float u_sub;uniform float u_subo;uniform int u_iterations;uniform float u_ss_min;uniform float u_ss_max;uniform float u_ss_mult;float applyCirclesMinLogic(vec2 p_val,float r_val,float str_val,float m_val,float sub_val){float base_sdf=length(p_val)-r_val;if(str_val==0.0)return base_sdf*m_val-sub_val;else return(abs(base_sdf)-str_val)*m_val-sub_val;}void main(){vec2 st=gl_FragCoord.xy/u_resolution.xy;st=st*2.0-1.0;st.x*=u_resolution.x/u_resolution.y;vec3 color=u_backgroundColor;if(u_gridSize>0.0){vec2 grid=fract(st*u_resolution.xy/u_gridSize);float lineWidth=max(1.0,u_gridSize*0.05)/u_gridSize;if(grid.x<lineWidth||grid.y<lineWidth){color=mix(color,u_gridColor,0.3);}}vec2 p=st-vec2(u_px,u_py);float r=u_initial_r;float str=u_str;float m=u_m;float sub=u_sub;float d=applyCirclesMinLogic(p,r,str,m,sub);for(int i=1;i<u_iterations;i++){p+=vec2(u_poX,u_poY);r+=u_ro;str+=u_stro*float(i);m+=u_mo*float(i);sub+=u_subo*float(i);d=min(applyCirclesMinLogic(p,r,str,m,sub),d);}float smoothed_d=smoothstep(u_ss_min,u_ss_max,d)*u_ss_mult;vec3 circleColor=vec3(1.0-smoothed_d);circleColor*=mix(vec3(0.3,0.7,1.0),vec3(1.0,0.4,0.6),sin(u_time+d*10.0)*0.5+0.5);color=mix(color,circleColor,circleColor.r);gl_FragColor=vec4(color,1.0);}",
+        "shader_lib_id": 1,
+        "uniforms": [
+            {"name": "u_time", "type": "float", "stage": "fragment", "default": 0.0},
+            {
+                "name": "u_resolution",
+                "type": "vec2",
+                "stage": "fragment",
+                "default": [800.0, 600.0],
+            },
+            {
+                "name": "u_backgroundColor",
+                "type": "vec3",
+                "stage": "fragment",
+                "default": [0.1, 0.1, 0.1],
+            },
+            {
+                "name": "u_gridSize",
+                "type": "float",
+                "stage": "fragment",
+                "default": 0.0,
+            },
+            {
+                "name": "u_gridColor",
+                "type": "vec3",
+                "stage": "fragment",
+                "default": [0.9, 0.9, 0.9],
+            },
+            {"name": "u_px", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_py", "type": "float", "stage": "fragment", "default": 0.0},
+            {
+                "name": "u_initial_r",
+                "type": "float",
+                "stage": "fragment",
+                "default": 0.5,
+            },
+            {"name": "u_poX", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_poY", "type": "float", "stage": "fragment", "default": 0.05},
+            {"name": "u_ro", "type": "float", "stage": "fragment", "default": 0.02},
+            {"name": "u_str", "type": "float", "stage": "fragment", "default": 0.01},
+            {"name": "u_stro", "type": "float", "stage": "fragment", "default": 0.005},
+            {"name": "u_m", "type": "float", "stage": "fragment", "default": 1.0},
+            {"name": "u_mo", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_sub", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_subo", "type": "float", "stage": "fragment", "default": 0.0},
+            {"name": "u_iterations", "type": "int", "stage": "fragment", "default": 5},
+            {
+                "name": "u_ss_min",
+                "type": "float",
+                "stage": "fragment",
+                "default": -0.05,
+            },
+            {"name": "u_ss_max", "type": "float", "stage": "fragment", "default": 0.05},
+            {"name": "u_ss_mult", "type": "float", "stage": "fragment", "default": 1.0},
+        ],
+        "input_parameters": [
+            {
+                "name": "time",
+                "parameter": "u_time",
+                "path": "u_time",
+                "type": "float",
+                "default": 0.0,
+                "min": 0.0,
+                "max": 10.0,
+                "step": 0.01,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "gridSize",
+                "parameter": "u_gridSize",
+                "path": "u_gridSize",
+                "type": "float",
+                "default": 0.0,
+                "min": 0.0,
+                "max": 50.0,
+                "step": 0.1,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "positionX",
+                "parameter": "u_px",
+                "path": "u_px",
+                "type": "float",
+                "default": 0.0,
+                "min": -1.0,
+                "max": 1.0,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "positionY",
+                "parameter": "u_py",
+                "path": "u_py",
+                "type": "float",
+                "default": 0.0,
+                "min": -1.0,
+                "max": 1.0,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "initialRadius",
+                "parameter": "u_initial_r",
+                "path": "u_initial_r",
+                "type": "float",
+                "default": 0.5,
+                "min": 0.01,
+                "max": 1.0,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "poX",
+                "parameter": "u_poX",
+                "path": "u_poX",
+                "type": "float",
+                "default": 0.0,
+                "min": -0.1,
+                "max": 0.1,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "poY",
+                "parameter": "u_poY",
+                "path": "u_poY",
+                "type": "float",
+                "default": 0.05,
+                "min": -0.1,
+                "max": 0.1,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "radiusOffset",
+                "parameter": "u_ro",
+                "path": "u_ro",
+                "type": "float",
+                "default": 0.02,
+                "min": -0.05,
+                "max": 0.05,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "initialStr",
+                "parameter": "u_str",
+                "path": "u_str",
+                "type": "float",
+                "default": 0.01,
+                "min": 0.0,
+                "max": 0.1,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "strOffset",
+                "parameter": "u_stro",
+                "path": "u_stro",
+                "type": "float",
+                "default": 0.005,
+                "min": 0.0,
+                "max": 0.05,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "initialM",
+                "parameter": "u_m",
+                "path": "u_m",
+                "type": "float",
+                "default": 1.0,
+                "min": 0.1,
+                "max": 5.0,
+                "step": 0.01,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "mOffset",
+                "parameter": "u_mo",
+                "path": "u_mo",
+                "type": "float",
+                "default": 0.0,
+                "min": -0.1,
+                "max": 0.1,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "initialSub",
+                "parameter": "u_sub",
+                "path": "u_sub",
+                "type": "float",
+                "default": 0.0,
+                "min": -0.1,
+                "max": 0.1,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "subOffset",
+                "parameter": "u_subo",
+                "path": "u_subo",
+                "type": "float",
+                "default": 0.0,
+                "min": -0.05,
+                "max": 0.05,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "iterations",
+                "parameter": "u_iterations",
+                "path": "u_iterations",
+                "type": "int",
+                "default": 5,
+                "min": 1,
+                "max": 20,
+                "step": 1,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "smoothMin",
+                "parameter": "u_ss_min",
+                "path": "u_ss_min",
+                "type": "float",
+                "default": -0.05,
+                "min": -0.5,
+                "max": 0.5,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "smoothMax",
+                "parameter": "u_ss_max",
+                "path": "u_ss_max",
+                "type": "float",
+                "default": 0.05,
+                "min": -0.5,
+                "max": 0.5,
+                "step": 0.001,
+                "smoothingTime": 0.1,
+            },
+            {
+                "name": "smoothMult",
+                "parameter": "u_ss_mult",
+                "path": "u_ss_mult",
+                "type": "float",
+                "default": 1.0,
+                "min": 0.0,
+                "max": 5.0,
+                "step": 0.01,
+                "smoothingTime": 0.1,
+            },
+        ],
+    }
+}
+
+
+def _example_json(example: Dict[str, Any]) -> str:
+    return json.dumps(example, ensure_ascii=False, separators=(",", ":"))
+
+
+# The prose lives in ``shader_prompt.txt``; ``$`` placeholders mark where the
+# SDF list and the JSON examples are spliced in. Reading and compacting only
+# happen on first use, so importing the package stays cheap; each step is
+# cached, so every later call sees the same constant.
+@functools.cache
+def _shader_prompt_source() -> str:
+    return Template(
+        resources.files(__package__)
+        .joinpath("shader_prompt.txt")
+        .read_text(encoding="utf-8")
+    ).substitute(
+        sdf_functions=_SDF_LIST_BLOCK,
+        circle_example=_example_json(_CIRCLE_EXAMPLE),
+        circles_iter_example=_example_json(_CIRCLES_ITER_EXAMPLE),
+    )
+
 
----
+@functools.cache
+def canonical_shader_prompt() -> str:
+    """Return the compacted canonical shader prompt.
+
+    Interned so equal copies elsewhere collapse onto one object and equality
+    checks short-circuit on identity.
+    """
+
+    return sys.intern(compact_prompt(_shader_prompt_source()))
+
+
+# Built and encoded once so each call copies the ~6 KB static prefix at most
+# once and transport code never re-encodes it.
+@functools.cache
+def _shader_prefix() -> str:
+    return sys.intern(canonical_shader_prompt() + "\n\nUser Prompt:\n")
+
+
+@functools.cache
+def _shader_prefix_bytes() -> bytes:
+    return _shader_prefix().encode("utf-8")
+
+
+_LAZY_CONSTANTS: Dict[str, Callable[[], str]] = {
+    "CANONICAL_SHADER_PROMPT": canonical_shader_prompt,
+    "_SHADER_PROMPT_SOURCE": _shader_prompt_source,
+}
 
-🚫 DO NOT:
-- Generate the full asset schema — only the shader block
-- Include markdown, explanations, or extra text
-- Invent new SDF functions
 
-Respond with ONLY the JSON object as described.
-```
-"""
+def __getattr__(name: str) -> str:
+    if name in _LAZY_CONSTANTS:
+        return _LAZY_CONSTANTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+@functools.lru_cache(maxsize=256)
 def build_shader_prompt(user_prompt: str = "") -> str:
     """Return the canonical shader prompt with an optional user request."""
 
-    return f"{CANONICAL_SHADER_PROMPT}\n\nUser Prompt:\n{user_prompt}"
+    prefix = _shader_prefix()
+    return prefix + user_prompt if user_prompt else prefix
+
+
+def build_shader_prompt_bytes(user_prompt: str = "") -> bytes:
+    """UTF-8 encoded :func:`build_shader_prompt` reusing the encoded prefix."""
+
+    return _shader_prefix_bytes() + user_prompt.encode("utf-8")
+
+
+def build_shader_messages(user_prompt: str = "") -> List[Dict[str, Any]]:
+    """Return chat messages with the canonical prompt as a cached system block."""
+
+    return cacheable_messages(
+        canonical_shader_prompt(), build_shader_prompt_cached(user_prompt)
+    )
+
+
+def build_shader_prompt_cached(user_prompt: str = "") -> str:
+    """Return only the dynamic part of the shader prompt.
+
+    Pair with the handle from :func:`register_shader_prompt_cache`, which
+    already holds the canonical prompt on the provider side.
+    """
+
+    return f"User Prompt:\n{user_prompt}"
+
+
+def register_shader_prompt_cache(
+    model: str, ttl: timedelta = timedelta(hours=1)
+) -> str:
+    """Register the canonical shader prompt as cached content; return its name."""
+
+    return register_cached_content("shader", model, canonical_shader_prompt(), ttl)
+
+
+# Token count of the static prefix per model, filled on first use.
+SHADER_PROMPT_TOKEN_COUNT: Dict[str, int] = {}
+
+
+def count_shader_prompt_tokens(
+    user_prompt: str, model: str, count_tokens: Callable[[str], int]
+) -> int:
+    """Return the token count of ``build_shader_prompt(user_prompt)``.
+
+    ``count_tokens`` is the caller's tokenizer for ``model``. The static
+    prefix is tokenized once per model, so each call only tokenizes
+    ``user_prompt``; the sum can differ from a whole-string count by a token
+    where a merge would span the boundary, which is fine for telemetry.
+    """
+    prefix_tokens = SHADER_PROMPT_TOKEN_COUNT.get(model)
+    if prefix_tokens is None:
+        prefix_tokens = SHADER_PROMPT_TOKEN_COUNT[model] = count_tokens(
+            _shader_prefix()
+        )
+    return prefix_tokens + (count_tokens(user_prompt) if user_prompt else 0)
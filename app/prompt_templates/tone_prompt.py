@@ -2,6 +2,9 @@
 
 # flake8: noqa: E501
 
+import sys
+from typing import Callable, Dict, List, Sequence, Tuple
+
 CANONICAL_TONEJS_SYSTEM_PROMPT = """You are an expert Tone.js synthesizer designer. \
 Generate ONLY valid JSON that follows the canonical Tone.js DSL structure.
 
@@ -403,9 +406,44 @@ FORBIDDEN:
 - Invalid Tone.js types
 
 Respond with ONLY the JSON object, no markdown or explanations."""
+CANONICAL_TONEJS_SYSTEM_PROMPT = sys.intern(CANONICAL_TONEJS_SYSTEM_PROMPT)
+
+
+# Built and encoded once at import so each call is a single concatenation.
+_USER_REQUEST_MARKER = "\n\nUser Request: "
+_PROMPT_PREFIX = sys.intern(CANONICAL_TONEJS_SYSTEM_PROMPT + _USER_REQUEST_MARKER)
+_PROMPT_PREFIX_BYTES = _PROMPT_PREFIX.encode("utf-8")
 
 
 def build_tone_prompt(user_prompt: str) -> str:
     """Return the canonical Tone.js prompt with the user request appended."""
 
-    return f"{CANONICAL_TONEJS_SYSTEM_PROMPT}\n\nUser Request: {user_prompt}"
+    return _PROMPT_PREFIX + user_prompt
+
+
+def build_tone_prompt_bytes(user_prompt: str) -> bytes:
+    """UTF-8 encoded :func:`build_tone_prompt` reusing the encoded prefix."""
+
+    return _PROMPT_PREFIX_BYTES + user_prompt.encode("utf-8")
+
+
+# Token ids of the system prompt per tokenizer, filled on first use.
+TONE_PROMPT_TOKENS: Dict[str, Tuple[int, ...]] = {}
+
+
+def build_tone_prompt_tokens(
+    user_prompt: str, tokenizer: str, encode: Callable[[str], Sequence[int]]
+) -> List[int]:
+    """Return token ids for ``build_tone_prompt(user_prompt)``.
+
+    ``encode`` is the caller's encoder registered under ``tokenizer``. The
+    system prompt is encoded once per tokenizer; each call only encodes the
+    ``User Request`` tail, which starts at a paragraph break and so does not
+    merge with the cached prefix tokens.
+    """
+    prefix = TONE_PROMPT_TOKENS.get(tokenizer)
+    if prefix is None:
+        prefix = TONE_PROMPT_TOKENS[tokenizer] = tuple(
+            encode(CANONICAL_TONEJS_SYSTEM_PROMPT)
+        )
+    return [*prefix, *encode(_USER_REQUEST_MARKER + user_prompt)]
@@ -0,0 +1,9 @@
+"""Generated protobuf modules.
+
+The upb (C) backend is requested before any ``_pb2`` module is imported; an
+explicit ``PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION`` in the environment wins.
+"""
+
+import os
+
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
@@ -1,14 +1,36 @@
-"""Router package export."""
-
-from .factory import (
-    tone_router,
-    haptic_router,
-    control_router,
-    modulation_router,
-    shader_router,
-    shader_lib_router,
+"""Router package export.
+
+The generic CRUD routers live in :mod:`app.routers.factory`, which imports every
+model and schema. They are resolved lazily (PEP 562) so that importing a single
+router module does not pay for the whole factory.
+"""
+
+from typing import Any
+
+_LAZY = frozenset(
+    {
+        "tone_router",
+        "haptic_router",
+        "control_router",
+        "modulation_router",
+        "shader_router",
+        "shader_lib_router",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        from . import factory
+
+        return getattr(factory, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY)
+
+
 __all__ = [
     "tone_router",
     "haptic_router",
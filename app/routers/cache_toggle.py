@@ -2,30 +2,39 @@ from __future__ import annotations
 
 """Router for toggling application cache."""
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from typing import Any
 
-from app.cache import set_cache_enabled
-from app.config import settings
+from typing_extensions import TypedDict
+from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+
+import app.cache as cache_module
 from app.schema_version import require_schema_version
 
 router = APIRouter()
 
 
-class CacheStatus(BaseModel):
+class CacheStatus(TypedDict):
     cache_enabled: bool
 
 
-@router.get("/cache", response_model=CacheStatus)
-async def get_cache_status() -> CacheStatus:
+# Handlers return the response object directly, so FastAPI skips response
+# validation; ``response_model`` only documents the shape.
+@router.get("/cache", response_model=CacheStatus, response_class=ORJSONResponse)
+async def get_cache_status() -> ORJSONResponse:
     """Return whether caching is enabled."""
 
-    return CacheStatus(cache_enabled=settings.CACHE_ENABLED)
+    return ORJSONResponse({"cache_enabled": cache_module.cache_enabled})
 
 
-@router.post("/cache", response_model=CacheStatus)
-async def set_cache_status(status: CacheStatus, _: None = Depends(require_schema_version)) -> CacheStatus:
+@router.post("/cache", response_model=CacheStatus, response_class=ORJSONResponse)
+async def set_cache_status(
+    body: dict[str, Any] = Body(...), _: None = Depends(require_schema_version)
+) -> ORJSONResponse:
     """Enable or disable caching at runtime."""
 
-    set_cache_enabled(status.cache_enabled)
-    return CacheStatus(cache_enabled=settings.CACHE_ENABLED)
+    enabled = body.get("cache_enabled")
+    if not isinstance(enabled, bool):
+        raise HTTPException(status_code=422, detail="cache_enabled must be a boolean")
+    cache_module.set_cache_enabled(enabled)
+    return ORJSONResponse({"cache_enabled": cache_module.cache_enabled})
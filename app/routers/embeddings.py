@@ -1,34 +1,117 @@
-from fastapi import APIRouter, Depends, HTTPException
+"""CRUD and similarity routes for patch embeddings.
+
+Handlers are plain ``def`` on purpose: the engine runs on psycopg2, which has
+no asyncio support, so FastAPI's threadpool dispatch is what keeps blocking
+database I/O off the event loop. Moving to ``AsyncSession`` needs an async
+driver (asyncpg or psycopg 3) in the dependency set first.
+"""
+
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app import models, schemas, security
 import app.models.db as db
-from app.services import store_embedding, query_similar
+from app.services import upsert_embedding, query_similar
 from app.logging import get_logger
 
 from app.schema_version import require_schema_version
 
 
 router = APIRouter(tags=["embeddings"], dependencies=[Depends(security.verify_jwt)])
+# Write routes resolve the schema-version check once at router level; they are
+# mounted onto ``router`` at the bottom of the module. ``/query`` is a read
+# despite being a POST, so it stays on ``router`` without the check.
+_write_router = APIRouter(dependencies=[Depends(require_schema_version)])
 logger = get_logger(__name__)
+_log_error = logger.error
+
+# Request bodies are validated through adapters built once at import rather
+# than through FastAPI's per-route body model. The raw bytes go straight to
+# ``validate_json`` so parsing and validation happen in a single pass. That
+# pass runs in pydantic-core, so the per-element float checks over a long
+# embedding happen in Rust; a generated pure-Python JSON-schema validator
+# would be slower on those arrays, not faster.
+_EMB_CREATE = TypeAdapter(schemas.PatchEmbeddingCreate)
+_EMB_QUERY = TypeAdapter(schemas.EmbeddingQuery)
+
+
+def _json_body(adapter: TypeAdapter[Any]) -> dict[str, Any]:
+    """OpenAPI request body for a route that reads and validates raw JSON."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": adapter.json_schema()}},
+        }
+    }
+
+
+async def _embedding_body(request: Request) -> schemas.PatchEmbeddingCreate:
+    return _EMB_CREATE.validate_json(await request.body())
+
+
+async def _query_body(request: Request) -> schemas.EmbeddingQuery:
+    return _EMB_QUERY.validate_json(await request.body())
+
+
+def _get_patch_embedding(
+    db_session: Session, patch_id: str
+) -> models.PatchEmbedding | None:
+    """Look up an embedding by primary key, checking the identity map first."""
+    try:
+        key = UUID(patch_id)
+    except ValueError:
+        return None
+    return db_session.get(models.PatchEmbedding, key)
+
+
+def _as_vector(values: list[float]) -> np.ndarray:
+    """Convert a request embedding once into the ``float32`` array used below."""
+    return np.asarray(values, dtype=np.float32)
 
 
-@router.post("/", response_model=schemas.PatchEmbedding)
+def _to_response(obj: models.PatchEmbedding) -> schemas.PatchEmbedding:
+    return schemas.PatchEmbedding(
+        patch_id=str(obj.patch_id),
+        embedding=np.asarray(obj.embedding, dtype=np.float32).tolist(),
+    )
+
+
+def _upsert_patch_embedding(
+    db_session: Session, patch_id: str, values: list[float]
+) -> schemas.PatchEmbedding:
+    """Upsert via ``RETURNING`` and build the response before committing.
+
+    Serializing first means the commit's attribute expiry never triggers a
+    reload ``SELECT``.
+    """
+    obj = upsert_embedding(db_session, patch_id, _as_vector(values))
+    result = _to_response(obj)
+    db_session.commit()
+    return result
+
+
+@_write_router.post(
+    "/", response_model=schemas.PatchEmbedding, openapi_extra=_json_body(_EMB_CREATE)
+)
 def create_embedding(
-    embedding: schemas.PatchEmbeddingCreate,
+    embedding: schemas.PatchEmbeddingCreate = Depends(_embedding_body),
     db_session: Session = Depends(db.get_db),
-    _: None = Depends(require_schema_version),
 ):
-    store_embedding(embedding.patch_id, embedding.embedding)
-    obj = (
-        db_session.query(models.PatchEmbedding)
-        .filter(models.PatchEmbedding.patch_id == embedding.patch_id)
-        .first()
-    )
-    if obj is None:
-        logger.error("Failed to store embedding", exc_info=True)
+    try:
+        return _upsert_patch_embedding(
+            db_session, embedding.patch_id, embedding.embedding
+        )
+    except Exception:
+        db_session.rollback()
+        _log_error(
+            "Failed to store embedding patch_id=%s", embedding.patch_id, exc_info=True
+        )
         raise HTTPException(status_code=500, detail="Internal server error")
-    return obj
 
 
 @router.get("/{patch_id}", response_model=schemas.PatchEmbedding)
@@ -36,43 +119,31 @@ def read_embedding(
     patch_id: str,
     db_session: Session = Depends(db.get_db),
 ):
-    obj = (
-        db_session.query(models.PatchEmbedding)
-        .filter(models.PatchEmbedding.patch_id == patch_id)
-        .first()
-    )
+    obj = _get_patch_embedding(db_session, patch_id)
     if obj is None:
         raise HTTPException(status_code=404, detail="Embedding not found")
-    return obj
+    return _to_response(obj)
 
 
-@router.put("/{patch_id}", response_model=schemas.PatchEmbedding)
+@_write_router.put(
+    "/{patch_id}",
+    response_model=schemas.PatchEmbedding,
+    openapi_extra=_json_body(_EMB_CREATE),
+)
 def update_embedding(
     patch_id: str,
-    embedding: schemas.PatchEmbeddingCreate,
+    embedding: schemas.PatchEmbeddingCreate = Depends(_embedding_body),
     db_session: Session = Depends(db.get_db),
-    _: None = Depends(require_schema_version),
 ):
-    store_embedding(patch_id, embedding.embedding)
-    obj = (
-        db_session.query(models.PatchEmbedding)
-        .filter(models.PatchEmbedding.patch_id == patch_id)
-        .first()
-    )
-    return obj
+    return _upsert_patch_embedding(db_session, patch_id, embedding.embedding)
 
 
-@router.delete("/{patch_id}", response_model=schemas.EmbeddingDeleteResponse)
+@_write_router.delete("/{patch_id}", response_model=schemas.EmbeddingDeleteResponse)
 def delete_embedding(
     patch_id: str,
     db_session: Session = Depends(db.get_db),
-    _: None = Depends(require_schema_version),
 ):
-    obj = (
-        db_session.query(models.PatchEmbedding)
-        .filter(models.PatchEmbedding.patch_id == patch_id)
-        .first()
-    )
+    obj = _get_patch_embedding(db_session, patch_id)
     if obj is None:
         raise HTTPException(status_code=404, detail="Embedding not found")
     db_session.delete(obj)
@@ -80,8 +151,11 @@ def delete_embedding(
     return schemas.EmbeddingDeleteResponse(status="deleted")
 
 
-@router.post("/query", response_model=list[str])
+@router.post("/query", response_model=list[str], openapi_extra=_json_body(_EMB_QUERY))
 def query_embeddings(
-    request: schemas.EmbeddingQuery,
+    request: schemas.EmbeddingQuery = Depends(_query_body),
 ):
-    return query_similar(request.embedding, top_k=request.top_k)
+    return query_similar(_as_vector(request.embedding), top_k=request.top_k)
+
+
+router.include_router(_write_router)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 """Router factory providing CRUD routers for common models."""
 
+from types import MappingProxyType
+
 from fastapi import Depends
 
 from app.utils.crud_router import create_crud_router
@@ -9,7 +11,6 @@ from app import security
 from app.models import (
     Tone,
     Haptic,
-    Control,
     Modulation,
     Shader,
     ShaderLib,
@@ -21,8 +22,6 @@ from app.schemas import (
     HapticCreate,
     HapticUpdate,
     Haptic as HapticSchema,
-    ControlCreate,
-    ControlResponse,
     ModulationCreate,
     ModulationUpdate,
     Modulation as ModulationSchema,
@@ -32,14 +31,22 @@ from app.schemas import (
     ShaderLibCreate,
     ShaderLib as ShaderLibSchema,
 )
-_dependency = {"dependencies": [Depends(security.verify_jwt)]}
+
+# The Control CRUD router is the one mounted at /controls; reuse it rather
+# than building a second router with different response shaping.
+from .controls import router as control_router
+
+# One shared, read-only ``Depends`` instance for every CRUD router so that no
+# router can mutate the dependency list seen by the others.
+_JWT_DEP = Depends(security.verify_jwt)
+_FROZEN_DEPS = MappingProxyType({"dependencies": (_JWT_DEP,)})
 
 tone_router = create_crud_router(
     Tone,
     ToneCreate,
     ToneUpdate,
     ToneSchema,
-    router_kwargs=_dependency,
+    router_kwargs=_FROZEN_DEPS,
 )
 
 haptic_router = create_crud_router(
@@ -47,15 +54,7 @@ haptic_router = create_crud_router(
     HapticCreate,
     HapticUpdate,
     HapticSchema,
-    router_kwargs=_dependency,
-)
-
-control_router = create_crud_router(
-    Control,
-    ControlCreate,
-    ControlCreate,
-    ControlResponse,
-    router_kwargs=_dependency,
+    router_kwargs=_FROZEN_DEPS,
 )
 
 modulation_router = create_crud_router(
@@ -63,7 +62,7 @@ modulation_router = create_crud_router(
     ModulationCreate,
     ModulationUpdate,
     ModulationSchema,
-    router_kwargs=_dependency,
+    router_kwargs=_FROZEN_DEPS,
 )
 
 shader_router = create_crud_router(
@@ -71,7 +70,7 @@ shader_router = create_crud_router(
     ShaderCreate,
     ShaderUpdate,
     ShaderSchema,
-    router_kwargs=_dependency,
+    router_kwargs=_FROZEN_DEPS,
 )
 
 shader_lib_router = create_crud_router(
@@ -79,7 +78,7 @@ shader_lib_router = create_crud_router(
     ShaderLibCreate,
     ShaderLibCreate,
     ShaderLibSchema,
-    router_kwargs=_dependency,
+    router_kwargs=_FROZEN_DEPS,
 )
 
 
@@ -19,7 +19,7 @@ from ...schemas.mcp.asset import (
     ValidateAssetResult,
 )
 from ...schemas.error import ErrorResponse
-from ...services.mcp_logger import log_mcp_command
+from ...services.mcp_log_queue import enqueue_mcp_command, enqueue_mcp_result
 from ...middleware.request_id import get_current_request_id
 from ...logging import get_logger
 from ...schema_version import require_schema_version
@@ -27,6 +27,20 @@ from ...schema_version import require_schema_version
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Parameter paths accepted by ``update_param``: the tuple keeps the order
+# reported back to clients, the frozenset serves the membership check.
+_VALID_PARAM_PATH_ORDER = (
+    "shader.u_time",
+    "tone.volume",
+    "haptic.intensity",
+    "shader.u_r",
+    "tone.frequency",
+)
+_VALID_PARAM_PATHS = frozenset(_VALID_PARAM_PATH_ORDER)
+
+# ``validate_asset`` requires at least one of these to be present and non-empty.
+_REQUIRED_ANY_COMPONENT = ("shader", "tone")
+
 
 @router.get(
     "/ping",
@@ -36,7 +50,7 @@ logger = get_logger(__name__)
     response_model=PingResponse,
     status_code=status.HTTP_200_OK,
 )
-def ping_asset() -> PingResponse:
+async def ping_asset() -> PingResponse:
     """Ping endpoint to verify MCP asset router is live."""
     # Return a plain dict; FastAPI will validate/serialize against PingResponse.
     # This minimizes any edge-case differences between model vs. dict responses
@@ -60,7 +74,7 @@ def ping_asset() -> PingResponse:
         500: {"description": "Internal server error", "model": ErrorResponse},
     },
 )
-def create_asset(
+async def create_asset(
     request_data: CreateAssetRequest,
     request: Request,
     db: Session = Depends(get_db),
@@ -70,14 +84,10 @@ def create_asset(
     request_id = get_current_request_id()
 
     try:
-        # Convert request to dict for processing
-        payload = request_data.model_dump()
-
         # Log the MCP command
-        log_id = log_mcp_command(
+        log_record = await enqueue_mcp_command(
             command_type="create_asset",
-            payload=payload,
-            status="pending",
+            payload=request_data.model_dump(),
             request_id=request_id,
             db=db,
         )
@@ -85,25 +95,24 @@ def create_asset(
         # For now, simulate asset creation (following CONSTRAINTS: route stubs are fine)
         mock_asset_id = f"asset_{uuid.uuid4().hex[:8]}"
 
-        result = CreateAssetResult(
+        # Result fields come from the validated request or are generated here, so
+        # the results skip validation; the response_model still checks them.
+        result = CreateAssetResult.model_construct(
             asset_id=mock_asset_id,
             status="created",
             components={
-                "tone": bool(payload.get("tone")),
-                "shader": bool(payload.get("shader")),
-                "haptic": bool(payload.get("haptic")),
+                "tone": bool(request_data.tone),
+                "shader": bool(request_data.shader),
+                "haptic": bool(request_data.haptic),
             },
         )
 
         # Update the log with success result
-        if log_id:
-            from ...services.mcp_logger import update_mcp_log
+        await enqueue_mcp_result(log_record, dict(result.__dict__), "success", db=db)
 
-            update_mcp_log(
-                log_id=log_id, result=result.model_dump(), status="success", db=db
-            )
-
-        return CreateAssetResponse(
+        # The result was built here from validated input, so skip a second
+        # validation pass; FastAPI still checks the response_model on the way out.
+        return CreateAssetResponse.model_construct(
             request_id=request_id,
             asset_id=mock_asset_id,
             status="success",
@@ -113,12 +122,8 @@ def create_asset(
 
     except Exception as e:
         # Log the error
-        if "log_id" in locals() and log_id:
-            from ...services.mcp_logger import update_mcp_log
-
-            update_mcp_log(
-                log_id=log_id, result={"error": str(e)}, status="error", db=db
-            )
+        if "log_record" in locals():
+            await enqueue_mcp_result(log_record, {"error": str(e)}, "error", db=db)
 
         logger.error("Asset creation failed", exc_info=e)
         raise HTTPException(
@@ -144,7 +149,7 @@ def create_asset(
         500: {"description": "Internal server error", "model": ErrorResponse},
     },
 )
-def update_param(
+async def update_param(
     request_data: UpdateParamRequest,
     request: Request,
     db: Session = Depends(get_db),
@@ -154,20 +159,18 @@ def update_param(
     request_id = get_current_request_id()
 
     try:
-        payload = request_data.model_dump()
+        asset_id = request_data.asset_id
 
         # Log the MCP command
-        log_id = log_mcp_command(
+        log_record = await enqueue_mcp_command(
             command_type="update_param",
-            payload=payload,
-            status="pending",
+            payload=request_data.model_dump(),
             request_id=request_id,
-            asset_id=payload.get("asset_id"),
+            asset_id=asset_id,
             db=db,
         )
 
         # Simulate asset lookup - in real implementation, check if asset exists
-        asset_id = payload["asset_id"]
         if asset_id.startswith("nonexistent_"):
             raise HTTPException(
                 status_code=404,
@@ -180,43 +183,31 @@ def update_param(
             )
 
         # Validate parameter path
-        path = payload["path"]
-        valid_paths = [
-            "shader.u_time",
-            "tone.volume",
-            "haptic.intensity",
-            "shader.u_r",
-            "tone.frequency",
-        ]
-        if path not in valid_paths:
+        path = request_data.path
+        if path not in _VALID_PARAM_PATHS:
             raise HTTPException(
                 status_code=422,
                 detail={
                     "error": "Invalid parameter path",
                     "request_id": request_id,
                     "path": path,
-                    "valid_paths": valid_paths,
+                    "valid_paths": list(_VALID_PARAM_PATH_ORDER),
                     "message": f"Parameter path '{path}' is not valid",
                 },
             )
 
-        result = UpdateParamResult(
+        result = UpdateParamResult.model_construct(
             asset_id=asset_id,
             path=path,
             old_value=0.0,  # Mock old value
-            new_value=payload["value"],
+            new_value=request_data.value,
             updated=True,
         )
 
         # Update log with success
-        if log_id:
-            from ...services.mcp_logger import update_mcp_log
+        await enqueue_mcp_result(log_record, dict(result.__dict__), "success", db=db)
 
-            update_mcp_log(
-                log_id=log_id, result=result.model_dump(), status="success", db=db
-            )
-
-        return UpdateParamResponse(
+        return UpdateParamResponse.model_construct(
             request_id=request_id,
             status="success",
             message="Parameter updated successfully",
@@ -249,7 +240,7 @@ def update_param(
         500: {"description": "Internal server error", "model": ErrorResponse},
     },
 )
-def apply_modulation(
+async def apply_modulation(
     request_data: ApplyModulationRequest,
     request: Request,
     db: Session = Depends(get_db),
@@ -259,21 +250,18 @@ def apply_modulation(
     request_id = get_current_request_id()
 
     try:
-        payload = request_data.model_dump()
+        asset_id = request_data.asset_id
+        modulation_id = request_data.modulation_id
 
         # Log the MCP command
-        log_id = log_mcp_command(
+        log_record = await enqueue_mcp_command(
             command_type="apply_modulation",
-            payload=payload,
-            status="pending",
+            payload=request_data.model_dump(),
             request_id=request_id,
-            asset_id=payload.get("asset_id"),
+            asset_id=asset_id,
             db=db,
         )
 
-        asset_id = payload["asset_id"]
-        modulation_id = payload["modulation_id"]
-
         # Check if asset exists
         if asset_id.startswith("nonexistent_"):
             raise HTTPException(
@@ -299,22 +287,17 @@ def apply_modulation(
                 },
             )
 
-        result = ApplyModulationResult(
+        result = ApplyModulationResult.model_construct(
             asset_id=asset_id,
             modulation_id=modulation_id,
-            definition=payload["definition"],
+            definition=request_data.definition,
             applied=True,
         )
 
         # Update log with success
-        if log_id:
-            from ...services.mcp_logger import update_mcp_log
+        await enqueue_mcp_result(log_record, dict(result.__dict__), "success", db=db)
 
-            update_mcp_log(
-                log_id=log_id, result=result.model_dump(), status="success", db=db
-            )
-
-        return ApplyModulationResponse(
+        return ApplyModulationResponse.model_construct(
             request_id=request_id,
             status="success",
             message="Modulation applied successfully",
@@ -344,7 +327,7 @@ def apply_modulation(
         500: {"description": "Internal server error", "model": ErrorResponse},
     },
 )
-def validate_asset(
+async def validate_asset(
     request_data: ValidateAssetRequest,
     request: Request,
     db: Session = Depends(get_db),
@@ -354,18 +337,15 @@ def validate_asset(
     request_id = get_current_request_id()
 
     try:
-        payload = request_data.model_dump()
-
         # Log the MCP command
-        log_id = log_mcp_command(
+        log_record = await enqueue_mcp_command(
             command_type="validate_asset",
-            payload=payload,
-            status="pending",
+            payload=request_data.model_dump(),
             request_id=request_id,
             db=db,
         )
 
-        asset_blob = payload["asset_blob"]
+        asset_blob = request_data.asset_blob
 
         # Basic validation
         validation_errors = []
@@ -373,7 +353,7 @@ def validate_asset(
         if not asset_blob.get("name"):
             validation_errors.append("Asset name is required")
 
-        if not asset_blob.get("shader") and not asset_blob.get("tone"):
+        if not any(asset_blob.get(key) for key in _REQUIRED_ANY_COMPONENT):
             validation_errors.append(
                 "Asset must have at least a shader or tone component"
             )
@@ -389,19 +369,14 @@ def validate_asset(
                 },
             )
 
-        result = ValidateAssetResult(
-            valid=True, components_found=list(asset_blob.keys()), validation_passed=True
+        result = ValidateAssetResult.model_construct(
+            valid=True, components_found=list(asset_blob), validation_passed=True
         )
 
         # Update log with success
-        if log_id:
-            from ...services.mcp_logger import update_mcp_log
-
-            update_mcp_log(
-                log_id=log_id, result=result.model_dump(), status="success", db=db
-            )
+        await enqueue_mcp_result(log_record, dict(result.__dict__), "success", db=db)
 
-        return ValidateAssetResponse(
+        return ValidateAssetResponse.model_construct(
             request_id=request_id,
             status="success",
             message="Asset validation passed",
@@ -1,9 +1,15 @@
+import threading
+from typing import Iterator
+
 from fastapi import APIRouter, Response, HTTPException, Body, Depends
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session, load_only, selectinload, undefer
 from app.utils.proto_converter import proto_to_asset, asset_to_proto
 from app.proto import asset_pb2
 from app import models
 import app.models.db as db
+from app.models.synesthetic_asset import component_load_options
 from app.services.asset_utils import format_nested_asset_response
 
 from app.schema_version import require_schema_version
@@ -11,20 +17,59 @@ from app.schema_version import require_schema_version
 
 router = APIRouter()
 
+_PROTO_MEDIA = "application/x-protobuf"
+_PROTO_RESPONSES = {200: {"content": {_PROTO_MEDIA: {}}}}
+
+
+def _proto_headers(proto_asset_id: int) -> dict[str, str]:
+    return {"Content-Disposition": f"attachment; filename=asset-{proto_asset_id}.pb"}
+
+
+def _proto_response(blob: bytes, proto_asset_id: int) -> Response:
+    return Response(
+        content=blob, media_type=_PROTO_MEDIA, headers=_proto_headers(proto_asset_id)
+    )
+
+
+# Blobs above this size are streamed back in chunks rather than copied into a
+# single response body.
+_STREAM_THRESHOLD = 1 << 20
+_STREAM_CHUNK_SIZE = 64 << 10
+
+
+_tls = threading.local()
+
+
+def _parse_asset(body: bytes) -> asset_pb2.Asset:
+    """Parse ``body`` into this thread's scratch ``Asset`` message.
+
+    The message is reused across requests, so callers must copy what they need
+    (``proto_to_asset`` does) before the thread parses the next body.
+    """
+    proto_obj = getattr(_tls, "asset", None)
+    if proto_obj is None:
+        proto_obj = _tls.asset = asset_pb2.Asset()
+    proto_obj.ParseFromString(body)
+    return proto_obj
+
+
+def _iter_chunks(blob: bytes) -> Iterator[bytes]:
+    view = memoryview(blob)
+    for start in range(0, len(view), _STREAM_CHUNK_SIZE):
+        yield view[start : start + _STREAM_CHUNK_SIZE]
+
 
 @router.post(
     "/",
     response_class=Response,
-    responses={200: {"content": {"application/x-protobuf": {}}}},
+    responses=_PROTO_RESPONSES,
 )
 def create_asset_proto(
-    body: bytes = Body(..., media_type="application/x-protobuf"),
+    body: bytes = Body(..., media_type=_PROTO_MEDIA),
     db: Session = Depends(db.get_db),
     _: None = Depends(require_schema_version),
 ) -> Response:
-    proto_obj = asset_pb2.Asset()
-    proto_obj.ParseFromString(body)
-    asset_data = proto_to_asset(proto_obj)
+    asset_data = proto_to_asset(_parse_asset(body))
 
     db_obj = models.ProtoAsset(
         name=asset_data.get("name", ""),
@@ -33,31 +78,29 @@ def create_asset_proto(
     )
     db.add(db_obj)
     db.commit()
-    db.refresh(db_obj)
 
-    return Response(
-        content=db_obj.proto_blob,
-        media_type="application/x-protobuf",
-        headers={
-            "Content-Disposition": f"attachment; filename=asset-{db_obj.proto_asset_id}.pb"
-        },
-    )
+    return _proto_response(body, db_obj.proto_asset_id)
 
 
 @router.post(
     "/from-synesthetic/{syn_asset_id}",
     response_class=Response,
-    responses={200: {"content": {"application/x-protobuf": {}}}},
+    responses=_PROTO_RESPONSES,
 )
 def create_from_synesthetic(
     syn_asset_id: int,
     db: Session = Depends(db.get_db),
     _: None = Depends(require_schema_version),
 ) -> Response:
-    syn_asset = (
-        db.query(models.SynestheticAsset)
-        .filter(models.SynestheticAsset.synesthetic_asset_id == syn_asset_id)
-        .first()
+    # One SELECT for the asset plus one batched SELECT per component, instead
+    # of a lazy load for every relationship touched while formatting.
+    syn_asset = db.get(
+        models.SynestheticAsset,
+        syn_asset_id,
+        options=[
+            *component_load_options(),
+            selectinload(models.SynestheticAsset.rule_bundle),
+        ],
     )
     if syn_asset is None:
         raise HTTPException(status_code=404, detail="Synesthetic asset not found")
@@ -72,10 +115,12 @@ def create_from_synesthetic(
     )
     proto_bytes = asset_to_proto(asset_dict).SerializeToString()
 
-    db_obj = (
-        db.query(models.ProtoAsset)
-        .filter(models.ProtoAsset.proto_asset_id == syn_asset_id)
-        .first()
+    # Existence probe only: every column is overwritten below, so load just the
+    # primary key.
+    db_obj = db.get(
+        models.ProtoAsset,
+        syn_asset_id,
+        options=[load_only(models.ProtoAsset.proto_asset_id)],
     )
     if db_obj is None:
         db_obj = models.ProtoAsset(
@@ -90,86 +135,71 @@ def create_from_synesthetic(
         db_obj.description = asset_dict.get("description")
         db_obj.proto_blob = proto_bytes
     db.commit()
-    return Response(
-        content=db_obj.proto_blob,
-        media_type="application/x-protobuf",
-        headers={
-            "Content-Disposition": f"attachment; filename=asset-{db_obj.proto_asset_id}.pb"
-        },
-    )
+    return _proto_response(proto_bytes, db_obj.proto_asset_id)
 
 
 @router.get(
     "/{asset_id}",
     response_class=Response,
-    responses={200: {"content": {"application/x-protobuf": {}}}},
+    responses=_PROTO_RESPONSES,
 )
 def get_asset_proto(asset_id: int, db: Session = Depends(db.get_db)) -> Response:
-    db_obj = (
-        db.query(models.ProtoAsset)
-        .filter(models.ProtoAsset.proto_asset_id == asset_id)
-        .first()
+    db_obj = db.get(
+        models.ProtoAsset, asset_id, options=[undefer(models.ProtoAsset.proto_blob)]
     )
     if db_obj is None:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return Response(
-        content=db_obj.proto_blob,
-        media_type="application/x-protobuf",
-        headers={
-            "Content-Disposition": f"attachment; filename=asset-{db_obj.proto_asset_id}.pb"
-        },
-    )
+    blob = db_obj.proto_blob
+    if len(blob) > _STREAM_THRESHOLD:
+        headers = _proto_headers(db_obj.proto_asset_id)
+        headers["Content-Length"] = str(len(blob))
+        return StreamingResponse(
+            _iter_chunks(blob), media_type=_PROTO_MEDIA, headers=headers
+        )
+    return _proto_response(blob, db_obj.proto_asset_id)
 
 
 @router.put(
     "/{asset_id}",
     response_class=Response,
-    responses={200: {"content": {"application/x-protobuf": {}}}},
+    responses=_PROTO_RESPONSES,
 )
 def update_asset_proto(
     asset_id: int,
-    body: bytes = Body(..., media_type="application/x-protobuf"),
+    body: bytes = Body(..., media_type=_PROTO_MEDIA),
     db: Session = Depends(db.get_db),
     _: None = Depends(require_schema_version),
 ) -> Response:
-    db_obj = (
-        db.query(models.ProtoAsset)
-        .filter(models.ProtoAsset.proto_asset_id == asset_id)
-        .first()
+    asset_data = proto_to_asset(_parse_asset(body))
+
+    # One UPDATE ... RETURNING in place of SELECT, flush and commit.
+    proto_asset_id = db.scalar(
+        update(models.ProtoAsset)
+        .where(models.ProtoAsset.proto_asset_id == asset_id)
+        .values(
+            name=asset_data.get("name", ""),
+            description=asset_data.get("description"),
+            proto_blob=body,
+        )
+        .returning(models.ProtoAsset.proto_asset_id)
     )
-    if db_obj is None:
+    if proto_asset_id is None:
         raise HTTPException(status_code=404, detail="Asset not found")
-
-    proto_obj = asset_pb2.Asset()
-    proto_obj.ParseFromString(body)
-    asset_data = proto_to_asset(proto_obj)
-
-    db_obj.name = asset_data.get("name", "")
-    db_obj.description = asset_data.get("description")
-    db_obj.proto_blob = body
     db.commit()
-    db.refresh(db_obj)
 
-    return Response(
-        content=db_obj.proto_blob,
-        media_type="application/x-protobuf",
-        headers={
-            "Content-Disposition": f"attachment; filename=asset-{db_obj.proto_asset_id}.pb"
-        },
-    )
+    return _proto_response(body, proto_asset_id)
 
 
 @router.delete("/{asset_id}")
 def delete_asset_proto(
     asset_id: int, db: Session = Depends(db.get_db), _: None = Depends(require_schema_version)
 ):
-    db_obj = (
-        db.query(models.ProtoAsset)
-        .filter(models.ProtoAsset.proto_asset_id == asset_id)
-        .first()
+    deleted = db.scalar(
+        delete(models.ProtoAsset)
+        .where(models.ProtoAsset.proto_asset_id == asset_id)
+        .returning(models.ProtoAsset.proto_asset_id)
     )
-    if db_obj is None:
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Asset not found")
-    db.delete(db_obj)
     db.commit()
     return {"status": "deleted"}
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.models.db import get_db
@@ -15,7 +16,25 @@ from app.schema_version import require_schema_version
 router = APIRouter()
 
 
-@router.post("/", response_model=RuleBundleSchema)
+def _bundle_response(obj: models.RuleBundle) -> ORJSONResponse:
+    """Serialize a stored bundle without re-validating it.
+
+    Rows are written from a validated ``RuleBundleSchema``, so the columns are
+    dumped as-is; ``response_model`` on the routes only documents the shape.
+    """
+    content: Dict[str, Any] = {
+        "id": obj.id,
+        "name": obj.name,
+        "description": obj.description,
+        "meta_info": obj.meta_info,
+        "rules": obj.rules,
+        "created_at": obj.created_at,
+        "updated_at": obj.updated_at,
+    }
+    return ORJSONResponse(content)
+
+
+@router.post("/", response_model=RuleBundleSchema, response_class=ORJSONResponse)
 def create_bundle(
     bundle: RuleBundleSchema,
     db: Session = Depends(get_db),
@@ -26,29 +45,30 @@ def create_bundle(
     db.add(obj)
     db.commit()
     db.refresh(obj)
-    # Validate and shape response via external schema
-    return RuleBundleSchema.model_validate(obj).model_dump()
+    return _bundle_response(obj)
 
 
-@router.get("/{bundle_id}", response_model=RuleBundleSchema)
+@router.get(
+    "/{bundle_id}", response_model=RuleBundleSchema, response_class=ORJSONResponse
+)
 def get_bundle(
     bundle_id: int,
     db: Session = Depends(get_db),
 ):
     """Retrieve a rule bundle by ID."""
-    obj = db.query(models.RuleBundle).get(bundle_id)
+    obj = db.get(models.RuleBundle, bundle_id)
     if not obj:
         raise HTTPException(status_code=404, detail="RuleBundle not found")
-    return RuleBundleSchema.model_validate(obj).model_dump()
+    return _bundle_response(obj)
 
 
-@router.post("/import", response_model=RuleBundleSchema)
+@router.post("/import", response_model=RuleBundleSchema, response_class=ORJSONResponse)
 def import_bundle(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     _: None = Depends(require_schema_version),
 ):
     """Import a rule bundle from an uploaded JSON file."""
-    data = json.load(file.file)
-    schema = RuleBundleSchema(**data)
+    # Parse and validate the upload in one pass, without an intermediate dict.
+    schema = RuleBundleSchema.model_validate_json(file.file.read())
     return create_bundle(schema, db)
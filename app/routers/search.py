@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 
 from app import schemas, security
-from app.services import similar_assets
+from app.services.search_batcher import asset_search_batcher
 from app.schema_version import require_schema_version
 
 router = APIRouter(
@@ -10,8 +10,9 @@ router = APIRouter(
 
 
 @router.post("/assets", response_model=list[int])
-def search_assets(
+async def search_assets(
     query: schemas.EmbeddingQuery, _: None = Depends(require_schema_version)
 ) -> list[int]:
     """Return asset IDs most similar to ``query.embedding`` (client-supplied vector)."""
-    return similar_assets(query.embedding, top_k=query.top_k)
+    # Concurrent queries are coalesced and scored together off the event loop.
+    return await asset_search_batcher.submit(query.embedding, query.top_k)
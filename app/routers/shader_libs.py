@@ -1,6 +1,12 @@
 """Routes for shader library utilities."""
 
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+
 from fastapi import Depends, HTTPException
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from .factory import shader_lib_router as router
@@ -16,6 +22,52 @@ from app.shaderlib import (
 
 router.dependencies.append(Depends(require_auth))
 
+# Parsed libraries and per-helper results, keyed by ``(shaderlib_id,
+# updated_at)`` so that any write to a row changes the key and old entries age
+# out of the LRU instead of being served.
+_CACHE_SIZE = 512
+_schema_cache: "OrderedDict[Hashable, ShaderLibSchema]" = OrderedDict()
+_effective_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+_cache_lock = Lock()
+
+_LIB_VERSION = select(ShaderLibModel.updated_at).where(
+    ShaderLibModel.shaderlib_id == bindparam("id")
+)
+
+
+def _cache_get(cache: OrderedDict, key: Hashable) -> Any:
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: Hashable, value: Any) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _load_lib_schema(
+    db: Session, id: int, version: Tuple[int, Optional[datetime]]
+) -> ShaderLibSchema:
+    """Return the validated library, parsing ``definition`` only on a miss."""
+    cacheable = version[1] is not None
+    if cacheable:
+        lib_schema = _cache_get(_schema_cache, version)
+        if lib_schema is not None:
+            return lib_schema
+    definition = db.scalar(
+        select(ShaderLibModel.definition).where(ShaderLibModel.shaderlib_id == id)
+    )
+    lib_schema = ShaderLibSchema.model_validate(definition)
+    if cacheable:
+        _cache_put(_schema_cache, version, lib_schema)
+    return lib_schema
+
 
 @router.get(
     "/{id}/helpers/{name}/effective",
@@ -93,11 +145,18 @@ router.dependencies.append(Depends(require_auth))
 )
 def get_effective_helper(id: int, name: str, db: Session = Depends(get_db)):
     """Return merged uniforms and input parameters for a helper."""
-    lib_row = db.query(ShaderLibModel).filter_by(shaderlib_id=id).first()
-    if not lib_row:
+    row = db.execute(_LIB_VERSION, {"id": id}).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="shader library not found")
 
-    lib_schema = ShaderLibSchema.model_validate(lib_row.definition)
+    version = (id, row.updated_at)
+    result_key = (*version, name)
+    if row.updated_at is not None:
+        cached = _cache_get(_effective_cache, result_key)
+        if cached is not None:
+            return cached
+
+    lib_schema = _load_lib_schema(db, id, version)
 
     if name not in lib_schema.helpers:
         raise HTTPException(
@@ -107,11 +166,14 @@ def get_effective_helper(id: int, name: str, db: Session = Depends(get_db)):
 
     effective = collect_effective_inputs(lib_schema, name)
     template = check_template_demonstrates_helper(lib_schema, name)
-    return {
+    result = {
         "uniforms": effective["uniforms"],
         "inputParametersSpec": effective["inputParametersSpec"],
         "template": template,
     }
+    if row.updated_at is not None:
+        _cache_put(_effective_cache, result_key, result)
+    return result
 
 
 __all__ = ["router"]
@@ -1,7 +1,9 @@
 """CRUD routes for Shader using external schema with formatted responses."""
 
 from fastapi import APIRouter, Depends, HTTPException, Body, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, raiseload
 
 from app import security
 from app.models.db import get_db
@@ -17,8 +19,12 @@ router = APIRouter(
     tags=["shaders"], dependencies=[Depends(security.verify_jwt)]
 )
 
+# ``format_shader_response`` already validates through the SSOT shader model and
+# dumps in JSON mode, so handlers return ``ORJSONResponse`` directly and FastAPI
+# skips a second validation pass; ``response_model`` only documents the shape.
 
-@router.post("/", response_model=ShaderAPIResponse)
+
+@router.post("/", response_model=ShaderAPIResponse, response_class=ORJSONResponse)
 def create_shader(
     payload: ShaderSchema = Body(...),
     db: Session = Depends(get_db),
@@ -32,47 +38,46 @@ def create_shader(
         result = asset_utils.format_shader_response(instance)
         if result is None:
             raise ValueError("Failed to serialize shader")
-        return result
+        return ORJSONResponse(result)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
 
 
-@router.get("/{shader_id}", response_model=ShaderAPIResponse)
+@router.get("/{shader_id}", response_model=ShaderAPIResponse, response_class=ORJSONResponse)
 def get_shader(
     shader_id: int,
     db: Session = Depends(get_db),
 ):
-    instance = db.query(models.Shader).filter(models.Shader.shader_id == shader_id).first()
+    instance = db.get(models.Shader, shader_id)
     if instance is None:
         raise HTTPException(status_code=404, detail="Shader not found")
     result = asset_utils.format_shader_response(instance)
     if result is None:
         raise HTTPException(status_code=500, detail="Internal server error")
-    return result
+    return ORJSONResponse(result)
 
 
-@router.get("/", response_model=list[ShaderAPIResponse])
+@router.get("/", response_model=list[ShaderAPIResponse], response_class=ORJSONResponse)
 def list_shaders(
     db: Session = Depends(get_db),
 ):
-    instances = db.query(models.Shader).all()
-    items = []
-    for inst in instances:
-        res = asset_utils.format_shader_response(inst)
-        if res is None:
-            raise HTTPException(status_code=500, detail="Internal server error")
-        items.append(res)
-    return items
+    # Every field the formatter reads is a column on ``shaders``; raiseload
+    # keeps a future relationship from silently turning this into an N+1.
+    instances = db.scalars(select(models.Shader).options(raiseload("*"))).all()
+    items = list(map(asset_utils.format_shader_response, instances))
+    if None in items:
+        raise HTTPException(status_code=500, detail="Internal server error")
+    return ORJSONResponse(items)
 
 
-@router.put("/{shader_id}", response_model=ShaderAPIResponse)
+@router.put("/{shader_id}", response_model=ShaderAPIResponse, response_class=ORJSONResponse)
 def update_shader(
     shader_id: int,
     payload: ShaderUpdate = Body(...),
     db: Session = Depends(get_db),
     _: None = Depends(require_schema_version),
 ):
-    instance = db.query(models.Shader).filter(models.Shader.shader_id == shader_id).first()
+    instance = db.get(models.Shader, shader_id)
     if instance is None:
         raise HTTPException(status_code=404, detail="Shader not found")
     for key, value in payload.model_dump(exclude_unset=True).items():
@@ -82,16 +87,16 @@ def update_shader(
     res = asset_utils.format_shader_response(instance)
     if res is None:
         raise HTTPException(status_code=500, detail="Internal server error")
-    return res
+    return ORJSONResponse(res)
 
 
-@router.delete("/{shader_id}", response_model=ShaderAPIResponse)
+@router.delete("/{shader_id}", response_model=ShaderAPIResponse, response_class=ORJSONResponse)
 def delete_shader(
     shader_id: int,
     db: Session = Depends(get_db),
     _: None = Depends(require_schema_version),
 ):
-    instance = db.query(models.Shader).filter(models.Shader.shader_id == shader_id).first()
+    instance = db.get(models.Shader, shader_id)
     if instance is None:
         raise HTTPException(status_code=404, detail="Shader not found")
     res = asset_utils.format_shader_response(instance)
@@ -99,7 +104,7 @@ def delete_shader(
         raise HTTPException(status_code=500, detail="Internal server error")
     db.delete(instance)
     db.commit()
-    return res
+    return ORJSONResponse(res)
 
 
 __all__ = ["router"]
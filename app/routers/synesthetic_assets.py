@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy.orm import Session, selectinload, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 from typing import List
 from pydantic import ValidationError
 from app.logging import get_logger
@@ -9,7 +9,7 @@ import app.models.db as db
 from app.services import asset_utils
 
 from synesthetic_schemas.synesthetic_asset import SynestheticAsset as ExternalSynestheticAsset
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.schema_version import check_schema_header, require_schema_version
 
 
@@ -24,6 +24,24 @@ logger = get_logger(__name__)
 ## Removed patch storage helpers (deprecated)
 
 
+def _insert_modulations(db: Session, asset_name: str, modulations: list) -> int:
+    """Store an asset's modulation list and return the new ``modulation_id``.
+
+    A Core ``INSERT ... RETURNING`` skips the unit of work; the row is not
+    read back through the ORM on these paths, only its key is needed.
+    """
+    return db.scalar(
+        insert(models.Modulation)
+        .values(
+            name=f"{asset_name} Modulations",
+            description=None,
+            meta_info={},
+            modulations=modulations,
+        )
+        .returning(models.Modulation.modulation_id)
+    )
+
+
 @router.post(
     "/",
     response_model=schemas.SynestheticAssetResponse,
@@ -41,16 +59,7 @@ def create_synesthetic_asset(
 
     modulation_id = None
     if modulations:
-        db_mod = models.Modulation(
-            name=f"{asset.name} Modulations",
-            description=None,
-            meta_info={},
-            modulations=modulations,
-        )
-        db.add(db_mod)
-        db.commit()
-        db.refresh(db_mod)
-        modulation_id = db_mod.modulation_id
+        modulation_id = _insert_modulations(db, asset.name, modulations)
 
     asset_data["meta_info"] = meta_info
     if modulation_id is not None:
@@ -81,11 +90,13 @@ def create_nested_synesthetic_asset(
     shader_id = None
     db_shader = None
     if asset.shader:
-        shader_data = asset.shader.model_dump(mode="json")
+        # Shader and haptic models hold only JSON-native values, so the plain
+        # Python dump is already storable. Tone, control, modulations and the
+        # asset itself carry Enum members and datetimes and keep mode="json".
+        shader_data = asset.shader.model_dump()
         db_shader = models.Shader(**shader_data)
         db.add(db_shader)
-        db.commit()
-        db.refresh(db_shader)
+        db.flush()
         shader_id = db_shader.shader_id
 
     # Create control if provided
@@ -115,8 +126,7 @@ def create_nested_synesthetic_asset(
                 control_parameters=control_data.get("control_parameters", []),
             )
             db.add(db_control)
-            db.commit()
-            db.refresh(db_control)
+            db.flush()
         control_id = db_control.control_id
     # Handle controls section if present in the asset dict
     elif hasattr(asset, "controls") and asset.controls:
@@ -149,8 +159,7 @@ def create_nested_synesthetic_asset(
                     control_parameters=controls_list,
                 )
                 db.add(control_obj)
-                db.commit()
-                db.refresh(control_obj)
+                db.flush()
                 control_id = control_obj.control_id
 
     # Create tone if provided
@@ -186,19 +195,17 @@ def create_nested_synesthetic_asset(
 
         db_tone = models.Tone(**db_tone_data)
         db.add(db_tone)
-        db.commit()
-        db.refresh(db_tone)
+        db.flush()
         tone_id = db_tone.tone_id
 
     # Create haptic if provided
     haptic_id = None
     db_haptic = None
     if asset.haptic:
-        haptic_data = asset.haptic.model_dump(mode="json")
+        haptic_data = asset.haptic.model_dump()
         db_haptic = models.Haptic(**haptic_data)
         db.add(db_haptic)
-        db.commit()
-        db.refresh(db_haptic)
+        db.flush()
         haptic_id = db_haptic.haptic_id
 
     # Create synesthetic asset
@@ -213,16 +220,7 @@ def create_nested_synesthetic_asset(
             ]
         except Exception:
             mods = asset.modulations
-        db_mod = models.Modulation(
-            name=f"{asset.name} Modulations",
-            description=None,
-            meta_info={},
-            modulations=mods,
-        )
-        db.add(db_mod)
-        db.commit()
-        db.refresh(db_mod)
-        modulation_id = db_mod.modulation_id
+        modulation_id = _insert_modulations(db, asset.name, mods)
 
     db_asset = models.SynestheticAsset(
         name=asset.name,
@@ -236,10 +234,11 @@ def create_nested_synesthetic_asset(
     )
 
     db.add(db_asset)
-    db.commit()
-    db.refresh(db_asset)
+    db.flush()
 
-    # Format response with components included
+    # Format response with components included. Built before the commit so the
+    # freshly flushed objects are read as-is instead of being expired and
+    # reloaded.
     response = asset_utils.format_nested_asset_response(
         db_asset,
         db_shader,
@@ -258,6 +257,9 @@ def create_nested_synesthetic_asset(
     ):
         response["control_parameters"] = asset.control_parameters
 
+    # Components are only flushed above, so everything commits (or, if any
+    # step raised, is rolled back when the session closes) as one transaction.
+    db.commit()
     return response
 
 
@@ -284,47 +286,74 @@ def get_nested_synesthetic_asset(
     if asset is None:
         raise HTTPException(status_code=404, detail="Synesthetic asset not found")
 
-    shader = asset.shader
-    control = asset.control
-    tone = asset.tone
-    haptic = asset.haptic
+    return _nested_asset_response(asset)
+
+
+def _nested_asset_response(asset: models.SynestheticAsset) -> ORJSONResponse:
+    """Nested response for ``asset`` built from its loaded components."""
     modulations = asset.modulation.modulations if asset.modulation else None
 
     response = asset_utils.format_nested_asset_response(
         asset,
-        shader,
-        control,
-        tone,
-        haptic,
+        asset.shader,
+        asset.control,
+        asset.tone,
+        asset.haptic,
         modulations,
     )
 
-    # Return stable nested response as JSON to stay permissive
-    return JSONResponse(content=jsonable_encoder(response), status_code=200)
+    # Return stable nested response as JSON to stay permissive; orjson encodes
+    # the datetimes directly, so no jsonable_encoder pass is needed.
+    return ORJSONResponse(content=response, status_code=200)
 
 
-@router.get(
-    "/{asset_id}",
-    response_model=schemas.SynestheticAssetResponse,
-    response_model_exclude_none=True,
-)
-def get_synesthetic_asset(
-    asset_id: int,
-    db: Session = Depends(db.get_db),
-    token: dict | None = Depends(security.verify_jwt),
-):
-    asset = (
+def _get_asset_for_update(db: Session, asset_id: int) -> models.SynestheticAsset:
+    """Load ``asset_id`` with every component the nested response reads.
+
+    The PUT handlers edit the component in place and answer from this same
+    object, so no second query is needed to build the response.
+    """
+    db_asset = (
         db.query(models.SynestheticAsset)
-        .options(joinedload(models.SynestheticAsset.modulation))
+        .options(
+            joinedload(models.SynestheticAsset.shader),
+            joinedload(models.SynestheticAsset.control),
+            joinedload(models.SynestheticAsset.tone),
+            joinedload(models.SynestheticAsset.haptic),
+            joinedload(models.SynestheticAsset.modulation),
+        )
         .filter(models.SynestheticAsset.synesthetic_asset_id == asset_id)
         .first()
     )
-    if asset is None:
+    if db_asset is None:
         raise HTTPException(status_code=404, detail="Synesthetic asset not found")
+    return db_asset
+
+
+# Upper bound on one list page, so a single request cannot pull the table.
+_MAX_LIST_LIMIT = 1000
+
+# Columns read by ``_asset_summary``; ``modulation_id`` feeds the selectinload.
+_SUMMARY_COLUMNS = (
+    models.SynestheticAsset.name,
+    models.SynestheticAsset.description,
+    models.SynestheticAsset.created_at,
+    models.SynestheticAsset.updated_at,
+    models.SynestheticAsset.meta_info,
+    models.SynestheticAsset.shader_id,
+    models.SynestheticAsset.control_id,
+    models.SynestheticAsset.tone_id,
+    models.SynestheticAsset.haptic_id,
+    models.SynestheticAsset.modulation_id,
+)
 
-    modulations = asset.modulation.modulations if asset.modulation else None
 
-    # Create a modified version of the asset with properly structured fields
+def _asset_summary(asset: models.SynestheticAsset) -> dict:
+    """Flat response fields for ``asset``, modulations lifted from its component.
+
+    Returned as a plain dict: the route's ``response_model`` validates it once,
+    so building a ``SynestheticAssetResponse`` here would validate twice.
+    """
     response_data = {
         "synesthetic_asset_id": asset.synesthetic_asset_id,
         "name": asset.name,
@@ -339,7 +368,7 @@ def get_synesthetic_asset(
         if meta_info:
             response_data["meta_info"] = meta_info
 
-    # If we found modulations, add them to the response
+    modulations = asset.modulation.modulations if asset.modulation else None
     if modulations:
         response_data["modulations"] = modulations
 
@@ -353,8 +382,28 @@ def get_synesthetic_asset(
     if asset.haptic_id:
         response_data["haptic_id"] = asset.haptic_id
 
-    # Create a Pydantic model for the response
-    return schemas.SynestheticAssetResponse(**response_data)
+    return response_data
+
+
+@router.get(
+    "/{asset_id}",
+    response_model=schemas.SynestheticAssetResponse,
+    response_model_exclude_none=True,
+)
+def get_synesthetic_asset(
+    asset_id: int,
+    db: Session = Depends(db.get_db),
+    token: dict | None = Depends(security.verify_jwt),
+):
+    asset = db.get(
+        models.SynestheticAsset,
+        asset_id,
+        options=[selectinload(models.SynestheticAsset.modulation)],
+    )
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Synesthetic asset not found")
+
+    return _asset_summary(asset)
 
 
 @router.get(
@@ -363,51 +412,27 @@ def get_synesthetic_asset(
     response_model_exclude_none=True,
 )
 def get_synesthetic_assets(
-    db: Session = Depends(db.get_db), token: dict | None = Depends(security.verify_jwt)
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=_MAX_LIST_LIMIT),
+    db: Session = Depends(db.get_db),
+    token: dict | None = Depends(security.verify_jwt),
 ):
+    """List assets in id order, ``limit`` (default 100, at most 1000) at a time."""
+    # selectinload fetches each distinct modulation once in a second IN query
+    # instead of widening every asset row with the modulation's JSON columns.
+    # load_only leaves out the columns the summary never reads.
     assets = (
         db.query(models.SynestheticAsset)
-        .options(joinedload(models.SynestheticAsset.modulation))
+        .options(
+            load_only(*_SUMMARY_COLUMNS),
+            selectinload(models.SynestheticAsset.modulation),
+        )
+        .order_by(models.SynestheticAsset.synesthetic_asset_id)
+        .offset(offset)
+        .limit(limit)
         .all()
     )
-
-    # Process each asset to ensure modulations are properly extracted
-    formatted_assets = []
-    for asset in assets:
-        modulations = asset.modulation.modulations if asset.modulation else None
-
-        # Create a response with basic asset fields
-        response_data = {
-            "synesthetic_asset_id": asset.synesthetic_asset_id,
-            "name": asset.name,
-            "description": asset.description,
-            "created_at": asset.created_at,
-            "updated_at": asset.updated_at,
-        }
-
-        if asset.meta_info:
-            meta_info = asset.meta_info.copy()
-            meta_info.pop("modulations", None)
-            if meta_info:
-                response_data["meta_info"] = meta_info
-
-        # Add modulations if they exist
-        if modulations:
-            response_data["modulations"] = modulations
-
-        # Include component IDs if they exist
-        if asset.shader_id:
-            response_data["shader_id"] = asset.shader_id
-        if asset.control_id:
-            response_data["control_id"] = asset.control_id
-        if asset.tone_id:
-            response_data["tone_id"] = asset.tone_id
-        if asset.haptic_id:
-            response_data["haptic_id"] = asset.haptic_id
-
-        formatted_assets.append(schemas.SynestheticAssetResponse(**response_data))
-
-    return formatted_assets
+    return [_asset_summary(asset) for asset in assets]
 
 
 @router.get(
@@ -524,21 +549,11 @@ def update_asset_shader(
     _: None = Depends(require_schema_version),
 ):
     """Update the shader component for a synesthetic asset."""
-    db_asset = (
-        db.query(models.SynestheticAsset)
-        .filter(models.SynestheticAsset.synesthetic_asset_id == asset_id)
-        .first()
-    )
-    if db_asset is None:
-        raise HTTPException(status_code=404, detail="Synesthetic asset not found")
+    db_asset = _get_asset_for_update(db, asset_id)
     if not db_asset.shader_id:
         raise HTTPException(status_code=404, detail="Shader not found for asset")
 
-    db_shader = (
-        db.query(models.Shader)
-        .filter(models.Shader.shader_id == db_asset.shader_id)
-        .first()
-    )
+    db_shader = db_asset.shader
     if db_shader is None:
         raise HTTPException(status_code=404, detail="Shader not found")
 
@@ -547,7 +562,7 @@ def update_asset_shader(
     db.commit()
     db.refresh(db_shader)
 
-    return get_nested_synesthetic_asset(asset_id, db=db, token=None)
+    return _nested_asset_response(db_asset)
 
 
 @router.put(
@@ -563,19 +578,11 @@ def update_asset_tone(
     _: None = Depends(require_schema_version),
 ):
     """Update the tone component for a synesthetic asset."""
-    db_asset = (
-        db.query(models.SynestheticAsset)
-        .filter(models.SynestheticAsset.synesthetic_asset_id == asset_id)
-        .first()
-    )
-    if db_asset is None:
-        raise HTTPException(status_code=404, detail="Synesthetic asset not found")
+    db_asset = _get_asset_for_update(db, asset_id)
     if not db_asset.tone_id:
         raise HTTPException(status_code=404, detail="Tone not found for asset")
 
-    db_tone = (
-        db.query(models.Tone).filter(models.Tone.tone_id == db_asset.tone_id).first()
-    )
+    db_tone = db_asset.tone
     if db_tone is None:
         raise HTTPException(status_code=404, detail="Tone not found")
 
@@ -584,7 +591,7 @@ def update_asset_tone(
     db.commit()
     db.refresh(db_tone)
 
-    return get_nested_synesthetic_asset(asset_id, db=db, token=None)
+    return _nested_asset_response(db_asset)
 
 
 @router.put(
@@ -600,21 +607,11 @@ def update_asset_haptic(
     _: None = Depends(require_schema_version),
 ):
     """Update the haptic component for a synesthetic asset."""
-    db_asset = (
-        db.query(models.SynestheticAsset)
-        .filter(models.SynestheticAsset.synesthetic_asset_id == asset_id)
-        .first()
-    )
-    if db_asset is None:
-        raise HTTPException(status_code=404, detail="Synesthetic asset not found")
+    db_asset = _get_asset_for_update(db, asset_id)
     if not db_asset.haptic_id:
         raise HTTPException(status_code=404, detail="Haptic not found for asset")
 
-    db_haptic = (
-        db.query(models.Haptic)
-        .filter(models.Haptic.haptic_id == db_asset.haptic_id)
-        .first()
-    )
+    db_haptic = db_asset.haptic
     if db_haptic is None:
         raise HTTPException(status_code=404, detail="Haptic not found")
 
@@ -623,7 +620,7 @@ def update_asset_haptic(
     db.commit()
     db.refresh(db_haptic)
 
-    return get_nested_synesthetic_asset(asset_id, db=db, token=None)
+    return _nested_asset_response(db_asset)
 
 
 ## Patch preview/apply routes removed (repository now serves CRUD only)
@@ -14,12 +14,21 @@ from app.services import asset_utils
 router = APIRouter()
 logger = get_logger(__name__)
 
-_ALLOWED_FIELDS = {c.key for c in inspect(models.Tone).mapper.column_attrs}
+_ALLOWED_FIELDS = frozenset(c.key for c in inspect(models.Tone).mapper.column_attrs)
+_SYNTH_TYPES = frozenset(st.value for st in SynthType)
 
 
 def _filter_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     """Return a dict containing only keys valid for :class:`Tone`."""
-    return {k: v for k, v in data.items() if k in _ALLOWED_FIELDS}
+    # dict_keys & frozenset intersects in C instead of testing key by key.
+    return {k: data[k] for k in data.keys() & _ALLOWED_FIELDS}
+
+
+def _synth_type(synth: Any) -> Any:
+    """Return the ``type`` of a synth given as a dict or a model."""
+    if isinstance(synth, dict):
+        return synth.get("type")
+    return getattr(synth, "type", None)
 
 
 def tone_to_response(db_tone: models.Tone) -> dict:
@@ -42,7 +51,9 @@ def tone_to_response(db_tone: models.Tone) -> dict:
 
 def apply_update(db_tone: models.Tone, payload: schemas.ToneUpdate) -> None:
     """Apply a ``ToneUpdate`` payload to a :class:`models.Tone`."""
-    for key, value in _filter_fields(payload.model_dump(exclude_unset=True)).items():
+    # Dump only the fields that were set and map to columns, not the whole model.
+    fields = payload.model_fields_set & _ALLOWED_FIELDS
+    for key, value in payload.model_dump(include=fields).items():
         setattr(db_tone, key, value)
 
 
@@ -55,13 +66,8 @@ async def create_tone(
 ):
     # Enforce synth type enum (bring back strictness for API requests)
     try:
-        allowed = {st.value for st in SynthType}
-        synth_type = None
-        if isinstance(tone_create.synth, dict):
-            synth_type = tone_create.synth.get("type")
-        elif hasattr(tone_create.synth, "type"):
-            synth_type = tone_create.synth.type
-        if synth_type not in allowed:
+        synth_type = _synth_type(tone_create.synth)
+        if synth_type not in _SYNTH_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=f"Invalid synth type: {synth_type}",
@@ -118,6 +124,8 @@ def get_tones(
                 detail="Internal server error",
             )
         responses.append(tone_dict)
+    # Plain dicts: FastAPI validates and serializes the whole list once through
+    # the route's compiled ``response_model`` adapter.
     return responses
 
 
@@ -139,13 +147,8 @@ async def update_tone(
     try:
         # Enforce synth type on update when provided
         if tone_update.synth is not None:
-            allowed = {st.value for st in SynthType}
-            synth_type = None
-            if isinstance(tone_update.synth, dict):
-                synth_type = tone_update.synth.get("type")
-            elif hasattr(tone_update.synth, "type"):
-                synth_type = tone_update.synth.type
-            if synth_type not in allowed:
+            synth_type = _synth_type(tone_update.synth)
+            if synth_type not in _SYNTH_TYPES:
                 raise HTTPException(
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                     detail=f"Invalid synth type: {synth_type}",
@@ -37,22 +37,27 @@ def get_schema_version() -> str:
 
 SCHEMA_VERSION: str = get_schema_version()
 
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
-def check_schema_header(header_value: Optional[str]) -> None:
+
+def check_schema_header(
+    header_value: Optional[str], _expected: str = SCHEMA_VERSION
+) -> None:
     """Optionally enforce schema version if header is provided.
 
     If X-Schema-Version header is present and mismatched, raise 409.
     If absent, allow request (backwards-compatible behavior).
+    ``_expected`` binds the version at definition time; callers never pass it.
     """
 
-    if header_value and header_value != SCHEMA_VERSION:
+    if header_value and header_value != _expected:
         # Let error handlers format the response
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={
                 "error": "SchemaVersionMismatch",
                 "message": "Client schema version does not match server",
-                "expected": SCHEMA_VERSION,
+                "expected": _expected,
                 "received": header_value,
             },
         )
@@ -74,7 +79,8 @@ def require_schema_version(
     if settings.TESTING:
         return
 
-    if request.method.upper() in {"POST", "PUT", "PATCH", "DELETE"}:
+    # Starlette already reports the method upper-cased.
+    if request.method in _WRITE_METHODS:
         if not x_schema_version or x_schema_version != SCHEMA_VERSION:
             raise HTTPException(
                 status_code=status.HTTP_428_PRECONDITION_REQUIRED,
@@ -10,6 +10,8 @@ from .base_schema import SchemaBase
 class PatchEmbeddingBase(SchemaBase):
     """Base fields for patch embeddings."""
 
+    model_config = ConfigDict(extra="forbid", strict=False)
+
     patch_id: str = Field(..., description="Associated patch ID")
     embedding: List[float] = Field(..., description="Vector embedding values")
 
@@ -25,6 +27,8 @@ class PatchEmbedding(PatchEmbeddingBase):
 class EmbeddingQuery(SchemaBase):
     """Request model for similarity search."""
 
+    model_config = ConfigDict(extra="forbid", strict=False)
+
     embedding: List[float] = Field(..., description="Vector to compare")
     top_k: int = Field(5, description="Number of matches to return")
 
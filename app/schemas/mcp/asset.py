@@ -30,13 +30,14 @@ class CreateAssetResult(BaseModel):
     """Result payload for asset creation."""
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "asset_id": "asset_a1b2c3d4",
                 "status": "created",
                 "components": {"tone": True, "shader": True, "haptic": False},
             }
-        }
+        },
     )
 
     asset_id: str = Field(
@@ -80,6 +81,7 @@ class UpdateParamResult(BaseModel):
     """Result payload for parameter updates."""
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "asset_id": "asset_123",
@@ -88,7 +90,7 @@ class UpdateParamResult(BaseModel):
                 "new_value": 1.5,
                 "updated": True,
             }
-        }
+        },
     )
 
     asset_id: str = Field(
@@ -135,6 +137,7 @@ class ApplyModulationResult(BaseModel):
     """Result payload for modulation application."""
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "asset_id": "asset_123",
@@ -149,7 +152,7 @@ class ApplyModulationResult(BaseModel):
                 },
                 "applied": True,
             }
-        }
+        },
     )
 
     asset_id: str = Field(
@@ -209,13 +212,14 @@ class ValidateAssetResult(BaseModel):
     """Result payload for asset validation."""
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "valid": True,
                 "components_found": ["name", "shader", "tone"],
                 "validation_passed": True,
             }
-        }
+        },
     )
 
     valid: bool = Field(
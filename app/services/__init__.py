@@ -5,9 +5,11 @@ from .embedding_service import (
     get_embedding,
     query_similar,
     store_embedding,
+    upsert_embedding,
     store_asset_embedding,
     get_asset_embedding,
     similar_assets,
+    similar_assets_batch,
     query_similar_assets,
 )
 from .moderation import moderate_prompt
@@ -18,9 +20,11 @@ __all__ = [
     "get_embedding",
     "query_similar",
     "store_embedding",
+    "upsert_embedding",
     "store_asset_embedding",
     "get_asset_embedding",
     "similar_assets",
+    "similar_assets_batch",
     "query_similar_assets",
     "moderate_prompt",
     "record_preview",
@@ -1,10 +1,14 @@
 """Database-backed embedding storage and similarity search."""
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
-from pgvector import Vector
+from pgvector import HalfVector, Vector
 import numpy as np
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 
 from app.models import (
     PatchEmbedding,
@@ -13,6 +17,67 @@ from app.models import (
     SessionLocal,
     SynestheticAsset,
 )
+from app.models.synesthetic_asset import component_load_options
+
+# Built once so the compiled SQL is reused from the statement cache.
+_ASSET_EMBEDDING_BY_ASSET = (
+    select(AssetEmbedding)
+    .where(AssetEmbedding.asset_id == bindparam("asset_id"))
+    .limit(1)
+)
+
+
+def _cosine_scores(
+    vectors: Sequence[Sequence[float]],
+    targets: Sequence[Sequence[float] | np.ndarray],
+) -> np.ndarray:
+    """Return the ``(rows, targets)`` cosine-similarity matrix.
+
+    Rows and targets are stacked into contiguous ``float32`` matrices so every
+    score comes out of one matrix product. Zero-norm pairs score ``0``.
+    Rows read from an fp16 ``halfvec`` column arrive as ``HalfVector`` and are
+    widened from their ``float16`` arrays.
+    """
+
+    if len(vectors) and isinstance(vectors[0], HalfVector):
+        vectors = [v.to_numpy() for v in vectors]
+    matrix = np.asarray(vectors, dtype=np.float32)
+    queries = np.asarray(targets, dtype=np.float32)
+    norms = np.outer(np.linalg.norm(matrix, axis=1), np.linalg.norm(queries, axis=1))
+    scores = matrix @ queries.T
+    np.divide(scores, norms, out=scores, where=norms != 0)
+    scores[norms == 0] = 0.0
+    return scores
+
+
+def _select_top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Return indices of the ``top_k`` highest ``scores``, best first."""
+
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _top_k_cosine(
+    vectors: Sequence[Sequence[float]],
+    target: Sequence[float] | np.ndarray,
+    top_k: int,
+) -> np.ndarray:
+    """Return indices of the ``top_k`` rows most cosine-similar to ``target``.
+
+    Scoring is a single matrix-vector product over the stacked rows;
+    ``argpartition`` selects the candidates before only those are sorted.
+
+    Rows are not quantized to int8: they are loaded from the database for each
+    query, so quantizing would add a pass over the data rather than remove one,
+    and pgvector has no int8 column type to store them pre-quantized.
+    """
+
+    return _select_top_k(_cosine_scores(vectors, [target])[:, 0], top_k)
 
 
 def clear_embeddings() -> None:
@@ -28,7 +93,7 @@ def store_embedding(patch_id: str, embedding: List[float]) -> None:
     """Store an embedding for a patch."""
 
     with SessionLocal() as db:
-        obj = db.query(PatchEmbedding).filter_by(patch_id=UUID(patch_id)).first()
+        obj = db.get(PatchEmbedding, UUID(patch_id))
         if obj is None:
             obj = PatchEmbedding(patch_id=UUID(patch_id), embedding=embedding)
             db.add(obj)
@@ -37,6 +102,24 @@ def store_embedding(patch_id: str, embedding: List[float]) -> None:
         db.commit()
 
 
+def upsert_embedding(
+    db: Session, patch_id: str, embedding: Sequence[float] | np.ndarray
+) -> PatchEmbedding:
+    """Insert or replace the embedding for ``patch_id`` in one round trip.
+
+    Runs ``INSERT ... ON CONFLICT (patch_id) DO UPDATE ... RETURNING`` on
+    ``db`` and returns the stored row; the caller commits.
+    """
+
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(PatchEmbedding).values(patch_id=UUID(patch_id), embedding=embedding)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PatchEmbedding.patch_id],
+        set_={"embedding": stmt.excluded.embedding},
+    ).returning(PatchEmbedding)
+    return db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
+
 def store_asset_embedding(
     asset_id: int,
     embedding: List[float],
@@ -47,7 +130,7 @@ def store_asset_embedding(
     """Store an embedding for a synesthetic asset."""
 
     with SessionLocal() as db:
-        obj = db.query(AssetEmbedding).filter_by(asset_id=asset_id).first()
+        obj = db.scalar(_ASSET_EMBEDDING_BY_ASSET, {"asset_id": asset_id})
         if obj is None:
             obj = AssetEmbedding(
                 asset_id=asset_id,
@@ -72,7 +155,7 @@ def get_embedding(patch_id: str) -> Optional[Vector]:
     """Return the embedding for ``patch_id`` if present."""
 
     with SessionLocal() as db:
-        obj = db.query(PatchEmbedding).filter_by(patch_id=UUID(patch_id)).first()
+        obj = db.get(PatchEmbedding, UUID(patch_id))
         return Vector(obj.embedding) if obj else None
 
 
@@ -80,17 +163,25 @@ def get_asset_embedding(asset_id: int) -> Optional[Vector]:
     """Return the embedding for ``asset_id`` if present."""
 
     with SessionLocal() as db:
-        obj = db.query(AssetEmbedding).filter_by(asset_id=asset_id).first()
-        return Vector(obj.embedding) if obj else None
+        obj = db.scalar(_ASSET_EMBEDDING_BY_ASSET, {"asset_id": asset_id})
+        if obj is None:
+            return None
+        if isinstance(obj.embedding, HalfVector):
+            return Vector(obj.embedding.to_list())
+        return Vector(obj.embedding)
 
 
 def query_similar(
-    embedding: List[float],
+    embedding: Sequence[float] | np.ndarray,
     top_k: int = 5,
     shader_id: int | None = None,
     asset_id: int | None = None,
 ) -> List[str]:
-    """Return IDs of the ``top_k`` most similar embeddings."""
+    """Return IDs of the ``top_k`` most similar embeddings.
+
+    ``embedding`` may already be a ``float32`` array, in which case the NumPy
+    fallback uses it without copying.
+    """
 
     with SessionLocal() as db:
         if db.bind.dialect.name != "postgresql":
@@ -110,17 +201,10 @@ def query_similar(
             if not records:
                 return []
 
-            target = np.array(embedding, dtype=float)
-            vectors = np.array([rec.embedding for rec, _ in records], dtype=float)
             ids = [str(rec.patch_id) for rec, _ in records]
-
-            denom = np.linalg.norm(vectors, axis=1) * np.linalg.norm(target)
-            dots = vectors.dot(target)
-            similarities = np.divide(
-                dots, denom, out=np.zeros_like(dots, dtype=float), where=denom != 0
+            top_indices = _top_k_cosine(
+                [rec.embedding for rec, _ in records], embedding, top_k
             )
-
-            top_indices = np.argsort(-similarities)[:top_k]
             return [ids[i] for i in top_indices]
 
         query = db.query(
@@ -144,36 +228,45 @@ def query_similar(
 def similar_assets(embedding: List[float], top_k: int = 5) -> List[int]:
     """Return IDs of assets with embeddings closest to ``embedding``."""
 
+    return similar_assets_batch([embedding], [top_k])[0]
+
+
+def similar_assets_batch(
+    embeddings: Sequence[Sequence[float]], top_ks: Sequence[int]
+) -> List[List[int]]:
+    """Return :func:`similar_assets` results for several queries at once.
+
+    Off Postgres the stored embeddings are loaded once and every query is
+    scored by the same matrix product. On Postgres each query remains an
+    indexed ``ORDER BY`` on the shared session.
+    """
+
     with SessionLocal() as db:
         if db.bind.dialect.name != "postgresql":
             records = db.query(AssetEmbedding).all()
             if not records:
-                return []
+                return [[] for _ in embeddings]
 
-            target = np.array(embedding, dtype=float)
-            vectors = np.array([rec.embedding for rec in records], dtype=float)
             ids = [rec.asset_id for rec in records]
-
-            denom = np.linalg.norm(vectors, axis=1) * np.linalg.norm(target)
-            dots = vectors.dot(target)
-            similarities = np.divide(
-                dots, denom, out=np.zeros_like(dots, dtype=float), where=denom != 0
+            scores = _cosine_scores([rec.embedding for rec in records], embeddings)
+            return [
+                [ids[i] for i in _select_top_k(scores[:, col], top_k)]
+                for col, top_k in enumerate(top_ks)
+            ]
+
+        results = []
+        for embedding, top_k in zip(embeddings, top_ks):
+            rows = (
+                db.query(
+                    AssetEmbedding.asset_id,
+                    AssetEmbedding.embedding.cosine_distance(embedding).label("dist"),
+                )
+                .order_by("dist")
+                .limit(top_k)
+                .all()
             )
-
-            top_indices = np.argsort(-similarities)[:top_k]
-            return [ids[i] for i in top_indices]
-
-        rows = (
-            db.query(
-                AssetEmbedding.asset_id,
-                AssetEmbedding.embedding.cosine_distance(embedding).label("dist"),
-            )
-            .order_by("dist")
-            .limit(top_k)
-            .all()
-        )
-
-    return [row.asset_id for row in rows]
+            results.append([row.asset_id for row in rows])
+        return results
 
 
 async def query_similar_assets(
@@ -189,17 +282,10 @@ async def query_similar_assets(
             if not records:
                 return []
 
-            target = np.array(vector, dtype=float)
-            vectors = np.array([rec.embedding for rec in records], dtype=float)
             ids = [rec.asset_id for rec in records]
-
-            denom = np.linalg.norm(vectors, axis=1) * np.linalg.norm(target)
-            dots = vectors.dot(target)
-            similarities = np.divide(
-                dots, denom, out=np.zeros_like(dots, dtype=float), where=denom != 0
+            top_indices = _top_k_cosine(
+                [rec.embedding for rec in records], vector, top_k
             )
-
-            top_indices = np.argsort(-similarities)[:top_k]
             asset_ids = [ids[i] for i in top_indices]
         else:
             query = db.query(
@@ -216,6 +302,7 @@ async def query_similar_assets(
 
         assets = (
             db.query(SynestheticAsset)
+            .options(*component_load_options())
             .filter(SynestheticAsset.synesthetic_asset_id.in_(asset_ids))
             .all()
         )
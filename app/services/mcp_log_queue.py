@@ -0,0 +1,184 @@
+"""
+MCP Log Queue
+
+Batched, asynchronous writer for MCP command logs. Handlers enqueue log
+records instead of committing them inline; a single background task drains the
+queue and writes each batch with one ``INSERT ... ON CONFLICT DO UPDATE``.
+
+Log ids are generated client-side, so a handler can enqueue the ``pending``
+record and its final ``success``/``error`` record back to back. When both land
+in the same batch they collapse into one row before the write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..models import MCPCommandLog
+from ..models.db import SessionLocal
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+LogRecord = Dict[str, Any]
+
+_STOP = object()
+
+
+def write_mcp_log_batch(records: List[LogRecord], db: Session) -> None:
+    """Upsert ``records`` into ``mcp_command_log`` in a single statement.
+
+    Records sharing an id collapse to the last one, so a pending entry and its
+    final status queued together become a single row. A record for an id that
+    is already stored only updates ``result`` and ``status``.
+    """
+    if not records:
+        return
+    rows = list({record["id"]: record for record in records}.values())
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(MCPCommandLog)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MCPCommandLog.id],
+        set_={"result": stmt.excluded.result, "status": stmt.excluded.status},
+    )
+    try:
+        db.execute(stmt, rows)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(
+            "Failed to write MCP log batch: Database error",
+            exc_info=True,
+            extra={"batch_size": len(rows), "error": str(e)},
+        )
+
+
+class MCPLogWriter:
+    """Queue MCP log records and flush them from one background task.
+
+    Batches are flushed once ``max_batch_size`` records are waiting or
+    ``max_wait_ms`` after the first record of a batch arrived. Until
+    :meth:`start` runs on an event loop (e.g. in tests that skip startup
+    events) records are written straight through on the caller's session.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 10,
+        maxsize: int = 10_000,
+        session_factory: Callable[[], AbstractContextManager[Session]] = SessionLocal,
+    ) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.maxsize = maxsize
+        self._session_factory = session_factory
+        self._queue: Optional[asyncio.Queue[Any]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Flush everything already queued, then stop the background task."""
+        if not self.running:
+            return
+        assert self._queue is not None and self._task is not None
+        await self._queue.put(_STOP)
+        await self._task
+        self._queue = None
+        self._task = None
+
+    async def put(self, record: LogRecord, db: Optional[Session] = None) -> None:
+        """Queue ``record``, or write it through on ``db`` if not running."""
+        if self.running:
+            assert self._queue is not None
+            await self._queue.put(record)
+        elif db is not None:
+            await asyncio.to_thread(write_mcp_log_batch, [record], db)
+        else:
+            await asyncio.to_thread(self._write, [record])
+
+    def _write(self, batch: List[LogRecord]) -> None:
+        with self._session_factory() as session:
+            write_mcp_log_batch(batch, session)
+
+    async def _run_loop(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception:
+                logger.error("MCP log writer failed to flush a batch", exc_info=True)
+
+
+mcp_log_writer = MCPLogWriter()
+
+
+async def enqueue_mcp_command(
+    command_type: str,
+    payload: Dict[str, Any],
+    request_id: str,
+    asset_id: Optional[str] = None,
+    db: Optional[Session] = None,
+) -> LogRecord:
+    """Queue a ``pending`` log record and return it for :func:`enqueue_mcp_result`."""
+    record: LogRecord = {
+        "id": uuid4(),
+        "timestamp": datetime.now(timezone.utc),
+        "request_id": request_id,
+        "asset_id": asset_id,
+        "command_type": command_type,
+        "payload": payload,
+        "result": None,
+        "status": "pending",
+    }
+    await mcp_log_writer.put(record, db)
+    return record
+
+
+async def enqueue_mcp_result(
+    record: LogRecord,
+    result: Dict[str, Any],
+    status: str,
+    db: Optional[Session] = None,
+) -> None:
+    """Queue the final ``result`` and ``status`` for a pending log record."""
+    await mcp_log_writer.put({**record, "result": result, "status": status}, db)
@@ -0,0 +1,171 @@
+"""
+Asset Search Batcher
+
+Coalesces concurrent ``/search/assets`` queries. A background task drains an
+``asyncio.Queue`` of pending queries and answers each batch with one call to
+:func:`similar_assets_batch`, so the stored embeddings are loaded and scored
+once per batch instead of once per request. Batches are scored concurrently
+on the executor, up to one per worker.
+
+Only the NumPy path benefits from batching. On Postgres every query is its own
+indexed ``ORDER BY``, so queries skip the queue and go straight to the
+executor, where they run in parallel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .embedding_service import similar_assets_batch
+from ..models.db import engine
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+_Pending = Tuple[Sequence[float], int, "asyncio.Future[List[int]]"]
+
+_STOP = object()
+
+
+class SearchBatcher:
+    """Answer similarity queries in micro-batches on a dedicated executor.
+
+    A batch is dispatched once ``max_batch_size`` queries are waiting or
+    ``max_wait_ms`` after its first query arrived; up to ``max_workers``
+    batches are in flight at once. Until :meth:`start` runs on an event loop
+    (e.g. in tests that skip startup events), or when ``coalesce`` is false,
+    each query is answered on its own, still off the event loop. ``coalesce``
+    defaults to true everywhere except Postgres.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5,
+        max_workers: Optional[int] = None,
+        coalesce: Optional[bool] = None,
+    ) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.coalesce = (
+            engine.dialect.name != "postgresql" if coalesce is None else coalesce
+        )
+        # Scans run here rather than in the shared request threadpool, so a
+        # burst of searches cannot starve unrelated sync handlers.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="asset-search"
+        )
+        self._queue: Optional[asyncio.Queue[Any]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._inflight: Set[asyncio.Task[None]] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Answer everything already queued, then stop the background task."""
+        if not self.running:
+            return
+        assert self._queue is not None and self._task is not None
+        await self._queue.put(_STOP)
+        await self._task
+        if self._inflight:
+            await asyncio.gather(*self._inflight)
+        self._queue = None
+        self._task = None
+        self._slots = None
+
+    async def submit(self, embedding: Sequence[float], top_k: int) -> List[int]:
+        """Return the IDs of the ``top_k`` assets closest to ``embedding``."""
+        loop = asyncio.get_running_loop()
+        if not self.coalesce or not self.running:
+            results = await loop.run_in_executor(
+                self._executor, similar_assets_batch, [embedding], [top_k]
+            )
+            return results[0]
+        assert self._queue is not None
+        future: asyncio.Future[List[int]] = loop.create_future()
+        await self._queue.put((embedding, top_k, future))
+        return await future
+
+    async def _dispatch(self, batch: List[_Pending]) -> None:
+        # Queries of different dimensions cannot share a matrix product, and a
+        # malformed one must only fail its own request.
+        groups: Dict[int, List[_Pending]] = {}
+        for pending in batch:
+            groups.setdefault(len(pending[0]), []).append(pending)
+        await asyncio.gather(*(self._dispatch_group(g) for g in groups.values()))
+
+    async def _dispatch_group(self, group: List[_Pending]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor,
+                similar_assets_batch,
+                [embedding for embedding, _, _ in group],
+                [top_k for _, top_k, _ in group],
+            )
+        except Exception as e:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(group, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run_batch(self, batch: List[_Pending], slots: asyncio.Semaphore) -> None:
+        try:
+            await self._dispatch(batch)
+        except Exception:
+            logger.error("Asset search batch failed", exc_info=True)
+        finally:
+            slots.release()
+
+    async def _run_loop(self) -> None:
+        assert self._queue is not None and self._slots is not None
+        queue = self._queue
+        slots = self._slots
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Scored in the background so the next batch can be collected
+            # meanwhile; the semaphore bounds batches in flight to the workers.
+            await slots.acquire()
+            task = asyncio.create_task(self._run_batch(batch, slots))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+
+asset_search_batcher = SearchBatcher()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 """Utility for generating standard CRUD routers."""
 
-from typing import Type, TypeVar, List, Optional, Any, cast
+from typing import Type, TypeVar, Hashable, List, Mapping, Optional, Any, cast
 from fastapi import APIRouter, Depends, HTTPException, Body, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session, Mapper
@@ -19,16 +19,32 @@ UpdateSchemaT = TypeVar("UpdateSchemaT", bound=BaseModel)
 ResponseSchemaT = TypeVar("ResponseSchemaT", bound=BaseModel)
 
 
+# Routers already built, keyed on the model, schemas and frozen router kwargs.
+_ROUTER_CACHE: dict[Hashable, APIRouter] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable equivalent of ``value`` for use in a cache key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 def create_crud_router(
     model: Type[ModelT],
     create_schema: Type[CreateSchemaT],
     update_schema: Type[UpdateSchemaT],
     response_schema: Type[ResponseSchemaT],
     *,
-    router_kwargs: Optional[dict] = None,
+    router_kwargs: Optional[Mapping[str, Any]] = None,
 ) -> APIRouter:
     """Return an APIRouter with basic CRUD routes for ``model``.
 
+    Routers are cached, so identical calls share one instance and FastAPI's
+    route signature analysis runs once per distinct configuration.
+
     Args:
         model: SQLAlchemy model class.
         create_schema: Pydantic schema used for ``POST`` requests.
@@ -36,6 +52,33 @@ def create_crud_router(
         response_schema: Schema returned in responses.
         router_kwargs: Optional arguments passed to :class:`APIRouter`.
     """
+    key = (
+        model,
+        create_schema,
+        update_schema,
+        response_schema,
+        _freeze(router_kwargs or {}),
+    )
+    try:
+        router = _ROUTER_CACHE.get(key)
+    except TypeError:  # unhashable router kwargs; build uncached
+        return _build_crud_router(
+            model, create_schema, update_schema, response_schema, router_kwargs
+        )
+    if router is None:
+        router = _ROUTER_CACHE[key] = _build_crud_router(
+            model, create_schema, update_schema, response_schema, router_kwargs
+        )
+    return router
+
+
+def _build_crud_router(
+    model: Type[ModelT],
+    create_schema: Type[CreateSchemaT],
+    update_schema: Type[UpdateSchemaT],
+    response_schema: Type[ResponseSchemaT],
+    router_kwargs: Optional[Mapping[str, Any]],
+) -> APIRouter:
     router = APIRouter(**(router_kwargs or {}))
     mapper = cast("Mapper[Any]", inspect(model))
     pk_name = mapper.primary_key[0].name
@@ -168,7 +211,9 @@ def create_crud_router(
                     detail=str(exc),
                 )
         try:
-            shaped_list = [response_schema.model_validate(i).model_dump() for i in items]
+            shaped_list = [
+                response_schema.model_validate(i).model_dump() for i in items
+            ]
             return shaped_list
         except Exception:
             return items
@@ -186,7 +231,9 @@ def create_crud_router(
             raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
         try:
             # Ensure JSON-safe (no Enums/Pydantic objects) for JSON columns
-            for key, value in payload.model_dump(mode="json", exclude_unset=True).items():
+            for key, value in payload.model_dump(
+                mode="json", exclude_unset=True
+            ).items():
                 setattr(instance, key, value)
             db.commit()
             db.refresh(instance)
@@ -35,3 +35,111 @@ def test_full_cycle_asset_search(clean_db):
     )
     assert resp.status_code == 200
     assert resp.json() == [asset.synesthetic_asset_id]
+
+
+@pytest.mark.asyncio
+async def test_query_similar_assets_preloads_components(clean_db):
+    from app.services import query_similar_assets
+    from tests.fixtures.factories import create_complete_synesthetic_asset
+
+    created = create_complete_synesthetic_asset(clean_db)
+    asset_id = created["asset"].synesthetic_asset_id
+    store_asset_embedding(asset_id, [0.5, 0.5])
+
+    (asset,) = await query_similar_assets([0.5, 0.5], top_k=1)
+    # The session is closed here, so components must already be loaded.
+    data = asset.to_dict()
+    assert data["synesthetic_asset_id"] == asset_id
+    assert {"tone", "control", "shader", "haptic", "modulation"} <= data.keys()
+
+
+@pytest.mark.asyncio
+async def test_search_batcher_coalesces_concurrent_queries(clean_db, monkeypatch):
+    import asyncio
+
+    from app.services import search_batcher as batcher_module
+
+    near = create_synesthetic_asset(clean_db).synesthetic_asset_id
+    far = create_synesthetic_asset(clean_db).synesthetic_asset_id
+    store_asset_embedding(near, [1.0, 0.0])
+    store_asset_embedding(far, [0.0, 1.0])
+
+    calls = []
+    real = batcher_module.similar_assets_batch
+
+    def spy(embeddings, top_ks):
+        calls.append(len(embeddings))
+        return real(embeddings, top_ks)
+
+    monkeypatch.setattr(batcher_module, "similar_assets_batch", spy)
+    batcher = batcher_module.SearchBatcher(max_wait_ms=50, max_workers=1)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            batcher.submit([1.0, 0.1], 1),
+            batcher.submit([0.1, 1.0], 2),
+            batcher.submit([1.0, 0.0, 0.0], 1),
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.stop()
+
+    assert results[0] == [near]
+    assert results[1] == [far, near]
+    # A query of the wrong dimension fails on its own.
+    assert isinstance(results[2], Exception)
+    assert sorted(calls) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_search_batcher_scores_batches_concurrently(monkeypatch):
+    import asyncio
+    import threading
+
+    from app.services import search_batcher as batcher_module
+
+    # Each batch blocks until the other one is running too; sequential
+    # dispatch would time the barrier out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def blocking(embeddings, top_ks):
+        barrier.wait()
+        return [[len(e)] for e in embeddings]
+
+    monkeypatch.setattr(batcher_module, "similar_assets_batch", blocking)
+    batcher = batcher_module.SearchBatcher(
+        max_batch_size=1, max_workers=2, coalesce=True
+    )
+    batcher.start()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit([1.0], 1), batcher.submit([1.0, 0.0], 1)),
+            timeout=10,
+        )
+    finally:
+        await batcher.stop()
+
+    assert results == [[1], [2]]
+
+
+@pytest.mark.asyncio
+async def test_search_batcher_without_coalescing_skips_the_queue(monkeypatch):
+    import asyncio
+
+    from app.services import search_batcher as batcher_module
+
+    calls = []
+
+    def record(embeddings, top_ks):
+        calls.append(len(embeddings))
+        return [[] for _ in embeddings]
+
+    monkeypatch.setattr(batcher_module, "similar_assets_batch", record)
+    batcher = batcher_module.SearchBatcher(max_wait_ms=50, coalesce=False)
+    batcher.start()
+    try:
+        await asyncio.gather(batcher.submit([1.0], 1), batcher.submit([0.5], 1))
+    finally:
+        await batcher.stop()
+
+    assert calls == [1, 1]
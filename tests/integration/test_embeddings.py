@@ -5,6 +5,7 @@ from app.services.embedding_service import (
     get_embedding,
     query_similar,
     store_embedding,
+    _top_k_cosine,
 )
 from tests.fixtures.factories import (
     create_shader_lib,
@@ -118,3 +119,34 @@ def test_query_similar_filters_by_asset(clean_db) -> None:
 
     matches = query_similar([1.0, 0.0], asset_id=asset.synesthetic_asset_id)
     assert matches == [str(patch_id)]
+
+
+def test_top_k_cosine_orders_and_handles_zero_vectors() -> None:
+    """The NumPy scorer ranks by cosine similarity and ignores zero rows."""
+
+    vectors = [[0.0, 0.0], [1.0, 0.0], [0.0, 2.0], [1.0, 1.0]]
+    assert list(_top_k_cosine(vectors, [1.0, 0.1], 2)) == [1, 3]
+    assert list(_top_k_cosine(vectors, [1.0, 0.1], 10)) == [1, 3, 2, 0]
+    assert list(_top_k_cosine(vectors, [1.0, 0.1], 0)) == []
+
+
+def test_top_k_cosine_accepts_fp16_rows() -> None:
+    """Rows read from an fp16 halfvec column score like their fp32 values."""
+    from pgvector.sqlalchemy import HALFVEC
+    from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select
+
+    table = Table(
+        "half_embeddings",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("embedding", HALFVEC(2)),
+    )
+    engine = create_engine("sqlite://")
+    table.metadata.create_all(engine)
+    vectors = [[0.0, 0.0], [1.0, 0.0], [0.0, 2.0], [1.0, 1.0]]
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [{"embedding": v} for v in vectors])
+        rows = conn.execute(select(table.c.embedding).order_by(table.c.id)).scalars()
+        half_rows = list(rows)
+
+    assert list(_top_k_cosine(half_rows, [1.0, 0.1], 10)) == [1, 3, 2, 0]
@@ -16,3 +16,18 @@ def test_root():
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "SDFK Backend API"}
+
+
+def test_static_assets_served_with_etag():
+    response = client.get("/static/swagger-ui-dark.css")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    etag = response.headers["etag"]
+
+    cached = client.get("/static/swagger-ui-dark.css", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    favicon = client.get("/static/favicon.png")
+    assert favicon.status_code == 200
+    assert favicon.headers["content-type"] == "image/png"
@@ -31,3 +31,28 @@ def test_rule_bundle_missing_rules(client):
     bad = {"name": "BadBundle"}
     r = client.post("/rule-bundles/", json=bad)
     assert r.status_code == 422
+
+
+def test_rule_bundle_import_rejects_invalid_upload(client):
+    for body in (b'{"name": "NoRules"}', b"{not json"):
+        r = client.post(
+            "/rule-bundles/import",
+            files={"file": ("b.json", body, "application/json")},
+        )
+        assert r.status_code == 422
+
+
+def test_rule_bundle_create_and_get(client):
+    payload = {
+        "name": "Echo",
+        "rules": [{"id": "e", "trigger": {"type": "tap"}, "effects": []}],
+    }
+    created = client.post("/rule-bundles/", json=payload)
+    assert created.status_code == 200
+    body = created.json()
+    assert body["name"] == "Echo"
+    assert body["rules"] == payload["rules"]
+
+    fetched = client.get(f"/rule-bundles/{body['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json() == body
@@ -0,0 +1,21 @@
+from sqlalchemy import func, select
+
+from app.models import Shader, SynestheticAsset
+
+
+def test_bulk_insert_writes_rows_and_applies_defaults(clean_db):
+    Shader.bulk_insert(
+        clean_db,
+        [
+            {"name": f"s{i}", "vertex_shader": "v", "fragment_shader": "f"}
+            for i in range(3)
+        ],
+    )
+    SynestheticAsset.bulk_insert(clean_db, [{"name": "a", "meta_info": {}}])
+    SynestheticAsset.bulk_insert(clean_db, [])
+    clean_db.commit()
+
+    assert clean_db.scalar(select(func.count()).select_from(Shader)) == 3
+    asset = clean_db.scalars(select(SynestheticAsset)).one()
+    assert asset.created_at is not None
+    assert asset.to_orjson_bytes()
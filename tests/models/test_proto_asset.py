@@ -0,0 +1,14 @@
+from sqlalchemy import inspect
+
+from app.models import ProtoAsset
+
+
+def test_proto_blob_is_deferred_until_load_blob(clean_db):
+    clean_db.add(ProtoAsset(proto_asset_id=1, name="p", proto_blob=b"\x08\x01"))
+    clean_db.commit()
+    clean_db.expunge_all()
+
+    obj = clean_db.get(ProtoAsset, 1)
+    assert "proto_blob" in inspect(obj).unloaded
+    assert obj.load_blob(clean_db) == b"\x08\x01"
+    assert "proto_blob" not in inspect(obj).unloaded
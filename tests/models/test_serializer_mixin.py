@@ -0,0 +1,12 @@
+from app.models import Control, Tone
+
+
+def test_to_dict_caches_column_keys_per_class():
+    tone = Tone(tone_id=1, name="t", synth={"type": "Tone.Synth"})
+    control = Control(control_id=2, name="c", meta_info={}, control_parameters=[])
+
+    assert tone.to_dict()["synth"] == {"type": "Tone.Synth"}
+    assert control.to_dict()["id"] == 2
+    assert "tone_id" in Tone.__dict__["_column_keys_cache"]
+    assert "control_parameters" in Control.__dict__["_column_keys_cache"]
+    assert "tone_id" not in Control._column_keys()
@@ -0,0 +1,133 @@
+from datetime import datetime
+
+import orjson
+
+from app.models import SynestheticAsset, Tone
+from app.prompt_templates.asset_generation import asset_to_prompt_block
+
+
+def _asset() -> SynestheticAsset:
+    return SynestheticAsset(
+        synesthetic_asset_id=1,
+        name="Asset",
+        meta_info={"category": "test"},
+        quality_tags=["calm"],
+        created_at=datetime(2025, 1, 1, 12, 0),
+        tone=Tone(tone_id=3, name="Tone", synth={"type": "Tone.Synth"}),
+    )
+
+
+def test_to_orjson_bytes_encodes_timestamps_natively():
+    payload = orjson.loads(_asset().to_orjson_bytes())
+    assert payload["created_at"] == "2025-01-01T12:00:00+00:00"
+    assert payload["updated_at"] is None
+    assert payload["tone"]["synth"] == {"type": "Tone.Synth"}
+
+
+def test_to_dict_can_stringify_dates():
+    assert _asset().to_dict()["created_at"] == datetime(2025, 1, 1, 12, 0)
+    data = _asset().to_dict(stringify_dates=True)
+    assert data["created_at"] == "2025-01-01T12:00:00"
+    assert data["updated_at"] is None
+
+
+def test_asset_to_prompt_block_uses_orjson_bytes():
+    assert asset_to_prompt_block(_asset()) == _asset().to_orjson_bytes().decode()
+
+
+def test_build_asset_prompt_joins_examples_as_ndjson():
+    from app.prompt_templates import build_asset_prompt
+
+    block = asset_to_prompt_block(_asset())
+    _, user_prompt = build_asset_prompt("make it glow", [_asset(), _asset()], ["x"])
+    assert user_prompt == f"{block}\n{block}\nmake it glow\nTags: x"
+
+    _, bare = build_asset_prompt("make it glow")
+    assert bare == "make it glow"
+
+
+def test_build_asset_prompt_bytes_matches_str_builder():
+    from app.prompt_templates import build_asset_prompt, build_asset_prompt_bytes
+
+    args = ("make it glöw", [_asset()], ["x", "y"], "high")
+    system, user = build_asset_prompt(*args)
+    assert build_asset_prompt_bytes(*args) == (system.encode(), user.encode())
+
+
+def test_payload_json_tracks_asset_and_component_writes(clean_db):
+    from sqlalchemy import select
+
+    from app.models.synesthetic_asset import component_load_options
+    from tests.fixtures.factories import create_complete_synesthetic_asset
+
+    created = create_complete_synesthetic_asset(clean_db)
+    asset_id = created["asset"].synesthetic_asset_id
+    clean_db.expunge_all()
+
+    def load() -> SynestheticAsset:
+        return clean_db.scalars(
+            select(SynestheticAsset)
+            .options(*component_load_options())
+            .where(SynestheticAsset.synesthetic_asset_id == asset_id)
+            .execution_options(populate_existing=True)
+        ).one()
+
+    asset = load()
+    assert asset.payload_json is not None
+    assert asset.to_orjson_bytes() == asset.payload_json
+    assert orjson.loads(asset.payload_json) == orjson.loads(asset._dump_payload())
+    updated_at = asset.updated_at
+
+    asset.tone.name = "Renamed Tone"
+    assert orjson.loads(asset.to_orjson_bytes())["tone"]["name"] == "Renamed Tone"
+    clean_db.commit()
+
+    asset = load()
+    assert orjson.loads(asset.payload_json)["tone"]["name"] == "Renamed Tone"
+    assert asset.updated_at == updated_at
+
+
+def test_payload_refresh_batches_component_lookups(clean_db):
+    from sqlalchemy import event
+
+    from tests.fixtures.factories import (
+        create_haptic,
+        create_synesthetic_asset,
+        create_tone,
+    )
+
+    tone = create_tone(clean_db)
+    haptic = create_haptic(clean_db)
+    ids = [
+        create_synesthetic_asset(
+            clean_db,
+            name=f"Asset {i}",
+            tone_id=tone.tone_id,
+            haptic_id=haptic.haptic_id,
+        ).synesthetic_asset_id
+        for i in range(2)
+    ]
+
+    statements: list[str] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    tone.name = "Shared Tone"
+    haptic.name = "Shared Haptic"
+    event.listen(clean_db.bind, "before_cursor_execute", before)
+    try:
+        clean_db.commit()
+    finally:
+        event.remove(clean_db.bind, "before_cursor_execute", before)
+
+    lookups = [s for s in statements if "synesthetic_assets.tone_id IN" in s]
+    assert len(lookups) == 1
+    assert "synesthetic_assets.haptic_id IN" in lookups[0]
+    refreshes = [s for s in statements if "SET payload_json" in s]
+    assert len(refreshes) == 1
+
+    for asset_id in ids:
+        stored = clean_db.get(SynestheticAsset, asset_id).payload_json
+        assert orjson.loads(stored)["tone"]["name"] == "Shared Tone"
+        assert orjson.loads(stored)["haptic"]["name"] == "Shared Haptic"
@@ -0,0 +1,20 @@
+import app.cache as cache_module
+from app.config import settings
+
+
+def test_cache_toggle_round_trip(client):
+    original = settings.CACHE_ENABLED
+    try:
+        resp = client.post("/cache", json={"cache_enabled": False})
+        assert resp.status_code == 200
+        assert resp.json() == {"cache_enabled": False}
+
+        resp = client.get("/cache")
+        assert resp.status_code == 200
+        assert resp.json() == {"cache_enabled": False}
+        assert cache_module.cache_enabled is False
+
+        assert client.post("/cache", json={"cache_enabled": "yes"}).status_code == 422
+        assert client.post("/cache", json={}).status_code == 422
+    finally:
+        cache_module.set_cache_enabled(original)
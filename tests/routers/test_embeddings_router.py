@@ -0,0 +1,84 @@
+from uuid import UUID, uuid4
+
+from app.models import PatchEmbedding
+
+
+def test_embedding_lookup_by_primary_key(clean_db, client):
+    patch_id = uuid4()
+    clean_db.add(PatchEmbedding(patch_id=patch_id, embedding=[0.1, 0.2]))
+    clean_db.commit()
+
+    assert client.get(f"/embeddings/{uuid4()}").status_code == 404
+    assert client.get("/embeddings/not-a-uuid").status_code == 404
+
+    resp = client.delete(f"/embeddings/{patch_id}")
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "deleted"}
+    assert clean_db.get(PatchEmbedding, patch_id) is None
+
+
+def test_create_and_update_embedding_upsert(clean_db, client):
+    patch_id = str(uuid4())
+
+    resp = client.post(
+        "/embeddings/", json={"patch_id": patch_id, "embedding": [1.0, 0.0]}
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"patch_id": patch_id, "embedding": [1.0, 0.0]}
+
+    resp = client.put(
+        f"/embeddings/{patch_id}", json={"patch_id": patch_id, "embedding": [0.0, 1.0]}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["embedding"] == [0.0, 1.0]
+
+    resp = client.get(f"/embeddings/{patch_id}")
+    assert resp.status_code == 200
+    assert resp.json() == {"patch_id": patch_id, "embedding": [0.0, 1.0]}
+
+    clean_db.expire_all()
+    assert clean_db.query(PatchEmbedding).count() == 1
+    assert list(clean_db.get(PatchEmbedding, UUID(patch_id)).embedding) == [0.0, 1.0]
+
+
+def test_embedding_bodies_are_validated(clean_db, client):
+    patch_id = str(uuid4())
+
+    resp = client.post("/embeddings/", json={"patch_id": patch_id})
+    assert resp.status_code == 422
+
+    resp = client.post(
+        "/embeddings/",
+        json={"patch_id": patch_id, "embedding": [1.0], "unexpected": True},
+    )
+    assert resp.status_code == 422
+
+    resp = client.post("/embeddings/query", json={"embedding": "nope"})
+    assert resp.status_code == 422
+
+
+def test_embedding_body_rejects_malformed_json(clean_db, client):
+    resp = client.post(
+        "/embeddings/",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 422
+
+
+def test_schema_version_applies_to_writes_only(clean_db, client, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "TESTING", False)
+    patch_id = str(uuid4())
+    body = {"patch_id": patch_id, "embedding": [1.0, 0.0]}
+    no_version = {"X-Schema-Version": ""}
+
+    assert client.post("/embeddings/", json=body, headers=no_version).status_code == 428
+    assert client.post("/embeddings/", json=body).status_code == 200
+    resp = client.post(
+        "/embeddings/query", json={"embedding": [1.0, 0.0]}, headers=no_version
+    )
+    assert resp.status_code == 200
+    resp = client.delete(f"/embeddings/{patch_id}", headers=no_version)
+    assert resp.status_code == 428
@@ -87,3 +87,66 @@ def test_create_from_synesthetic_asset(clean_db, client):
     assert get_resp.status_code == 200
     fetched = from_proto(get_resp.content)
     assert fetched.name == syn_asset.name
+
+
+def test_create_from_synesthetic_asset_eager_loads_components(clean_db, client):
+    objs = create_complete_synesthetic_asset(clean_db)
+    asset_id = objs["asset"].synesthetic_asset_id
+    name = objs["asset"].name
+    # Start from an empty identity map so every component comes from the
+    # eager loader options; any stray lazy load would raise.
+    clean_db.expunge_all()
+
+    resp = client.post(f"/protobuf-assets/from-synesthetic/{asset_id}")
+    assert resp.status_code == 200
+    assert from_proto(resp.content).name == name
+
+
+def test_get_large_proto_asset_is_streamed(clean_db, client, monkeypatch):
+    import app.routers.pb_assets as pb_assets
+
+    body = to_proto(example)
+    monkeypatch.setattr(pb_assets, "_STREAM_THRESHOLD", 16)
+    monkeypatch.setattr(pb_assets, "_STREAM_CHUNK_SIZE", 8)
+
+    resp = client.post(
+        "/protobuf-assets/",
+        data=body,
+        headers={"Content-Type": "application/x-protobuf"},
+    )
+    assert resp.status_code == 200
+
+    resp = client.get("/protobuf-assets/1")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Length"] == str(len(body))
+    assert "attachment" in resp.headers.get("Content-Disposition", "")
+    assert resp.content == body
+
+
+def test_update_and_delete_missing_proto_asset(clean_db, client):
+    headers = {"Content-Type": "application/x-protobuf"}
+    resp = client.put("/protobuf-assets/999", data=to_proto(example), headers=headers)
+    assert resp.status_code == 404
+    assert client.delete("/protobuf-assets/999").status_code == 404
+
+    client.post("/protobuf-assets/", data=to_proto(example), headers=headers)
+    updated = {**example, "description": "changed"}
+    client.put("/protobuf-assets/1", data=to_proto(updated), headers=headers)
+    assert from_proto(client.get("/protobuf-assets/1").content).description == "changed"
+
+    assert client.delete("/protobuf-assets/1").status_code == 200
+    assert client.get("/protobuf-assets/1").status_code == 404
+
+
+def test_create_from_synesthetic_overwrites_existing_proto(clean_db, client):
+    objs = create_complete_synesthetic_asset(clean_db)
+    asset_id = objs["asset"].synesthetic_asset_id
+    first = client.post(f"/protobuf-assets/from-synesthetic/{asset_id}")
+    assert first.status_code == 200
+
+    objs["asset"].name = "Renamed"
+    clean_db.commit()
+    second = client.post(f"/protobuf-assets/from-synesthetic/{asset_id}")
+    assert second.status_code == 200
+    assert from_proto(second.content).name == "Renamed"
+    assert client.get(f"/protobuf-assets/{asset_id}").content == second.content
@@ -75,3 +75,25 @@ def test_openapi_includes_examples(client):
         op["responses"]["422"]["content"]["application/json"]["example"]
     )
     assert "code" in example_422["detail"][0]
+
+
+def test_effective_cache_follows_row_updates(db_session, auth_client):
+    from app.models.shader_lib import ShaderLib as ShaderLibModel
+
+    lib_id = _setup_lib(db_session)
+    url = f"/shader_libs/{lib_id}/helpers/sdHexagon/effective"
+    first = auth_client.get(url)
+    assert first.status_code == 200
+    assert auth_client.get(url).json() == first.json()
+
+    row = db_session.get(ShaderLibModel, lib_id)
+    definition = dict(row.definition)
+    definition["helpers"] = {
+        k: v for k, v in definition["helpers"].items() if k != "sdHexagon"
+    }
+    row.definition = definition
+    db_session.commit()
+
+    resp = auth_client.get(url)
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["code"] == "HELPER_NOT_FOUND"
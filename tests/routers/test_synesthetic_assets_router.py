@@ -19,6 +19,7 @@ from uuid import UUID, uuid4
 import app.security as security
 from app.models.db import get_db
 from fastapi import Depends
+import pytest
 
 # Override JWT verification for tests
 app.dependency_overrides[security.verify_jwt] = lambda token=None: {"sub": "test_user"}
@@ -501,3 +502,158 @@ def _removed_test_apply_component_missing():
         f"/synesthetic-assets/apply/{asset.synesthetic_asset_id}/{patch_id}"
     )
     assert resp.status_code == 404
+
+
+def test_nested_create_is_one_transaction(client, clean_db, monkeypatch):
+    """A failure after the components are written leaves nothing behind."""
+    import pytest
+    from app.services import asset_utils
+
+    payload = {
+        "name": "Atomic Asset",
+        "shader": {
+            "name": "Atomic Shader",
+            "vertex_shader": "void main() {}",
+            "fragment_shader": "void main() {}",
+        },
+        "tone": {"name": "Atomic Tone", "synth": {"type": "Tone.Synth"}},
+    }
+
+    def boom(*args, **kwargs):
+        raise RuntimeError("formatting failed")
+
+    monkeypatch.setattr(asset_utils, "format_nested_asset_response", boom)
+    with pytest.raises(RuntimeError):
+        client.post("/synesthetic-assets/nested", json=payload)
+
+    # The request session is closed (rolled back) by get_db in production.
+    clean_db.rollback()
+    assert clean_db.query(models.Shader).count() == 0
+    assert clean_db.query(models.Tone).count() == 0
+    assert clean_db.query(models.SynestheticAsset).count() == 0
+
+    monkeypatch.undo()
+    resp = client.post("/synesthetic-assets/nested", json=payload)
+    assert resp.status_code == 200
+    assert clean_db.query(models.Shader).count() == 1
+    assert clean_db.query(models.SynestheticAsset).count() == 1
+
+
+def test_nested_create_stores_shader_and_haptic(client, clean_db):
+    payload = {
+        "name": "Dump Asset",
+        "shader": {
+            "name": "Dump Shader",
+            "vertex_shader": "void main() {}",
+            "fragment_shader": "void main() {}",
+            "uniforms": [
+                {"name": "u_r", "type": "float", "stage": "fragment", "default": 0.5}
+            ],
+        },
+        "haptic": {
+            "name": "Dump Haptic",
+            "device": {"type": "generic", "options": {}},
+            "input_parameters": [],
+        },
+    }
+    resp = client.post("/synesthetic-assets/nested", json=payload)
+    assert resp.status_code == 200
+
+    clean_db.expire_all()
+    shader = clean_db.query(models.Shader).one()
+    assert shader.uniforms[0]["default"] == 0.5
+    assert clean_db.query(models.Haptic).one().device["type"] == "generic"
+
+
+def test_create_asset_stores_modulations_row(client, clean_db):
+    modulation = {
+        "id": "radius_pulse",
+        "target": "shader.u_r",
+        "type": "additive",
+        "waveform": "triangle",
+        "frequency": 0.05,
+        "amplitude": 0.1,
+        "offset": 0.5,
+        "phase": 0.0,
+        "scale": 0.001,
+        "scaleProfile": "linear",
+        "min": 0.0,
+        "max": 1.0,
+    }
+    resp = client.post(
+        "/synesthetic-assets/", json={"name": "Mod Asset", "modulations": [modulation]}
+    )
+    assert resp.status_code == 200
+
+    stored = clean_db.query(models.Modulation).one()
+    assert stored.name == "Mod Asset Modulations"
+    assert stored.modulations[0]["id"] == "radius_pulse"
+    assert clean_db.query(models.SynestheticAsset).count() == 1
+
+
+def test_list_assets_pages_and_skips_unused_columns(client, clean_db):
+    ids = [
+        create_synesthetic_asset(clean_db, name=f"Asset {i}").synesthetic_asset_id
+        for i in range(3)
+    ]
+
+    statements: list[str] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(clean_db.bind, "before_cursor_execute", before)
+    try:
+        first = client.get("/synesthetic-assets/?limit=2")
+    finally:
+        event.remove(clean_db.bind, "before_cursor_execute", before)
+    assert first.status_code == 200
+    assert [a["synesthetic_asset_id"] for a in first.json()] == ids[:2]
+    asset_select = next(s for s in statements if "FROM synesthetic_assets" in s)
+    assert "quality_tags" not in asset_select
+    assert "payload_json" not in asset_select
+
+    rest = client.get("/synesthetic-assets/?offset=2&limit=2")
+    assert [a["synesthetic_asset_id"] for a in rest.json()] == ids[2:]
+
+
+@pytest.mark.parametrize(
+    "query", ["limit=0", "limit=-1", "limit=1001", "offset=-1", "limit=10000000"]
+)
+def test_list_assets_rejects_out_of_range_paging(client, clean_db, query):
+    assert client.get(f"/synesthetic-assets/?{query}").status_code == 422
+
+
+def test_nested_create_serializes_the_asset_payload_once(client, clean_db):
+    statements: list[str] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    payload = {
+        "name": "Payload Asset",
+        "shader": {
+            "name": "Payload Shader",
+            "vertex_shader": "void main() {}",
+            "fragment_shader": "void main() {}",
+        },
+        "tone": {"name": "Payload Tone", "synth": {"type": "Tone.Synth"}},
+    }
+    event.listen(clean_db.bind, "before_cursor_execute", before)
+    try:
+        resp = client.post("/synesthetic-assets/nested", json=payload)
+    finally:
+        event.remove(clean_db.bind, "before_cursor_execute", before)
+
+    assert resp.status_code == 200
+    assert sum("SET payload_json" in s for s in statements) == 1
+
+
+def test_list_asset_items_match_single_asset_response(client, clean_db):
+    asset = create_synesthetic_asset(clean_db, name="Listed Asset", description=None)
+
+    single = client.get(f"/synesthetic-assets/{asset.synesthetic_asset_id}").json()
+    (listed,) = client.get("/synesthetic-assets/").json()
+
+    assert listed == single
+    assert "description" not in listed
@@ -876,3 +876,19 @@ def test_get_tones_handles_serialization_error(monkeypatch):
 
     response = client.get("/tones/")
     assert response.status_code == 500
+
+
+def test_tone_list_items_match_single_tone_response():
+    """The list route serializes tones exactly like ``GET /tones/{id}``."""
+    create_response = client.post(
+        "/tones/", json={"name": "Listed Tone", "synth": {"type": "Tone.Synth"}}
+    )
+    assert create_response.status_code == 200
+    tone_id = create_response.json()["tone_id"]
+
+    single = client.get(f"/tones/{tone_id}").json()
+    listed = next(t for t in client.get("/tones/").json() if t["tone_id"] == tone_id)
+
+    assert listed == single
+    # Unset optional fields stay in the output as nulls.
+    assert "description" in listed and listed["description"] is None
@@ -5,7 +5,9 @@ Comprehensive tests for the MCP command logging system, verifying log creation,
 updating, retrieval, and error handling.
 """
 
+import asyncio
 import uuid
+from contextlib import nullcontext
 from uuid import UUID
 from unittest.mock import MagicMock
 from sqlalchemy.exc import SQLAlchemyError
@@ -17,6 +19,12 @@ from app.services.mcp_logger import (
     get_mcp_logs_by_request,
     get_mcp_logs_by_asset,
 )
+from app.services.mcp_log_queue import (
+    MCPLogWriter,
+    enqueue_mcp_command,
+    enqueue_mcp_result,
+    write_mcp_log_batch,
+)
 from app.models import MCPCommandLog
 from app.schemas.mcp import MCPCommandLogCreate, MCPCommandLogResponse
 
@@ -399,3 +407,83 @@ class TestMCPLogger:
         assert response_schema.result == {"updated": True}
         assert response_schema.status == "success"
         assert response_schema.timestamp is not None
+
+
+class TestMCPLogWriter:
+    """Test suite for the batched MCP log writer."""
+
+    def test_write_batch_collapses_records_per_id(self, clean_db: Session):
+        """A pending record and its final status in one batch become one row."""
+        pending = {
+            "id": uuid.uuid4(),
+            "request_id": "req_batch",
+            "asset_id": None,
+            "command_type": "create_asset",
+            "payload": {"name": "Batched"},
+            "result": None,
+            "status": "pending",
+        }
+        write_mcp_log_batch(
+            [pending, {**pending, "result": {"ok": True}, "status": "success"}],
+            clean_db,
+        )
+        rows = clean_db.query(MCPCommandLog).all()
+        assert len(rows) == 1
+        assert rows[0].status == "success"
+        assert rows[0].result == {"ok": True}
+
+        # A later batch for a stored id only updates result and status.
+        write_mcp_log_batch(
+            [{**pending, "payload": {}, "result": {"e": 1}, "status": "error"}],
+            clean_db,
+        )
+        clean_db.expire_all()
+        rows = clean_db.query(MCPCommandLog).all()
+        assert len(rows) == 1
+        assert rows[0].status == "error"
+        assert rows[0].result == {"e": 1}
+        assert rows[0].payload == {"name": "Batched"}
+
+    def test_writer_flushes_queued_records_on_stop(self, clean_db: Session):
+        """Records queued while running are written when the writer stops."""
+        writer = MCPLogWriter(session_factory=lambda: nullcontext(clean_db))
+
+        async def run():
+            writer.start()
+            assert writer.running
+            for i in range(3):
+                record = {
+                    "id": uuid.uuid4(),
+                    "request_id": f"req_{i}",
+                    "asset_id": None,
+                    "command_type": "validate_asset",
+                    "payload": {},
+                    "result": None,
+                    "status": "pending",
+                }
+                await writer.put(record)
+                await writer.put({**record, "status": "success"})
+            await writer.stop()
+
+        asyncio.run(run())
+
+        statuses = [row.status for row in clean_db.query(MCPCommandLog).all()]
+        assert statuses == ["success"] * 3
+
+    def test_enqueue_writes_through_without_running_writer(self, clean_db: Session):
+        """Without a started writer, records are written on the given session."""
+
+        async def run():
+            record = await enqueue_mcp_command(
+                "update_param", {"path": "tone.volume"}, "req_direct", db=clean_db
+            )
+            stored = clean_db.get(MCPCommandLog, record["id"])
+            assert stored is not None and stored.status == "pending"
+            await enqueue_mcp_result(record, {"updated": True}, "success", db=clean_db)
+            return record
+
+        record = asyncio.run(run())
+        clean_db.expire_all()
+        stored = clean_db.get(MCPCommandLog, record["id"])
+        assert stored.status == "success"
+        assert stored.result == {"updated": True}
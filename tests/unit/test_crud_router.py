@@ -0,0 +1,28 @@
+from fastapi import Depends
+
+from app import security
+from app.models import Haptic
+from app.schemas import HapticCreate, HapticUpdate, Haptic as HapticSchema
+from app.utils.crud_router import create_crud_router
+
+
+def test_create_crud_router_is_cached_per_configuration():
+    dep = Depends(security.verify_jwt)
+    kwargs = {"tags": ["haptics"], "dependencies": [dep]}
+
+    first = create_crud_router(
+        Haptic, HapticCreate, HapticUpdate, HapticSchema, router_kwargs=kwargs
+    )
+    again = create_crud_router(
+        Haptic, HapticCreate, HapticUpdate, HapticSchema, router_kwargs=dict(kwargs)
+    )
+    other = create_crud_router(
+        Haptic,
+        HapticCreate,
+        HapticUpdate,
+        HapticSchema,
+        router_kwargs={"tags": ["other"], "dependencies": [dep]},
+    )
+
+    assert first is again
+    assert other is not first
@@ -31,3 +31,52 @@ def test_get_db_closes_session(monkeypatch):
         next(db_generator)
 
     assert closed is True
+
+
+def test_engine_json_columns_use_orjson():
+    from datetime import datetime
+
+    import sqlalchemy as sa
+
+    from app.models.db import _create_engine
+
+    engine = _create_engine("sqlite:///:memory:")
+    table = sa.Table("json_rows", sa.MetaData(), sa.Column("data", sa.JSON))
+    table.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(), {"data": {"at": datetime(2025, 1, 1), 1: [1.5, None]}}
+        )
+        stored = conn.execute(sa.select(table.c.data)).scalar_one()
+    assert stored == {"at": "2025-01-01T00:00:00", "1": [1.5, None]}
+
+
+def test_psycopg2_engine_batches_executemany():
+    """psycopg2 engines page executemany statements instead of looping."""
+
+    from app.models.db import _create_engine
+
+    engine = _create_engine("postgresql://user:pw@localhost:1/db")
+    assert engine.dialect.executemany_mode.name == "EXECUTEMANY_VALUES_PLUS_BATCH"
+    assert engine.dialect.insertmanyvalues_page_size == 10_000
+
+
+def test_warm_pool_opens_every_pooled_connection(tmp_path):
+    import sqlalchemy as sa
+    from sqlalchemy.pool import QueuePool
+
+    from app.models.db import warm_pool
+
+    engine = sa.create_engine(
+        f"sqlite:///{tmp_path / 'warm.db'}", poolclass=QueuePool, pool_size=3
+    )
+    assert warm_pool(engine) == 3
+    assert engine.pool.checkedin() == 3
+    assert warm_pool(sa.create_engine("sqlite://")) == 0
+
+
+def test_request_sessions_keep_objects_loaded_after_commit():
+    from app.models.db import SessionLocal
+
+    with SessionLocal() as session:
+        assert session.expire_on_commit is False
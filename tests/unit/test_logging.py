@@ -38,3 +38,10 @@ def test_logger_includes_request_id(capsys):
             break
 
     assert has_id
+
+
+def test_get_logger_returns_cached_adapter():
+    first = get_logger("app.tests.cached")
+    second = get_logger("app.tests.cached")
+    assert first is second
+    assert len(first.logger.handlers) == 1
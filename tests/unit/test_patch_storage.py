@@ -1,4 +1,5 @@
 import time
+from datetime import datetime, timezone
 
 import pytest
 
@@ -25,3 +26,152 @@ def test_ring_buffer_put_get_expiry(monkeypatch):
     time.sleep(0.11)
     with pytest.raises(KeyError):
         storage.get(patch_id)
+
+
+def test_jsonlines_patch_storage_skips_corrupt_lines(tmp_path):
+    storage = JsonLinesPatchStorage(base_dir=tmp_path)
+    storage.put("p1", "tone", {"a": 1})
+    (jsonl_file,) = tmp_path.rglob("component=tone.jsonl")
+    with jsonl_file.open("ab") as f:
+        f.write(b"{not json\n")
+    storage.put("p2", "tone", {"b": 2})
+    assert storage.get("p2") == {"b": 2}
+    with pytest.raises(KeyError):
+        storage.get("missing")
+
+
+def test_jsonlines_patch_storage_uses_offset_index(tmp_path):
+    storage = JsonLinesPatchStorage(base_dir=tmp_path)
+    for i in range(3):
+        storage.put(f"p{i}", "shader", {"value": i})
+
+    fresh = JsonLinesPatchStorage(base_dir=tmp_path)
+    assert fresh.get("p1") == {"value": 1}
+    assert set(fresh._index) == {"p0", "p1", "p2"}
+
+
+def test_jsonlines_patch_storage_falls_back_to_scan_without_index(tmp_path):
+    storage = JsonLinesPatchStorage(base_dir=tmp_path)
+    storage.put("p1", "shader", {"value": 1})
+    (tmp_path / JsonLinesPatchStorage.INDEX_FILE).unlink()
+
+    assert JsonLinesPatchStorage(base_dir=tmp_path).get("p1") == {"value": 1}
+
+
+def test_jsonlines_patch_storage_buffers_writes(tmp_path):
+    with JsonLinesPatchStorage(base_dir=tmp_path, buffer_limit=3) as storage:
+        storage.put("p1", "tone", {"value": 1})
+        storage.put("p2", "shader", {"value": 2})
+        assert not list(tmp_path.rglob("component=*.jsonl"))
+
+        storage.put("p3", "tone", {"value": 3})
+        assert len(list(tmp_path.rglob("component=*.jsonl"))) == 2
+
+        storage.put("p4", "tone", {"value": 4})
+        assert storage.get("p4") == {"value": 4}
+        storage.put("p5", "tone", {"value": 5})
+
+    fresh = JsonLinesPatchStorage(base_dir=tmp_path)
+    assert [fresh.get(f"p{i}") for i in range(1, 6)] == [
+        {"value": i} for i in range(1, 6)
+    ]
+
+
+def test_jsonlines_patch_storage_flushes_at_exit(tmp_path):
+    import gc
+
+    from app.patch_storage import jsonl
+
+    storage = JsonLinesPatchStorage(base_dir=tmp_path, buffer_limit=10)
+    storage.put("p1", "tone", {"value": 1})
+    assert not list(tmp_path.rglob("component=*.jsonl"))
+
+    jsonl._close_open_storages()
+    assert not storage._handles
+    assert JsonLinesPatchStorage(base_dir=tmp_path).get("p1") == {"value": 1}
+
+    # The exit hook only holds weak references.
+    del storage
+    gc.collect()
+    assert all(s.base_dir != tmp_path for s in jsonl._open_storages)
+
+
+def test_jsonlines_patch_storage_rolls_over_date_directory(tmp_path, monkeypatch):
+    import app.patch_storage.jsonl as jsonl_module
+
+    class FakeDatetime:
+        current = datetime(2025, 1, 1, 23, 59, tzinfo=timezone.utc)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    monkeypatch.setattr(jsonl_module, "datetime", FakeDatetime)
+    storage = JsonLinesPatchStorage(base_dir=tmp_path)
+    first = storage.put("p1", "tone", {"value": 1})
+    assert storage.put("p2", "tone", {"value": 2}) == first
+
+    FakeDatetime.current = datetime(2025, 1, 2, tzinfo=timezone.utc)
+    assert storage.put("p3", "tone", {"value": 3}) != first
+    assert (tmp_path / "dt=2025-01-02" / "component=tone.jsonl").exists()
+    assert storage.get("p3") == {"value": 3}
+
+
+def test_ring_buffer_evicts_nearest_expiring_on_overflow():
+    storage = InMemoryRingBufferStorage(ttl_seconds=60, max_items=2)
+    storage.put("a", "tone", {"a": 1})
+    storage.put("b", "tone", {"b": 1})
+    storage.put("a", "tone", {"a": 2})  # refreshes a's expiry past b's
+    storage.put("c", "tone", {"c": 1})
+
+    assert storage.get("a") == {"a": 2}
+    assert storage.get("c") == {"c": 1}
+    with pytest.raises(KeyError):
+        storage.get("b")
+
+
+def test_ring_buffer_cleanup_drops_expired_prefix(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    storage = InMemoryRingBufferStorage(ttl_seconds=10, max_items=100)
+    for i in range(5):
+        storage.put(f"old{i}", "tone", {"i": i})
+    clock[0] = 105.0
+    storage.put("new", "tone", {"n": 1})
+
+    clock[0] = 112.0
+    assert storage.get("new") == {"n": 1}
+    assert list(storage._data) == ["new"]
+    assert storage._expiry_sorted == [(115.0, "new")]
+
+
+def test_jsonlines_patch_storage_reuses_open_handles(tmp_path):
+    storage = JsonLinesPatchStorage(base_dir=tmp_path)
+    storage.MAX_OPEN_FILES = 2
+    storage.put("p1", "tone", {"value": 1})
+    handle = storage._handles[next(iter(storage._handles))]
+    storage.put("p2", "tone", {"value": 2})
+    assert next(iter(storage._handles.values())) is handle
+
+    storage.put("p3", "shader", {"value": 3})
+    assert len(storage._handles) == 2
+    assert handle.closed
+    assert storage.get("p1") == {"value": 1}
+    assert storage.get("p3") == {"value": 3}
+
+    storage.close()
+    assert not storage._handles
+
+
+def test_jsonlines_patch_storage_scan_reads_stdlib_json_records(tmp_path):
+    import json
+
+    legacy = tmp_path / "dt=2024-01-01" / "component=tone.jsonl"
+    legacy.parent.mkdir(parents=True)
+    records = [
+        {"patch_id": "other", "component_type": "tone", "patch": {"x": 0}},
+        {"patch_id": "legacy", "component_type": "tone", "patch": {"x": 1}},
+    ]
+    legacy.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    assert JsonLinesPatchStorage(base_dir=tmp_path).get("legacy") == {"x": 1}
@@ -0,0 +1,276 @@
+from app.prompt_templates import component_patch
+from app.prompt_templates.component_patch import build_tone_patch_prompt
+from app.prompt_templates.tone_prompt import CANONICAL_TONEJS_SYSTEM_PROMPT
+
+
+def test_component_patch_prompt_uses_prebuilt_template():
+    assert CANONICAL_TONEJS_SYSTEM_PROMPT in component_patch._TEMPLATES_BY_RULES
+
+    prompt = build_tone_patch_prompt({"name": "Bell", "synth": {}}, "brighter")
+    assert prompt.endswith(
+        '{\n  "name": "Bell",\n  "synth": {}\n}\n        User request:\n        brighter\n'
+    )
+
+
+def test_component_patch_prompt_handles_uncached_rules():
+    prompt = component_patch._build_patch_prompt("use {braces}", {"a": 1}, "go")
+    assert "use {braces}" in prompt
+    assert '"a": 1' in prompt
+
+
+def test_escape_doubles_braces_in_one_pass():
+    from app.prompt_templates.component_patch import _escape
+
+    assert _escape("a {b} }{") == "a {{b}} }}{{"
+
+
+def test_asset_patch_prompt_reuses_serialized_bytes():
+    import json
+
+    import orjson
+
+    from app.prompt_templates import (
+        build_asset_patch_prompt,
+        build_asset_patch_prompt_from_bytes,
+    )
+
+    asset = {"name": "demo", "tone": {"synth": {"type": "Tone.Synth"}}, "tags": []}
+    prompt = build_asset_patch_prompt(asset, "louder")
+    assert json.dumps(asset, indent=2) in prompt
+    assert prompt.endswith("User request:\nlouder")
+
+    blob = orjson.dumps(asset, option=orjson.OPT_INDENT_2)
+    assert build_asset_patch_prompt_from_bytes(blob, "louder") == prompt
+
+
+def test_canonical_prompt_messages_mark_static_prefix_cacheable():
+    from app.prompt_templates import (
+        build_shader_messages,
+        build_synesthetic_asset_messages,
+    )
+    from app.prompt_templates.shader_prompt import CANONICAL_SHADER_PROMPT
+    from app.prompt_templates.synesthetic_asset_prompt import (
+        CANONICAL_SYNESTHETIC_ASSET_PROMPT,
+    )
+
+    system, user = build_shader_messages("glow")
+    assert system["content"][0]["text"] is CANONICAL_SHADER_PROMPT
+    assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert user == {
+        "role": "user",
+        "content": [{"type": "text", "text": "User Prompt:\nglow"}],
+    }
+
+    system, user = build_synesthetic_asset_messages("rain")
+    assert system["content"][0]["text"] is CANONICAL_SYNESTHETIC_ASSET_PROMPT
+    assert user["content"][0]["text"].endswith("rain")
+    assert build_synesthetic_asset_messages()[1]["content"][0]["text"]
+
+
+def test_canonical_prompt_bytes_builders_match_str_builders():
+    from app.prompt_templates import (
+        build_shader_prompt,
+        build_shader_prompt_bytes,
+        build_synesthetic_asset_prompt,
+        build_synesthetic_asset_prompt_bytes,
+    )
+
+    for text in ("", "ripples ☂"):
+        assert build_shader_prompt_bytes(text) == build_shader_prompt(text).encode()
+    for concept in (None, "", "rain ☂"):
+        assert (
+            build_synesthetic_asset_prompt_bytes(concept)
+            == build_synesthetic_asset_prompt(concept).encode()
+        )
+
+
+def test_canonical_prompt_builders_reuse_static_prefix():
+    from app.prompt_templates import build_shader_prompt
+    from app.prompt_templates.shader_prompt import CANONICAL_SHADER_PROMPT
+
+    assert build_shader_prompt() is build_shader_prompt("")
+    assert build_shader_prompt("x") == f"{CANONICAL_SHADER_PROMPT}\n\nUser Prompt:\nx"
+
+
+def test_asset_prompt_keeps_concept_after_static_prefix():
+    from app.prompt_templates import build_synesthetic_asset_prompt
+    from app.prompt_templates.synesthetic_asset_prompt import _ASSET_STATIC_PREFIX
+
+    prompt = build_synesthetic_asset_prompt("rain")
+    assert prompt.startswith(_ASSET_STATIC_PREFIX)
+    assert prompt.endswith("\n\nFocus on this synesthetic concept: rain")
+
+
+def test_shader_prompt_bytes_are_pinned():
+    import hashlib
+
+    from app.prompt_templates.shader_prompt import (
+        CANONICAL_SHADER_PROMPT,
+        _CIRCLE_EXAMPLE,
+        _SDF_FUNCTIONS,
+    )
+
+    assert "- sdOrientedBox\n" in CANONICAL_SHADER_PROMPT
+    assert len(_SDF_FUNCTIONS) == 74
+    assert '{"shader":{"name":"CircleSDF",' in CANONICAL_SHADER_PROMPT
+    assert _CIRCLE_EXAMPLE["shader"]["shader_lib_id"] == 1
+    # Generated pieces (SDF list, JSON examples) must not shift the bytes the
+    # providers cache.
+    digest = hashlib.sha256(CANONICAL_SHADER_PROMPT.encode("utf-8")).hexdigest()
+    assert digest == "be491bb7441097c1256dc95447a0c2df908635766d3e8a2b1185a3c2150a5377"
+
+
+def test_compacted_canonical_prompts_keep_json_examples():
+    from app.prompt_templates.compaction import compact_prompt, iter_json_blocks
+    from app.prompt_templates.shader_prompt import (
+        CANONICAL_SHADER_PROMPT,
+        _SHADER_PROMPT_SOURCE,
+    )
+    from app.prompt_templates.synesthetic_asset_prompt import (
+        CANONICAL_SYNESTHETIC_ASSET_PROMPT,
+        _ASSET_PROMPT_SOURCE,
+    )
+
+    for source, compacted in (
+        (_SHADER_PROMPT_SOURCE, CANONICAL_SHADER_PROMPT),
+        (_ASSET_PROMPT_SOURCE, CANONICAL_SYNESTHETIC_ASSET_PROMPT),
+    ):
+        assert len(compacted) < len(source)
+        assert [v for _, _, v in iter_json_blocks(compacted)] == [
+            v for _, _, v in iter_json_blocks(source)
+        ]
+        assert compact_prompt(compacted) == compacted
+
+
+def test_compact_prompt_keeps_indentation_and_non_json_braces():
+    from app.prompt_templates.compaction import compact_prompt
+
+    text = 'a  b   \n\n\n\n  if (x) {\n    y;\n  }\n{ "k":  [1, 2] }'
+    assert compact_prompt(text) == 'a b\n\n  if (x) {\n    y;\n  }\n{"k":[1,2]}'
+
+
+def test_canonical_prompt_builders_memoize_by_input():
+    from app.prompt_templates import (
+        build_shader_prompt,
+        build_synesthetic_asset_prompt,
+    )
+
+    for builder, arg in (
+        (build_shader_prompt, "glow"),
+        (build_synesthetic_asset_prompt, "rain"),
+    ):
+        builder.cache_clear()
+        assert builder(arg) is builder(arg)
+        assert builder.cache_info().hits == 1
+
+
+def test_register_prompt_cache_creates_cached_content_once(monkeypatch):
+    from datetime import timedelta
+    from types import SimpleNamespace
+
+    from google.generativeai import caching
+
+    from app.prompt_templates import (
+        build_shader_prompt_cached,
+        register_shader_prompt_cache,
+    )
+    from app.prompt_templates import messages
+    from app.prompt_templates.shader_prompt import CANONICAL_SHADER_PROMPT
+
+    monkeypatch.setattr(messages, "_cached_content_names", {})
+    now = [1000.0]
+    monkeypatch.setattr(messages.time, "monotonic", lambda: now[0])
+    calls = []
+
+    def create(model, *, system_instruction, ttl):
+        calls.append((model, system_instruction, ttl))
+        return SimpleNamespace(name=f"cachedContents/{len(calls)}")
+
+    monkeypatch.setattr(caching.CachedContent, "create", create)
+
+    assert register_shader_prompt_cache("m") == "cachedContents/1"
+    assert register_shader_prompt_cache("m") == "cachedContents/1"
+    assert register_shader_prompt_cache("other") == "cachedContents/2"
+    assert calls[0] == ("m", CANONICAL_SHADER_PROMPT, timedelta(hours=1))
+    assert build_shader_prompt_cached("glow") == "User Prompt:\nglow"
+
+    # The handle is re-created shortly before the provider-side TTL runs out.
+    now[0] += timedelta(minutes=58).total_seconds()
+    assert register_shader_prompt_cache("m") == "cachedContents/1"
+    now[0] += timedelta(minutes=1, seconds=1).total_seconds()
+    assert register_shader_prompt_cache("m") == "cachedContents/3"
+
+
+def test_canonical_prompts_are_interned():
+    import sys
+
+    from app.prompt_templates import build_synesthetic_asset_prompt
+    from app.prompt_templates.shader_prompt import CANONICAL_SHADER_PROMPT
+    from app.prompt_templates.synesthetic_asset_prompt import (
+        CANONICAL_SYNESTHETIC_ASSET_PROMPT,
+    )
+
+    copy = "".join(list(CANONICAL_SHADER_PROMPT))
+    assert sys.intern(copy) is CANONICAL_SHADER_PROMPT
+    assert build_synesthetic_asset_prompt() is CANONICAL_SYNESTHETIC_ASSET_PROMPT
+
+
+def test_count_shader_prompt_tokens_tokenizes_prefix_once(monkeypatch):
+    from app.prompt_templates import build_shader_prompt, count_shader_prompt_tokens
+    from app.prompt_templates import shader_prompt
+
+    monkeypatch.setattr(shader_prompt, "SHADER_PROMPT_TOKEN_COUNT", {})
+    seen = []
+
+    def count_words(text):
+        seen.append(text)
+        return len(text.split())
+
+    total = count_shader_prompt_tokens("make it glow", "m", count_words)
+    assert total == len(build_shader_prompt("make it glow").split())
+    assert count_shader_prompt_tokens("", "m", count_words) == total - 3
+    assert seen == [build_shader_prompt(), "make it glow"]
+
+
+def test_tone_prompt_builders_share_precomputed_prefix():
+    from app.prompt_templates import build_tone_prompt, build_tone_prompt_bytes
+
+    expected = f"{CANONICAL_TONEJS_SYSTEM_PROMPT}\n\nUser Request: bass ☂"
+    assert build_tone_prompt("bass ☂") == expected
+    assert build_tone_prompt_bytes("bass ☂") == expected.encode("utf-8")
+
+
+def test_build_tone_prompt_tokens_encodes_system_prompt_once(monkeypatch):
+    import sys
+
+    from app.prompt_templates import build_tone_prompt, build_tone_prompt_tokens
+    from app.prompt_templates import tone_prompt
+
+    monkeypatch.setattr(tone_prompt, "TONE_PROMPT_TOKENS", {})
+    calls = []
+
+    def encode(text):
+        calls.append(text)
+        return [ord(c) for c in text]
+
+    tokens = build_tone_prompt_tokens("warm pad", "chars", encode)
+    assert tokens == [ord(c) for c in build_tone_prompt("warm pad")]
+    build_tone_prompt_tokens("bass", "chars", encode)
+    assert calls.count(CANONICAL_TONEJS_SYSTEM_PROMPT) == 1
+    assert sys.intern(CANONICAL_TONEJS_SYSTEM_PROMPT) is CANONICAL_TONEJS_SYSTEM_PROMPT
+
+
+def test_canonical_prompts_load_on_first_use():
+    import subprocess
+    import sys
+
+    code = (
+        "import app.prompt_templates\n"
+        "from app.prompt_templates import shader_prompt, synesthetic_asset_prompt\n"
+        "loaders = (shader_prompt._shader_prompt_source,"
+        " synesthetic_asset_prompt._asset_prompt_source)\n"
+        "assert all(f.cache_info().currsize == 0 for f in loaders)\n"
+        "assert shader_prompt.CANONICAL_SHADER_PROMPT"
+        " is shader_prompt.canonical_shader_prompt()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)